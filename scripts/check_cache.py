@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Check the --cache listing cache against a local server and Redis.
+
+    check_cache.py [--url URL] [--redis URL] [--niche NICHE] [--other-niche NICHE]
+                   [--concurrency C] [--password PW] [--no-write]
+
+The app must be emitted with ``create_files.py emit --cache`` and running
+against the seeded dataset (bench_routes.py run --compose --seed-data N
+--start sets one up). Each check starts from a cold key and reads the
+counters src/lib/cache.ts keeps in the ``listing:stats`` hash:
+
+* coalescing: C concurrent first-page requests for GET /api/campaigns and
+  the discover page each run one database load between them, across all
+  PM2 workers, and get identical responses;
+* hits: a second burst is served entirely from Redis;
+* invalidation (skipped with --no-write): creating a campaign as brand0
+  clears the cached listings for its niche and the unfiltered listing,
+  and the new campaign is listed straight away, while a cached listing
+  for another niche survives. The campaign is left in the database.
+
+Uses only the standard library (see ``harness``).
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import sys
+import time
+import urllib.parse
+
+from bench_routes import DEFAULT_URL, PASSWORD, USERS, login
+from harness import client
+from harness.redis import Redis
+
+DEFAULT_REDIS = 'redis://127.0.0.1:6379'
+STATS = 'listing:stats'
+PAGE = 20
+
+
+def listing_key(listing, niche, variant):
+    """The key src/lib/cache.ts stores a listing page under."""
+    part = 'n=' + urllib.parse.quote(niche, safe="-_.!~*'()")[:64] if niche else 'all'
+    return f'listing:{listing}:{part}:{variant}'
+
+
+def clear(redis, listing):
+    keys = list(redis.scan(f'listing:{listing}:*'))
+    if keys:
+        redis.command('UNLINK', *keys)
+
+
+def stats(redis, listing):
+    values = redis.command('HMGET', STATS, f'{listing}:hit', f'{listing}:load', f'{listing}:wait')
+    return dict(zip(('hit', 'load', 'wait'), (int(v or 0) for v in values)))
+
+
+def settle(redis, key, timeout=3.0):
+    """Wait for the background store of ``key`` to land."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not redis.command('EXISTS', key):
+        time.sleep(0.05)
+    time.sleep(0.1)  # the load counter is bumped just after the store
+
+
+async def burst(base_url, path, count, headers=None):
+    """``count`` concurrent GETs of ``path``; returns the response bodies, or None for non-200s."""
+    bodies = []
+
+    async def one():
+        c = client.Client(base_url)
+        try:
+            r = await c.request('GET', path, headers=headers)
+            bodies.append(r.body if r.status == 200 else None)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError):
+            bodies.append(None)
+        finally:
+            await c.close()
+
+    await asyncio.gather(*(one() for _ in range(count)))
+    return bodies
+
+
+def check_coalescing(redis, base_url, listing, path, key, concurrency, headers=None):
+    results = []
+    clear(redis, listing)
+    before = stats(redis, listing)
+    bodies = asyncio.run(burst(base_url, path, concurrency, headers))
+    settle(redis, key)
+    after = stats(redis, listing)
+    loads, waits = after['load'] - before['load'], after['wait'] - before['wait']
+    failed = sum(b is None for b in bodies)
+    results.append((not failed, f'{path}: {concurrency - failed}/{concurrency} cold requests answered'))
+    results.append((loads == 1, f'{path}: {loads} database loads for {concurrency} concurrent misses '
+                                f'({waits} waited on another worker)'))
+    if listing == 'campaigns':
+        results.append((len(set(bodies)) == 1, f'{path}: {len(set(bodies))} distinct responses'))
+
+    before = stats(redis, listing)
+    bodies = asyncio.run(burst(base_url, path, concurrency, headers))
+    after = stats(redis, listing)
+    hits, loads = after['hit'] - before['hit'], after['load'] - before['load']
+    results.append((hits >= concurrency and loads == 0 and None not in bodies,
+                    f'{path}: warm burst {hits}/{concurrency} hits, {loads} loads'))
+    return results
+
+
+async def create_campaign(base_url, cookie, niche):
+    title = f'cache-check {datetime.datetime.now().isoformat(timespec="seconds")}'
+    body = json.dumps({
+        'title': title,
+        'description': 'Created by check_cache.py',
+        'budget': 100000,
+        'deadline': (datetime.date.today() + datetime.timedelta(days=30)).isoformat(),
+        'niche': [niche],
+        'platforms': ['instagram'],
+        'requirements': 'none',
+    }).encode()
+    c = client.Client(base_url)
+    try:
+        r = await c.request('POST', '/api/campaigns', body, {'Content-Type': 'application/json', 'Cookie': cookie})
+    finally:
+        await c.close()
+    return r.status, title
+
+
+def check_invalidation(redis, base_url, niche, other, cookie):
+    results = []
+    paths = {n: f'/api/campaigns?limit={PAGE}' + (f'&niche={urllib.parse.quote(n)}' if n else '')
+             for n in (niche, other, None)}
+    keys = {n: listing_key('campaigns', n, f'api:{PAGE}') for n in paths}
+    for n, path in paths.items():
+        asyncio.run(burst(base_url, path, 1))
+        settle(redis, keys[n])
+
+    status, title = asyncio.run(create_campaign(base_url, cookie, niche))
+    results.append((status == 201, f'POST /api/campaigns as {USERS["brand"]}: HTTP {status}'))
+    if status != 201:
+        return results
+    for n, want in ((niche, 0), (None, 0), (other, 1)):
+        cached = redis.command('EXISTS', keys[n])
+        label = f'niche {n}' if n else 'unfiltered'
+        results.append((cached == want, f'{label} listing {"kept" if cached else "cleared"} '
+                                        f'after creating a {niche} campaign'))
+    for n in (niche, None):
+        body = asyncio.run(burst(base_url, paths[n], 1))[0] or b''
+        listed = any(item.get('title') == title for item in json.loads(body or b'{}').get('items', []))
+        results.append((listed, f'{paths[n]} lists the new campaign'))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the Redis listing cache against a local server')
+    parser.add_argument('--url', default=DEFAULT_URL)
+    parser.add_argument('--redis', default=DEFAULT_REDIS)
+    parser.add_argument('--niche', default='fashion')
+    parser.add_argument('--other-niche', default='parenting')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--password', default=PASSWORD, help='password of the seeded users')
+    parser.add_argument('--no-write', dest='write', action='store_false', help='skip the invalidation check')
+    args = parser.parse_args(argv)
+
+    redis = Redis(args.redis)
+    cookie = asyncio.run(login(args.url, USERS['brand'], args.password))
+    niche = urllib.parse.quote(args.niche)
+    results = []
+    results += check_coalescing(redis, args.url, 'campaigns', f'/api/campaigns?limit={PAGE}&niche={niche}',
+                                listing_key('campaigns', args.niche, f'api:{PAGE}'), args.concurrency)
+    results += check_coalescing(redis, args.url, 'creators', f'/brand/discover?niche={niche}',
+                                listing_key('creators', args.niche, 24), args.concurrency, {'Cookie': cookie})
+    if args.write:
+        results += check_invalidation(redis, args.url, args.niche, args.other_niche, cookie)
+    redis.close()
+
+    for ok, message in results:
+        print(f'{"ok  " if ok else "FAIL"}  {message}')
+    return 0 if all(ok for ok, _ in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Shared plumbing for the local load tools (replay_webhook.py, bench_routes.py, check_cache.py)."""
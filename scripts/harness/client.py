@@ -0,0 +1,124 @@
+"""Minimal asyncio HTTP/1.1 client with keep-alive, plus latency statistics."""
+import asyncio
+import sys
+import time
+import urllib.parse
+
+
+class Response:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def cookies(self):
+        """``{name: value}`` from every Set-Cookie header."""
+        out = {}
+        for header in self.headers.get('set-cookie', []):
+            name, _, value = header.split(';', 1)[0].partition('=')
+            out[name.strip()] = value.strip()
+        return out
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('connection closed')
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        key, _, value = line.decode('latin-1').partition(':')
+        headers.setdefault(key.strip().lower(), []).append(value.strip())
+    chunks = []
+    if headers.get('transfer-encoding', [''])[0].lower() == 'chunked':
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            chunks.append((await reader.readexactly(size + 2))[:-2])
+            if size == 0:
+                break
+    elif 'content-length' in headers:
+        chunks.append(await reader.readexactly(int(headers['content-length'][0])))
+    return Response(status, headers, b''.join(chunks))
+
+
+class Client:
+    """One keep-alive connection to ``base_url``, reopened when the server closes it."""
+
+    def __init__(self, base_url):
+        parts = urllib.parse.urlsplit(base_url)
+        if parts.scheme != 'http':
+            sys.exit('only http:// targets are supported')
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.prefix = parts.path.rstrip('/')
+        self.conn = None
+
+    async def request(self, method, path, body=b'', headers=None):
+        if self.conn is None:
+            self.conn = await asyncio.open_connection(self.host, self.port)
+        reader, writer = self.conn
+        lines = [f'{method} {self.prefix}{path} HTTP/1.1', f'Host: {self.host}:{self.port}']
+        if body or method == 'POST':
+            lines.append(f'Content-Length: {len(body)}')
+        lines.extend(f'{k}: {v}' for k, v in (headers or {}).items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode() + body)
+        try:
+            await writer.drain()
+            response = await read_response(reader)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError):
+            await self.close()
+            raise
+        if response.headers.get('connection', [''])[0].lower() == 'close':
+            await self.close()
+        return response
+
+    async def close(self):
+        if self.conn is not None:
+            self.conn[1].close()
+            self.conn = None
+
+
+async def drive(base_url, requests, concurrency, on_response=None):
+    """Send ``(method, path, body, headers)`` requests over ``concurrency`` connections.
+
+    Returns ``(elapsed, samples)`` where each sample is ``(seconds, status, bytes)``
+    in completion order; a status of 0 is a connection error.
+    ``on_response(request, sample)`` is called after each one.
+    """
+    queue = asyncio.Queue()
+    for item in requests:
+        queue.put_nowait(item)
+    samples = []
+
+    async def worker():
+        client = Client(base_url)
+        try:
+            while not queue.empty():
+                item = queue.get_nowait()
+                method, path, body, headers = item
+                start = time.perf_counter()
+                try:
+                    response = await client.request(method, path, body, headers)
+                    status, size = response.status, len(response.body)
+                except (ConnectionError, OSError, asyncio.IncompleteReadError):
+                    status, size = 0, 0
+                sample = (time.perf_counter() - start, status, size)
+                samples.append(sample)
+                if on_response is not None:
+                    on_response(item, sample)
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, samples
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, -(-len(sorted_values) * p // 100) - 1))
+    return sorted_values[int(k)]
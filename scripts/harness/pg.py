@@ -0,0 +1,31 @@
+"""Postgres access through the ``psql`` client, so the tools need no driver."""
+import os
+import subprocess
+import sys
+import urllib.parse
+
+# Query parameters Prisma understands but libpq rejects.
+PRISMA_PARAMS = ('schema', 'pgbouncer', 'connection_limit', 'pool_timeout', 'statement_cache_size')
+
+
+def database_url(url=None):
+    """``url`` (default $DATABASE_URL) without the Prisma-only query parameters."""
+    url = url or os.environ.get('DATABASE_URL')
+    if not url:
+        sys.exit('DATABASE_URL is not set')
+    parts = urllib.parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query) if k not in PRISMA_PARAMS]
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+def psql(url, sql):
+    """Run ``sql`` and return the result rows as lists of strings."""
+    out = subprocess.run(['psql', url, '-X', '-q', '-At', '-F', '\t', '-v', 'ON_ERROR_STOP=1'],
+                         input=sql, capture_output=True, text=True)
+    if out.returncode:
+        sys.exit(f'psql failed: {out.stderr.strip()}')
+    return [line.split('\t') for line in out.stdout.splitlines() if line]
+
+
+def quote(value):
+    return "'" + value.replace("'", "''") + "'"
@@ -0,0 +1,56 @@
+"""Blocking Redis client speaking RESP2 over a socket, so the tools need no driver."""
+import socket
+import urllib.parse
+
+
+class RedisError(Exception):
+    pass
+
+
+class Redis:
+    def __init__(self, url='redis://127.0.0.1:6379'):
+        parts = urllib.parse.urlsplit(url)
+        self.sock = socket.create_connection((parts.hostname or '127.0.0.1', parts.port or 6379), timeout=10)
+        self.file = self.sock.makefile('rb')
+        if parts.password:
+            self.command('AUTH', *([parts.username] if parts.username else []), parts.password)
+        if parts.path.strip('/'):
+            self.command('SELECT', parts.path.strip('/'))
+
+    def command(self, *args):
+        out = [f'*{len(args)}\r\n'.encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            out.append(b'$%d\r\n%s\r\n' % (len(data), data))
+        self.sock.sendall(b''.join(out))
+        return self._reply()
+
+    def _reply(self):
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError('redis closed the connection')
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest.decode()
+        if kind == b'-':
+            raise RedisError(rest.decode())
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            size = int(rest)
+            return None if size < 0 else self.file.read(size + 2)[:-2].decode()
+        if kind == b'*':
+            size = int(rest)
+            return None if size < 0 else [self._reply() for _ in range(size)]
+        raise RedisError(f'unexpected reply {line!r}')
+
+    def scan(self, match):
+        cursor = '0'
+        while True:
+            cursor, keys = self.command('SCAN', cursor, 'MATCH', match, 'COUNT', 1000)
+            yield from keys
+            if cursor == '0':
+                return
+
+    def close(self):
+        self.sock.close()
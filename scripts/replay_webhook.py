@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Replay Paystack charge.success webhooks against a local server.
+
+    replay_webhook.py [--url URL] [--count N] [--concurrency C]
+                      [--duplicates FRAC] [--bad-signatures FRAC] [--in-order]
+                      [--references FILE] [--no-verify] [--seed N]
+
+Events are built for PENDING ``Payment.reference`` values read from
+$DATABASE_URL (or a file, one reference per line) and signed with
+HMAC-SHA512 over the raw body with $PAYSTACK_SECRET_KEY, as the route
+verifies them. A fraction is delivered twice and, unless --in-order, the
+whole plan is shuffled so retries can overtake or race the original.
+Afterwards every replayed payment must be SUCCESS with the event's id as
+paystackRef and its proposal COMPLETED.
+
+Uses only the standard library; the database is reached through ``psql``
+(see ``harness``).
+"""
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import random
+import sys
+import time
+import urllib.parse
+
+from harness import client
+from harness.pg import database_url, psql, quote
+
+DEFAULT_URL = 'http://127.0.0.1:3001/api/webhooks/paystack'
+
+
+def pending_payments(url, count):
+    rows = psql(url, f'SELECT reference, amount FROM "Payment" WHERE status = \'PENDING\' '
+                     f'ORDER BY reference LIMIT {int(count)};')
+    return [(ref, float(amount)) for ref, amount in rows]
+
+
+def event(reference, amount, seq):
+    return {
+        'event': 'charge.success',
+        'data': {
+            'id': 4_000_000_000 + seq,
+            'reference': reference,
+            'status': 'success',
+            'amount': round(amount * 100),
+            'currency': 'NGN',
+            'paid_at': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()),
+        },
+    }
+
+
+def sign(body, secret):
+    return hmac.new(secret.encode(), body, hashlib.sha512).hexdigest()
+
+
+def plan(payments, secret, duplicates, bad_signatures, in_order, rng):
+    """``(body, signature, expected_status)`` deliveries plus the expected paystackRef per reference."""
+    deliveries, expected = [], {}
+    for seq, (reference, amount) in enumerate(payments):
+        body = json.dumps(event(reference, amount, seq), separators=(',', ':')).encode()
+        expected[reference] = str(4_000_000_000 + seq)
+        copies = 2 if rng.random() < duplicates else 1
+        deliveries.extend([(body, sign(body, secret), 200)] * copies)
+        if rng.random() < bad_signatures:
+            deliveries.append((body, sign(body, secret + 'x'), 401))
+    if not in_order:
+        rng.shuffle(deliveries)
+    return deliveries, expected
+
+
+async def fire(base_url, deliveries, concurrency):
+    """Deliver the plan; returns ``(elapsed, samples, mismatches)``."""
+    parts = urllib.parse.urlsplit(base_url)
+    path = parts.path or '/'
+    base = urllib.parse.urlunsplit(parts._replace(path='', query=''))
+    expected = {(body, signature): want for body, signature, want in deliveries}
+    mismatches = []
+
+    def check(request, sample):
+        want = expected[(request[2], request[3]['x-paystack-signature'])]
+        if sample[1] != want:
+            mismatches.append((want, sample[1]))
+
+    requests = [('POST', path, body, {'Content-Type': 'application/json', 'x-paystack-signature': signature})
+                for body, signature, _ in deliveries]
+    elapsed, samples = await client.drive(base, requests, concurrency, check)
+    return elapsed, samples, mismatches
+
+
+def verify(url, expected):
+    refs = ','.join(quote(r) for r in expected)
+    rows = psql(url, f'SELECT pay.reference, pay.status, pay."paystackRef", pr.status '
+                     f'FROM "Payment" pay JOIN "Proposal" pr ON pr.id = pay."proposalId" '
+                     f'WHERE pay.reference IN ({refs});')
+    found = {ref: (pay, paystack_ref, proposal) for ref, pay, paystack_ref, proposal in rows}
+    problems = []
+    for ref, paystack_ref in expected.items():
+        if ref not in found:
+            problems.append(f'{ref}: payment missing')
+            continue
+        pay, got_ref, proposal = found[ref]
+        if pay != 'SUCCESS':
+            problems.append(f'{ref}: payment {pay}')
+        if got_ref != paystack_ref:
+            problems.append(f'{ref}: paystackRef {got_ref or "NULL"}, expected {paystack_ref}')
+        if proposal != 'COMPLETED':
+            problems.append(f'{ref}: proposal {proposal}')
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay signed Paystack webhooks against a local server')
+    parser.add_argument('--url', default=DEFAULT_URL)
+    parser.add_argument('--secret', default=os.environ.get('PAYSTACK_SECRET_KEY'),
+                        help='signing secret (default: $PAYSTACK_SECRET_KEY)')
+    parser.add_argument('--database-url', help='default: $DATABASE_URL')
+    parser.add_argument('--references', metavar='FILE', help='replay these references instead of PENDING payments')
+    parser.add_argument('--count', type=int, default=1000, help='payments to settle')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duplicates', type=float, default=0.2, help='fraction of events delivered twice')
+    parser.add_argument('--bad-signatures', type=float, default=0.0, help='fraction of events also sent with a wrong signature')
+    parser.add_argument('--in-order', action='store_true', help='deliver in reference order instead of shuffled')
+    parser.add_argument('--no-verify', dest='verify', action='store_false', help='skip the final database check')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if not args.secret:
+        parser.error('no signing secret: pass --secret or set PAYSTACK_SECRET_KEY')
+    url = database_url(args.database_url) if args.verify or not args.references else None
+    if args.references:
+        with open(args.references) as f:
+            payments = [(line.strip(), 0.0) for line in f if line.strip()][:args.count]
+    else:
+        payments = pending_payments(url, args.count)
+    if not payments:
+        sys.exit('no payments to replay')
+
+    rng = random.Random(args.seed)
+    deliveries, expected = plan(payments, args.secret, args.duplicates, args.bad_signatures, args.in_order, rng)
+    elapsed, samples, mismatches = asyncio.run(fire(args.url, deliveries, args.concurrency))
+
+    statuses = {}
+    for _, status, _ in samples:
+        statuses[status] = statuses.get(status, 0) + 1
+    ms = sorted(round(seconds * 1000, 1) for seconds, _, _ in samples)
+    print(f"sent {len(deliveries)} deliveries for {len(expected)} payments in {elapsed:.2f}s "
+          f"({len(deliveries) / elapsed:.1f} req/s, concurrency {args.concurrency})")
+    print('status  ' + '  '.join(f'{status or "error"}: {n}' for status, n in sorted(statuses.items())))
+    print('latency ms  ' + '  '.join(f'p{p} {client.percentile(ms, p)}' for p in (50, 90, 99)) + f'  max {ms[-1]}')
+
+    failed = bool(mismatches)
+    if mismatches:
+        print(f'{len(mismatches)} unexpected responses, e.g. expected {mismatches[0][0]} got {mismatches[0][1]}')
+    if args.verify:
+        problems = verify(url, expected)
+        print(f'verify: {len(expected) - len({p.split(":")[0] for p in problems})}/{len(expected)} payments settled')
+        for problem in problems[:20]:
+            print(f'  {problem}')
+        failed = failed or bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
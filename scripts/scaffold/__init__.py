@@ -0,0 +1,22 @@
+"""Novaclio scaffold: template registry and emission engine."""
+from .archive import write_tar
+from .drift import DriftReport, diff
+from .emit import Emitter, Report
+from .registry import TEMPLATES, Template, get, names, render, select
+
+
+def emit(names=None, target_dir='.', incremental=False, fsync=False, jobs=None, options=None):
+    """Render the named templates (all by default) into ``target_dir``."""
+    emitter = Emitter(target_dir, incremental=incremental, fsync=fsync, jobs=jobs)
+    for template in select(names, options):
+        emitter.add(template.path, render(template.name, options))
+    return emitter.flush()
+
+
+def archive(names=None, fileobj=None, mtime=None, compress=False, options=None):
+    """Stream the named templates (all by default) into ``fileobj`` as a tar archive."""
+    files = ((t.path, render(t.name, options), t.kind in ('shell', 'script')) for t in select(names, options))
+    write_tar(files, fileobj, mtime=mtime, compress=compress)
+
+
+__all__ = ['DriftReport', 'Emitter', 'Report', 'TEMPLATES', 'Template', 'archive', 'diff', 'emit', 'get', 'names', 'render', 'select', 'write_tar']
@@ -0,0 +1,279 @@
+"""Index advisor for the scaffold's Prisma queries.
+
+Every ``db.<model>`` call in the templates is reduced to the lookups it
+makes: the ``where``/``orderBy`` shape on the model itself, the join a
+relation filter implies, and the foreign-key lookup behind each
+``include``/``select``/``_count`` of a relation. Each lookup is checked
+against the model's ``@id``/``@unique``/``@@index`` columns and, when no
+index serves it, an ``@@index`` that would is suggested. Foreign keys are
+checked on their own as well, since Postgres does not index them.
+"""
+import re
+from dataclasses import dataclass, field
+
+from . import prisma, queries
+from .queries import Arr, Obj, alternatives
+
+ARRAY_OPS = {'has', 'hasSome', 'hasEvery'}
+RANGE_OPS = {'gt', 'gte', 'lt', 'lte', 'not'}
+TEXT_OPS = {'contains', 'startsWith', 'endsWith', 'search'}
+RELATION_OPS = {'some', 'every', 'none', 'is', 'isNot'}
+READ_OPS = {'findMany', 'findFirst', 'findUnique', 'findFirstOrThrow', 'findUniqueOrThrow',
+            'count', 'aggregate', 'groupBy', 'update', 'updateMany', 'upsert', 'delete', 'deleteMany'}
+
+
+@dataclass
+class Lookup:
+    model: str
+    source: str
+    via: str
+    eq: tuple = ()
+    inset: tuple = ()
+    array: tuple = ()
+    range: tuple = ()
+    order: tuple = ()
+    status: str = ''
+    suggestions: list = field(default_factory=list)
+
+    def describe(self):
+        parts = [f'{self.model} {self.via}']
+        if self.eq or self.inset or self.array or self.range:
+            parts.append('where(' + ', '.join(self.eq + self.inset + self.array + self.range) + ')')
+        if self.order:
+            parts.append('orderBy(' + ', '.join(self.order) + ')')
+        return ' '.join(parts)
+
+
+def _add(cols, name):
+    return cols if name in cols else cols + (name,)
+
+
+def _filter(schema, model, node, lookup, source, out):
+    """Fold a ``where`` node into ``lookup``; relation filters add lookups to ``out``."""
+    for alt in alternatives(node):
+        for key, value in alt.fields().items():
+            if key in ('AND', 'OR', 'NOT'):
+                items = value.items if isinstance(value, Arr) else [value]
+                for item in items:
+                    _filter(schema, model, item, lookup, source, out)
+                continue
+            f = schema.models[model].fields.get(key)
+            if f is None:
+                continue
+            if f.type in schema.models:
+                related, cols, _ = schema.foreign_key(model, key)
+                inner = Lookup(related, source, f'via {model}.{key}')
+                for wrapped in alternatives(value):
+                    relation_ops = set(wrapped.fields()) & RELATION_OPS
+                    for op in relation_ops:
+                        _filter(schema, related, wrapped.get(op), inner, source, out)
+                    if not relation_ops:
+                        _filter(schema, related, wrapped, inner, source, out)
+                if f.relation_fields:
+                    # Driven from the related row: probe this model on its foreign key.
+                    lookup.eq = lookup.eq + tuple(c for c in f.relation_fields if c not in lookup.eq)
+                else:
+                    inner.eq = inner.eq + tuple(c for c in cols if c not in inner.eq)
+                out.append(inner)
+                continue
+            ops = set(value.fields()) if isinstance(value, Obj) else set()
+            if ops & ARRAY_OPS:
+                lookup.array = _add(lookup.array, key)
+            elif 'in' in ops or 'notIn' in ops:
+                lookup.inset = _add(lookup.inset, key)
+            elif ops & (RANGE_OPS | TEXT_OPS):
+                lookup.range = _add(lookup.range, key)
+            else:
+                lookup.eq = _add(lookup.eq, key)
+
+
+def _order(schema, model, node):
+    items = node.items if isinstance(node, Arr) else [node]
+    cols = ()
+    for item in items:
+        for alt in alternatives(item):
+            for key in alt.fields():
+                if key in schema.models[model].fields and not schema.is_relation(model, key):
+                    cols = _add(cols, key)
+    return cols
+
+
+def _relations(schema, model, node, source, out):
+    """Lookups made to load the relations named in an include/select object."""
+    for alt in alternatives(node):
+        for key, value in alt.fields().items():
+            if key == '_count':
+                sel = value.get('select') if isinstance(value, Obj) else None
+                for counted in (alternatives(sel) if sel is not None else []):
+                    for rel, rel_value in counted.fields().items():
+                        if schema.is_relation(model, rel):
+                            _relation(schema, model, rel, rel_value, source, out, 'count')
+                continue
+            if schema.is_relation(model, key):
+                _relation(schema, model, key, value, source, out, 'include')
+
+
+def _relation(schema, model, key, value, source, out, verb):
+    related, cols, _ = schema.foreign_key(model, key)
+    lookup = Lookup(related, source, f'{verb} {model}.{key}', eq=cols)
+    if isinstance(value, Obj):
+        where = value.get('where')
+        if where is not None:
+            _filter(schema, related, where, lookup, source, out)
+        order = value.get('orderBy')
+        if order is not None:
+            lookup.order = _order(schema, related, order)
+        for nested in ('include', 'select'):
+            if value.get(nested) is not None:
+                _relations(schema, related, value.get(nested), source, out)
+    out.append(lookup)
+
+
+def lookups(schema, call):
+    model = call.prisma_model
+    if model not in schema.models:
+        return []
+    source = f'{call.template}:{call.line}'
+    out = []
+    if call.op in READ_OPS:
+        main = Lookup(model, source, call.op)
+        if call.where is not None:
+            _filter(schema, model, call.where, main, source, out)
+        if call.order_by is not None:
+            main.order = _order(schema, model, call.order_by)
+        out.insert(0, main)
+    for key in ('include', 'select'):
+        if call.args.get(key) is not None:
+            _relations(schema, model, call.args.get(key), source, out)
+    return out
+
+
+def _btree(model):
+    return [i for i in model.indexes if i.type is None]
+
+
+def _prefix(index_cols, eq):
+    k = 0
+    while k < len(index_cols) and index_cols[k] in eq:
+        k += 1
+    return k
+
+
+def classify(schema, lookup):
+    model = schema.models[lookup.model]
+    eq, order = set(lookup.eq), lookup.order
+    best, order_ok = 0, False
+    for index in _btree(model):
+        k = _prefix(index.columns, eq)
+        ok = k == len(eq) and bool(order) and tuple(index.columns[k:k + len(order)]) == order
+        if (k, ok) > (best, order_ok):
+            best, order_ok = k, ok
+    gin = {i.columns[0] for i in model.indexes if i.type == 'Gin'}
+    missing_gin = [c for c in lookup.array if c not in gin]
+
+    if (eq or lookup.inset) and _unique(model, eq | set(lookup.inset)):
+        status = 'index'
+    elif eq and best == 0:
+        status = 'seq scan'
+    elif eq and best < len(eq):
+        status = 'partial'
+    elif order and not order_ok and not (eq and _unique(model, eq)):
+        status = 'sort' if eq else ('seq scan' if not lookup.array or missing_gin else 'sort')
+    elif not eq and not order:
+        status = 'seq scan' if missing_gin else ('filter' if lookup.array or lookup.inset or lookup.range else 'unfiltered')
+    else:
+        status = 'index'
+    if missing_gin and status == 'index':
+        status = 'partial'
+
+    suggestions = []
+    if status in ('seq scan', 'partial', 'sort'):
+        cols = lookup.eq + order if order else lookup.eq + lookup.inset
+        if cols:
+            suggestions.append(prisma.Index(cols))
+    suggestions.extend(prisma.Index((c,), type='Gin') for c in missing_gin)
+    lookup.status = status
+    lookup.suggestions = suggestions
+    return lookup
+
+
+def _unique(model, eq):
+    return any(i.kind in ('id', 'unique') and set(i.columns) <= eq for i in model.indexes)
+
+
+def foreign_keys(schema):
+    """Relation scalar columns with no index leading on them."""
+    out = []
+    for model in schema.models.values():
+        for f in model.fields.values():
+            cols = tuple(f.relation_fields)
+            if not cols:
+                continue
+            if any(tuple(i.columns[:len(cols)]) == cols for i in _btree(model)):
+                continue
+            lookup = Lookup(model.name, 'schema', f'foreign key {f.name}', eq=cols, status='seq scan')
+            lookup.suggestions = [prisma.Index(cols)]
+            out.append(lookup)
+    return out
+
+
+def _covered(model, index):
+    for existing in model.indexes:
+        if existing.type != index.type:
+            continue
+        if tuple(existing.columns[:len(index.columns)]) == index.columns:
+            return True
+    return False
+
+
+def merge(schema, suggestions):
+    """Deduplicate ``(model, Index)`` suggestions, dropping any a longer one or an existing index covers."""
+    by_model = {}
+    for model, index in suggestions:
+        if not _covered(schema.models[model], index):
+            by_model.setdefault(model, [])
+            if index not in by_model[model]:
+                by_model[model].append(index)
+    merged = {}
+    for model, indexes in by_model.items():
+        keep = []
+        for index in indexes:
+            longer = any(other is not index and other.type == index.type
+                         and len(other.columns) > len(index.columns)
+                         and other.columns[:len(index.columns)] == index.columns for other in indexes)
+            if not longer:
+                keep.append(index)
+        merged[model] = keep
+    return {m: merged[m] for m in schema.models if merged.get(m)}
+
+
+@dataclass
+class Advice:
+    lookups: list
+    indexes: dict
+
+    @property
+    def clean(self):
+        return not self.indexes
+
+
+def advise(schema=None, calls=None, options=None):
+    schema = schema or prisma.load(options)
+    found = []
+    for call in calls if calls is not None else queries.calls(options=options):
+        found.extend(classify(schema, lookup) for lookup in lookups(schema, call))
+    found.extend(foreign_keys(schema))
+    suggestions = [(lookup.model, index) for lookup in found for index in lookup.suggestions]
+    return Advice(found, merge(schema, suggestions))
+
+
+def apply(text, indexes):
+    """Insert ``indexes`` ({model: [Index]}) at the end of each model block in ``text``."""
+    for model, items in indexes.items():
+        m = re.search(r'^model\s+' + re.escape(model) + r'\s*\{.*?^\}', text, re.M | re.S)
+        if not m:
+            continue
+        block = m.group(0)
+        lines = ''.join(f'  {index.declaration()}\n' for index in items)
+        text = text[:m.start()] + block[:-1] + lines + '}' + text[m.end():]
+    return text
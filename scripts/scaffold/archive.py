@@ -0,0 +1,53 @@
+"""Deterministic tar output for the scaffold.
+
+Entries are sorted, owned by 0:0 and stamped with a fixed mtime
+(``SOURCE_DATE_EPOCH`` when set, else 0), so the same templates always
+produce the same bytes and Docker build-context hashes stay stable.
+"""
+import gzip
+import io
+import os
+import tarfile
+
+DIR_MODE = 0o755
+FILE_MODE = 0o644
+EXEC_MODE = 0o755
+
+
+def default_mtime():
+    return int(os.environ.get('SOURCE_DATE_EPOCH', 0))
+
+
+def _info(name, mtime, mode, type=tarfile.REGTYPE, size=0):
+    info = tarfile.TarInfo(name)
+    info.type = type
+    info.mode = mode
+    info.size = size
+    info.mtime = mtime
+    info.uid = info.gid = 0
+    info.uname = info.gname = ''
+    return info
+
+
+def write_tar(files, fileobj, mtime=None, compress=False):
+    """Write ``files`` (an iterable of ``(path, data, executable)``) as a tar stream."""
+    mtime = default_mtime() if mtime is None else mtime
+    out = gzip.GzipFile(fileobj=fileobj, mode='wb', mtime=mtime, filename='') if compress else fileobj
+    entries = sorted(files, key=lambda f: f[0])
+    directories = set()
+    for path, _, _ in entries:
+        parent = os.path.dirname(path)
+        while parent and parent not in directories:
+            directories.add(parent)
+            parent = os.path.dirname(parent)
+    try:
+        with tarfile.open(fileobj=out, mode='w|', format=tarfile.PAX_FORMAT, encoding='utf-8') as tar:
+            for directory in sorted(directories):
+                tar.addfile(_info(directory, mtime, DIR_MODE, tarfile.DIRTYPE))
+            for path, data, executable in entries:
+                data = data.encode('utf-8') if isinstance(data, str) else data
+                info = _info(path, mtime, EXEC_MODE if executable else FILE_MODE, size=len(data))
+                tar.addfile(info, io.BytesIO(data))
+    finally:
+        if compress:
+            out.close()
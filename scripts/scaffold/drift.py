@@ -0,0 +1,81 @@
+"""Compare rendered templates against an existing tree.
+
+Each template is classified as identical, drifted or missing; files under
+the directories the scaffold writes to that no template produces are
+reported as untracked. A size mismatch settles a file without reading it,
+and a manifest entry whose size and mtime still match stands in for
+hashing it, so a full-tree check stays cheap.
+"""
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .emit import default_jobs, file_digest, load_manifest
+from .registry import TEMPLATES, render, select
+
+SKIP_DIRS = {'node_modules', '.next', '.git', '__pycache__'}
+
+
+@dataclass
+class DriftReport:
+    identical: list = field(default_factory=list)
+    drifted: list = field(default_factory=list)
+    missing: list = field(default_factory=list)
+    untracked: list = field(default_factory=list)
+
+    @property
+    def clean(self):
+        return not self.drifted and not self.missing
+
+
+def _classify(target_dir, manifest, template, options):
+    data = render(template.name, options).encode('utf-8')
+    full = os.path.join(target_dir, template.path)
+    try:
+        st = os.stat(full)
+    except FileNotFoundError:
+        return 'missing', template.path
+    if st.st_size != len(data):
+        return 'drifted', template.path
+    digest = file_digest(full, manifest.get(template.path))
+    return ('identical' if digest == hashlib.sha256(data).hexdigest() else 'drifted'), template.path
+
+
+def _walk(root):
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in SKIP_DIRS:
+                yield from _walk(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def untracked(target_dir, templates=TEMPLATES):
+    """Files under the scaffold's top-level directories that no template emits."""
+    known = {t.path for t in templates}
+    roots = sorted({t.path.split('/', 1)[0] for t in templates if '/' in t.path})
+    found = []
+    for root in roots:
+        for path in _walk(os.path.join(target_dir, root)):
+            rel = os.path.relpath(path, target_dir).replace(os.sep, '/')
+            if rel not in known:
+                found.append(rel)
+    return sorted(found)
+
+
+def diff(target_dir, names=None, jobs=None, include_untracked=True, options=None):
+    templates = select(names, options)
+    manifest = load_manifest(target_dir)
+    report = DriftReport()
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+        walk = pool.submit(untracked, target_dir) if include_untracked else None
+        for status, path in pool.map(lambda t: _classify(target_dir, manifest, t, options), templates):
+            getattr(report, status).append(path)
+        if walk is not None:
+            report.untracked = walk.result()
+    return report
@@ -0,0 +1,140 @@
+"""Atomic, incremental file emission.
+
+Files are written to a temp file beside their target and renamed over it,
+so a running server only ever sees the old file or the complete new one.
+A manifest of content hashes in the target directory lets incremental runs
+leave byte-identical files (and their mtimes) alone.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+MANIFEST = '.scaffold-manifest.json'
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@dataclass
+class Report:
+    results: list = field(default_factory=list)
+
+    @property
+    def counts(self):
+        counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+        for _, status in self.results:
+            counts[status] += 1
+        return counts
+
+
+def default_jobs():
+    return min(8, (os.cpu_count() or 1) * 2)
+
+
+def load_manifest(target_dir):
+    try:
+        with open(os.path.join(target_dir, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(target_dir, manifest, fsync=False):
+    data = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+    write_atomic(os.path.join(target_dir, MANIFEST), data, fsync)
+
+
+def write_atomic(path, data, fsync=False):
+    directory = os.path.dirname(path) or '.'
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def fsync_dir(directory):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def file_digest(path, entry=None):
+    """sha256 of the file at ``path``, or None if it does not exist.
+
+    While size and mtime still match the manifest entry we trust the
+    recorded hash; anything else (hand edits, restores) is re-hashed.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if entry and entry.get('size') == st.st_size and entry.get('mtime_ns') == st.st_mtime_ns:
+        return entry['sha256']
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class Emitter:
+    def __init__(self, target_dir, incremental=False, fsync=False, jobs=None):
+        self.target_dir = target_dir
+        self.incremental = incremental
+        self.fsync = fsync
+        self.jobs = jobs or default_jobs()
+        self.pending = []
+
+    def add(self, path, content):
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        self.pending.append((path, data))
+
+    def _emit_one(self, manifest, path, data):
+        full = os.path.join(self.target_dir, path)
+        digest = hashlib.sha256(data).hexdigest()
+        existing = file_digest(full, manifest.get(path)) if self.incremental else None
+        if existing == digest:
+            status = 'unchanged'
+        else:
+            status = 'updated' if os.path.exists(full) else 'created'
+            write_atomic(full, data, self.fsync)
+        st = os.stat(full)
+        return path, status, {'sha256': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+    def flush(self):
+        manifest = load_manifest(self.target_dir)
+        directories = {os.path.dirname(os.path.join(self.target_dir, path)) for path, _ in self.pending}
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max(1, self.jobs)) as pool:
+            results = list(pool.map(lambda item: self._emit_one(manifest, *item), self.pending))
+        report = Report()
+        touched = set()
+        for path, status, entry in results:
+            manifest[path] = entry
+            report.results.append((path, status))
+            if status != 'unchanged':
+                touched.add(os.path.dirname(os.path.join(self.target_dir, path)))
+        if self.fsync:
+            for directory in sorted(touched):
+                fsync_dir(directory)
+        save_manifest(self.target_dir, manifest, self.fsync)
+        self.pending.clear()
+        return report
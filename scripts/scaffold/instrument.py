@@ -0,0 +1,121 @@
+"""Server-Timing instrumentation for route handler templates (``--timing``).
+
+Rewrites a rendered ``route.ts`` so that
+
+* each exported ``GET``/``POST``/... handler is wrapped in ``timed(route,
+  handler)``, which samples the request, times it end to end and reports
+  the phases as a ``Server-Timing`` header and one JSON log line;
+* each call the handler spends time in is wrapped in ``phase(name, () =>
+  call)``: the session lookup, Prisma queries and searches, listing cache
+  reads and invalidations, AI calls, queueing, request body parsing and
+  ``NextResponse.json`` serialisation.
+
+The rewrite is textual, like the rest of the template tooling: a call is
+recognised by how it starts (see ``PHASES``) and extends over its
+member/call chain, so ``db.x.findMany({...})``, ``db.$executeRaw`...```
+and ``enqueueScoring(id).catch(...)`` are each wrapped whole.
+"""
+import re
+
+from .queries import _Reader
+
+IMPORT = 'import { phase, timed } from "@/lib/timing";\n'
+
+# Phase name for calls starting with each pattern, first match wins.
+PHASES = [
+    (re.compile(r'getServerSession\s*\('), 'session'),
+    (re.compile(r'session(?:Creator|Brand)Id\s*\('), 'session'),
+    (re.compile(r'db\.[\w$]+'), 'db'),
+    (re.compile(r'(?:creator|brand)Stats\s*\('), 'db'),
+    (re.compile(r'search(?:Campaigns|Creators)\s*\('), 'db'),
+    (re.compile(r'(?:cachedListing|invalidate(?:Campaigns|Creators))\s*\('), 'cache'),
+    (re.compile(r'checkProposalWithAI\s*\('), 'ai'),
+    (re.compile(r'enqueueScoring\s*\('), 'queue'),
+    (re.compile(r'req\.(?:json|text|formData)\s*\('), 'parse'),
+    (re.compile(r'NextResponse\.json\s*\('), 'serialize'),
+]
+_START = re.compile(r'(?<![\w$.])(?=' + '|'.join(p.pattern for p, _ in PHASES) + ')')
+_HANDLER = re.compile(r'^export async function (GET|POST|PUT|PATCH|DELETE)\s*\(', re.M)
+_IMPORTS = re.compile(r'^import .*;\n', re.M)
+_WORD = re.compile(r'[\w$]+')
+
+
+def route_path(path):
+    """``src/app/api/campaigns/[id]/proposals/route.ts`` -> ``/api/campaigns/[id]/proposals``."""
+    return '/' + path.removeprefix('src/app/').rsplit('/', 1)[0]
+
+
+def _chain_end(text, pos):
+    """End of the member/call chain starting at ``pos`` (``a.b(...).c`...```)."""
+    n = len(text)
+    while pos < n:
+        m = _WORD.match(text, pos)
+        if m:
+            pos = m.end()
+            continue
+        c = text[pos]
+        if c == '.' and _WORD.match(text, pos + 1):
+            pos += 1
+        elif c == '(':
+            reader = _Reader(text, pos + 1)
+            reader.balanced(')')
+            pos = reader.pos
+        elif c == '`':
+            reader = _Reader(text, pos)
+            reader.string()
+            pos = reader.pos
+        else:
+            break
+    return pos
+
+
+def _phase(start_text):
+    for pattern, name in PHASES:
+        if pattern.match(start_text):
+            return name
+    return None
+
+
+def _wrap_calls(text, start, end):
+    """Wrap every phase call in ``text[start:end]``; returns the new slice."""
+    out, pos = [], start
+    while True:
+        m = _START.search(text, pos, end)
+        if not m:
+            break
+        name = _phase(text[m.start():m.start() + 40])
+        stop = _chain_end(text, m.start())
+        if name is None or stop > end:
+            out.append(text[pos:m.start() + 1])
+            pos = m.start() + 1
+            continue
+        out.append(text[pos:m.start()])
+        out.append(f'phase("{name}", () => {text[m.start():stop]})')
+        pos = stop
+    out.append(text[pos:end])
+    return ''.join(out)
+
+
+def instrument(text, path):
+    """Instrumented copy of the route handler template ``text`` emitted at ``path``."""
+    route = route_path(path)
+    out, pos = [], 0
+    for m in _HANDLER.finditer(text):
+        method = m.group(1)
+        reader = _Reader(text, m.end())
+        reader.balanced(')')
+        body_open = text.index('{', reader.pos)
+        reader = _Reader(text, body_open + 1)
+        reader.balanced('}')
+        body_close = reader.pos
+        out.append(text[pos:m.start()])
+        out.append(f'export const {method} = timed("{method} {route}", async function {method}(')
+        out.append(text[m.end():body_open + 1])
+        out.append(_wrap_calls(text, body_open + 1, body_close - 1))
+        out.append('});')
+        pos = body_close
+    out.append(text[pos:])
+    text = ''.join(out)
+    imports = list(_IMPORTS.finditer(text))
+    at = imports[-1].end() if imports else 0
+    return text[:at] + IMPORT + text[at:]
@@ -0,0 +1,193 @@
+"""Over-fetch and N+1 lint for the templates' Prisma calls.
+
+Rules:
+
+* ``unbounded-include`` -- a to-many relation is loaded with no ``take``.
+* ``count-only-include`` -- a to-many relation is only ever read as
+  ``.<relation>.length``; rewritten to ``_count``.
+* ``unused-include`` -- a relation is loaded but never read; removed.
+* ``unselected-relation`` -- a relation to a model with sensitive columns
+  (``User.password``) is loaded whole; rewritten to a ``select`` of the
+  columns the template reads, or of every non-sensitive column when the
+  record is handed to a component or serialised as-is.
+* ``n-plus-one`` -- a query issued inside ``.map``/``.forEach``/``for``.
+
+Usage analysis is textual: it looks at how the template outside the query
+reads ``.<relation>``, which is as far as a template can be known without
+a TS compiler. Findings with edits are errors; the rest are warnings.
+"""
+import re
+from dataclasses import dataclass, field
+
+from . import prisma, queries
+from .queries import Expr, Obj, alternatives
+from .registry import render, select
+
+SENSITIVE = re.compile(r'password|secret|token', re.I)
+_LOOP = re.compile(r'\.(?:map|forEach|flatMap)\s*\(|\bfor\s*(?:await\s*)?\(|\bwhile\s*\(')
+_STRING = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`')
+
+
+@dataclass
+class Finding:
+    template: str
+    line: int
+    rule: str
+    message: str
+    edits: list = field(default_factory=list)
+
+    @property
+    def severity(self):
+        return 'error' if self.edits or self.rule == 'n-plus-one' else 'warning'
+
+
+def _line(text, pos):
+    return text.count('\n', 0, pos) + 1
+
+
+def _outside(text, calls):
+    """``text`` with every Prisma call blanked out, offsets preserved."""
+    chars = list(text)
+    for call in calls:
+        for i in range(call.start, call.end):
+            if chars[i] != '\n':
+                chars[i] = ' '
+    return ''.join(chars)
+
+
+def _escapes(text, call):
+    """Whether the call's result is passed on whole (JSON response or JSX prop)."""
+    head = text[text.rfind('\n', 0, call.start) + 1:call.start]
+    m = re.search(r'const\s+(\w+)\s*=', head)
+    if not m:
+        return True
+    names = {m.group(1)}
+    # A loader (``const query = () => db.x.findMany(...)``) hands its result
+    # to whatever calls it.
+    names |= set(re.findall(r'const\s+(\w+)\s*=[^;]*\b' + m.group(1) + r'\(', text))
+    names |= set(re.findall(r'\.map\(\s*\(?(\w+)', text))
+    return any(re.search(r'json\([^;]*?\b' + n + r'\b|(?<!\bkey)=\{' + n + r'\}', text) for n in names)
+
+
+def _uses(body, relation):
+    return list(re.finditer(r'(\?)?\.' + relation + r'\b(\??\.length\b)?', body))
+
+
+def _is_loop_body(text, start):
+    between = _STRING.sub('""', text)
+    for m in reversed(list(_LOOP.finditer(between, 0, start))):
+        segment = between[m.end():start]
+        if segment.count('(') + 1 > segment.count(')') or (
+                m.group(0).lstrip('.').startswith(('for', 'while')) and segment.count('{') > segment.count('}')):
+            return True
+    return False
+
+
+def _select_fields(schema, model, body, relation, escaped):
+    columns = [f.name for f in schema.columns(model) if not SENSITIVE.search(f.name)]
+    if escaped:
+        return columns
+    used = {m.group(1) for m in re.finditer(r'\.' + relation + r'\??\.(\w+)', body)}
+    return [c for c in columns if c in used] or columns
+
+
+def _remove_entry(text, obj, index):
+    start, end = obj.spans[index]
+    tail = re.match(r'\s*,\s*', text[end:obj.end])
+    if tail:
+        return start, end + tail.end(), ''
+    head = re.search(r',\s*$', text[obj.start:start])
+    if head:
+        return obj.start + head.start(), end, ''
+    return start, end, ''
+
+
+def _walk(schema, text, body, call, model, node, escaped, out, parent=None):
+    for obj in alternatives(node):
+        counted = []
+        for index, ((key, value), span) in enumerate(zip(obj.entries, obj.spans)):
+            if key is None or not schema.is_relation(model, key):
+                continue
+            related, _, to_many = schema.foreign_key(model, key)
+            line = _line(text, span[0])
+            loads_whole = isinstance(value, Expr) and value.text == 'true'
+            nested = value if isinstance(value, Obj) else None
+            uses = _uses(body, key)
+
+            if not escaped and not uses:
+                only = len(obj.entries) == 1 and parent is not None
+                out.append(Finding(call.template, line, 'unused-include',
+                                   f'{model}.{key} is included but never read',
+                                   [_remove_entry(text, *parent) if only else _remove_entry(text, obj, index)]))
+                continue
+            if to_many and not escaped and all(u.group(2) for u in uses):
+                counted.append((index, key))
+                continue
+            if to_many and not (nested and nested.get('take') is not None):
+                out.append(Finding(call.template, line, 'unbounded-include',
+                                   f'{model}.{key} loads every related {related} row; add take or paginate'))
+            if loads_whole and any(SENSITIVE.search(f.name) for f in schema.columns(related)):
+                fields = _select_fields(schema, related, body, key, escaped)
+                selection = ', '.join(f'{f}: true' for f in fields)
+                out.append(Finding(call.template, line, 'unselected-relation',
+                                   f'{model}.{key} loads whole {related} rows (including sensitive columns)',
+                                   [(span[0], span[1], f'{key}: {{ select: {{ {selection} }} }}')]))
+            if nested is not None:
+                for i, (sub, sub_node) in enumerate(nested.entries):
+                    if sub in ('include', 'select'):
+                        _walk(schema, text, body, call, related, sub_node, escaped, out, (nested, i))
+
+        if counted and obj.get('_count') is None:
+            edits = []
+            names = [key for _, key in counted]
+            selection = ', '.join(f'{k}: true' for k in names)
+            first = counted[0][0]
+            edits.append((obj.spans[first][0], obj.spans[first][1], f'_count: {{ select: {{ {selection} }} }}'))
+            edits.extend(_remove_entry(text, obj, i) for i, _ in counted[1:])
+            for key in names:
+                for use in _uses(body, key):
+                    edits.append((use.start(), use.end(), f'{use.group(1) or ""}._count.{key}'))
+            out.append(Finding(call.template, _line(text, obj.spans[first][0]), 'count-only-include',
+                               f'{model}.{", ".join(names)} loaded only to read .length; use _count',
+                               edits))
+
+
+def lint_text(schema, text, template=''):
+    calls = queries.extract(text, template)
+    body = _outside(text, calls)
+    out = []
+    for call in calls:
+        model = call.prisma_model
+        if model not in schema.models:
+            continue
+        if _is_loop_body(text, call.start):
+            out.append(Finding(template, call.line, 'n-plus-one',
+                               f'db.{call.model}.{call.op} runs once per item; batch it with an in/include query'))
+        escaped = _escapes(text, call)
+        for i, (key, node) in enumerate(call.args.entries):
+            if key in ('include', 'select'):
+                _walk(schema, text, body, call, model, node, escaped, out, (call.args, i))
+    return sorted(out, key=lambda f: f.line)
+
+
+def lint(names=None, schema=None, options=None):
+    schema = schema or prisma.load(options)
+    out = []
+    for t in select(names, options):
+        if t.path.endswith(('.ts', '.tsx')):
+            out.extend(lint_text(schema, render(t.name, options), t.name))
+    return out
+
+
+def fix(text, findings):
+    """Apply the findings' edits to ``text``; overlapping edits keep the first."""
+    edits = sorted({e for f in findings for e in f.edits}, key=lambda e: e[0])
+    out, pos = [], 0
+    for start, end, replacement in edits:
+        if start < pos:
+            continue
+        out.append(text[pos:start])
+        out.append(replacement)
+        pos = end
+    out.append(text[pos:])
+    return ''.join(out)
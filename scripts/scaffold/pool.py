@@ -0,0 +1,66 @@
+"""Postgres connection budget for the pooler, the Prisma URLs and PM2.
+
+Postgres serves at most ``max_connections``. A few are kept for
+superusers and for direct sessions (``prisma migrate deploy``, psql,
+pg_dump); the rest are PgBouncer's server pool. Every PM2 process that
+opens a Prisma pool -- the web workers, one extra web worker while a
+rolling reload overlaps old and new, and the scoring worker -- gets a
+``connection_limit`` slice of PgBouncer's client budget. In transaction
+mode a client holds a server connection only for the length of a
+transaction, so the client side is oversubscribed against the server
+pool.
+"""
+from dataclasses import dataclass
+
+DEFAULT_INSTANCES = 4
+DEFAULT_MAX_CONNECTIONS = 100
+
+SUPERUSER_RESERVED = 3  # Postgres' superuser_reserved_connections default
+DIRECT_RESERVED = 7     # migrate deploy, psql and backups bypass the pooler
+WORKERS = 1             # non-web processes with a Prisma pool (scoring worker)
+OVERSUBSCRIBE = 2
+CLIENT_HEADROOM = 20    # cron scripts and the pgbouncer admin console
+MAX_CONNECTION_LIMIT = 20
+
+
+@dataclass(frozen=True)
+class PoolPlan:
+    instances: int
+    max_connections: int
+    pool_size: int
+    reserve_pool: int
+    connection_limit: int
+    max_client_conn: int
+
+    @property
+    def clients(self):
+        """Processes holding a Prisma pool at the peak of a rolling reload."""
+        return self.instances + 1 + WORKERS
+
+    @property
+    def server_connections(self):
+        return self.pool_size + self.reserve_pool
+
+    def describe(self):
+        return (f"{self.instances} web instances, max_connections {self.max_connections}: "
+                f"pgbouncer pool {self.pool_size}+{self.reserve_pool} reserve, "
+                f"max_client_conn {self.max_client_conn}, Prisma connection_limit {self.connection_limit}")
+
+
+def plan(instances=DEFAULT_INSTANCES, max_connections=DEFAULT_MAX_CONNECTIONS):
+    if instances < 1:
+        raise ValueError('instances must be at least 1')
+    server = max_connections - SUPERUSER_RESERVED - DIRECT_RESERVED
+    if server < 4:
+        raise ValueError(f'max_connections {max_connections} leaves no room for a pool '
+                         f'after {SUPERUSER_RESERVED + DIRECT_RESERVED} reserved connections')
+    reserve = max(1, server // 10)
+    pool_size = server - reserve
+    clients = instances + 1 + WORKERS
+    limit = max(2, min(MAX_CONNECTION_LIMIT, OVERSUBSCRIBE * pool_size // clients))
+    return PoolPlan(instances, max_connections, pool_size, reserve, limit, clients * limit + CLIENT_HEADROOM)
+
+
+def from_options(options):
+    return plan(options.get('instances') or DEFAULT_INSTANCES,
+                options.get('max_connections') or DEFAULT_MAX_CONNECTIONS)
@@ -0,0 +1,133 @@
+"""Minimal Prisma schema parser.
+
+Understands enough of the schema language for the scaffold's tooling:
+models with their scalar and relation fields, ``@id``/``@unique``
+attributes, ``@@id``/``@@unique``/``@@index`` blocks and enums.
+"""
+import re
+from dataclasses import dataclass, field
+
+_BLOCK = re.compile(r'^(model|enum)\s+(\w+)\s*\{(.*?)^\}', re.M | re.S)
+_FIELD = re.compile(r'^(\w+)\s+(\w+(?:\("[^"]*"\))?)(\[\])?(\?)?\s*(.*)$')
+_COLUMNS = re.compile(r'\[([^\]]*)\]')
+
+
+@dataclass
+class Field:
+    name: str
+    type: str
+    list: bool = False
+    optional: bool = False
+    attributes: str = ''
+
+    @property
+    def relation_fields(self):
+        m = re.search(r'@relation\([^)]*fields:\s*\[([^\]]*)\]', self.attributes)
+        return _split(m.group(1)) if m else []
+
+    @property
+    def relation_references(self):
+        m = re.search(r'@relation\([^)]*references:\s*\[([^\]]*)\]', self.attributes)
+        return _split(m.group(1)) if m else []
+
+    @property
+    def default(self):
+        m = re.search(r'@default\(((?:[^()]|\([^()]*\))*)\)', self.attributes)
+        return m.group(1) if m else None
+
+
+@dataclass
+class Index:
+    columns: tuple
+    kind: str = 'index'
+    type: str = None
+
+    def declaration(self):
+        cols = ', '.join(self.columns)
+        extra = f', type: {self.type}' if self.type else ''
+        return f'@@{self.kind}([{cols}]{extra})'
+
+
+@dataclass
+class Model:
+    name: str
+    fields: dict = field(default_factory=dict)
+    indexes: list = field(default_factory=list)
+
+
+@dataclass
+class Schema:
+    models: dict = field(default_factory=dict)
+    enums: dict = field(default_factory=dict)
+
+    def is_relation(self, model, name):
+        f = self.models[model].fields.get(name)
+        return f is not None and f.type in self.models
+
+    def columns(self, model):
+        """Fields of ``model`` stored as columns the client can read and write.
+
+        Scalars and enums; not relations, and not ``Unsupported(...)`` columns
+        such as the database-maintained search vectors.
+        """
+        return [f for f in self.models[model].fields.values()
+                if f.type not in self.models and not f.type.startswith('Unsupported(')]
+
+    def foreign_key(self, model, name):
+        """Resolve relation ``model.name`` to ``(related_model, columns, to_many)``.
+
+        ``columns`` are the columns of ``related_model`` probed to load the
+        relation from a ``model`` row: its referenced key when ``model``
+        holds the foreign key, the foreign key itself otherwise.
+        """
+        f = self.models[model].fields[name]
+        if f.relation_fields:
+            return f.type, tuple(f.relation_references), False
+        for other in self.models[f.type].fields.values():
+            if other.type == model and other.relation_fields:
+                return f.type, tuple(other.relation_fields), f.list
+        return f.type, (), f.list
+
+
+def _split(text):
+    return [c.strip().split('(')[0].strip() for c in text.split(',') if c.strip()]
+
+
+def parse(text):
+    schema = Schema()
+    blocks = list(_BLOCK.finditer(text))
+    for kind, name, body in (b.groups() for b in blocks):
+        if kind == 'enum':
+            schema.enums[name] = [line.strip() for line in body.splitlines()
+                                  if line.strip() and not line.strip().startswith('//')]
+            continue
+        model = Model(name)
+        for raw in body.splitlines():
+            line = raw.split('//', 1)[0].strip()
+            if not line:
+                continue
+            if line.startswith('@@'):
+                kind_match = re.match(r'@@(\w+)', line)
+                cols = _COLUMNS.search(line)
+                if kind_match and cols and kind_match.group(1) in ('id', 'unique', 'index'):
+                    type_match = re.search(r'type:\s*(\w+)', line)
+                    model.indexes.append(Index(tuple(_split(cols.group(1))), kind_match.group(1),
+                                               type_match.group(1) if type_match else None))
+                continue
+            m = _FIELD.match(line)
+            if not m:
+                continue
+            fname, ftype, is_list, optional, attrs = m.groups()
+            model.fields[fname] = Field(fname, ftype, bool(is_list), bool(optional), attrs)
+            if re.search(r'@id\b', attrs):
+                model.indexes.append(Index((fname,), 'id'))
+            elif re.search(r'@unique\b', attrs):
+                model.indexes.append(Index((fname,), 'unique'))
+        schema.models[name] = model
+    return schema
+
+
+def load(options=None):
+    """Parse the schema emitted by the ``schema`` template."""
+    from .registry import render
+    return parse(render('schema', options))
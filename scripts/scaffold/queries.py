@@ -0,0 +1,277 @@
+"""Static extraction of Prisma calls from TS templates.
+
+``calls()`` finds every ``db.<model>.<op>(...)`` in the rendered templates
+and parses its argument with a small, forgiving reader for JS object
+literals. Anything that is not an object or array literal is kept as an
+opaque expression, together with any object literals nested inside it,
+so conditional filters like ``x ? { niche: { has: x } } : undefined`` or
+``...(niche ? {...} : {})`` still contribute their keys.
+"""
+import re
+from dataclasses import dataclass, field
+
+from .registry import render, select
+
+OPS = ('findMany', 'findFirst', 'findUnique', 'findFirstOrThrow', 'findUniqueOrThrow', 'count',
+       'aggregate', 'groupBy', 'create', 'createMany', 'update', 'updateMany', 'upsert', 'delete', 'deleteMany')
+_CALL = re.compile(r'\b(?:db|tx)\.(\w+)\.(' + '|'.join(OPS) + r')\s*\(')
+
+
+@dataclass
+class Obj:
+    entries: list = field(default_factory=list)
+    spans: list = field(default_factory=list)
+    start: int = 0
+    end: int = 0
+
+    def fields(self):
+        """Keys this object may carry, spreads and conditional branches included."""
+        out = {}
+        for key, value in self.entries:
+            if key is None:
+                for alt in alternatives(value):
+                    out.update(alt.fields())
+            else:
+                out[key] = value
+        return out
+
+    def get(self, key):
+        return self.fields().get(key)
+
+
+@dataclass
+class Arr:
+    items: list = field(default_factory=list)
+    start: int = 0
+    end: int = 0
+
+
+@dataclass
+class Expr:
+    text: str
+    nested: list = field(default_factory=list)
+    start: int = 0
+    end: int = 0
+
+    @property
+    def literal(self):
+        m = re.fullmatch(r'\s*(["\'])(.*)\1\s*', self.text)
+        return m.group(2) if m else None
+
+
+@dataclass
+class Call:
+    template: str
+    line: int
+    model: str
+    op: str
+    args: Obj
+    start: int = 0
+    end: int = 0
+
+    @property
+    def prisma_model(self):
+        return self.model[:1].upper() + self.model[1:]
+
+    @property
+    def where(self):
+        return self.args.get('where')
+
+    @property
+    def order_by(self):
+        return self.args.get('orderBy')
+
+
+def alternatives(node):
+    """Object literals ``node`` may evaluate to."""
+    if isinstance(node, Obj):
+        return [node]
+    if isinstance(node, Expr):
+        out = []
+        for n in node.nested:
+            out.extend(alternatives(n))
+        return out
+    return []
+
+
+class _Reader:
+    CLOSE = {'{': '}', '[': ']', '(': ')'}
+
+    def __init__(self, text, pos):
+        self.text = text
+        self.pos = pos
+
+    def skip(self):
+        text = self.text
+        while self.pos < len(text):
+            c = text[self.pos]
+            if c.isspace():
+                self.pos += 1
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.pos = len(text) if end < 0 else end + 1
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos)
+                self.pos = len(text) if end < 0 else end + 2
+            else:
+                break
+
+    def peek(self):
+        self.skip()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def string(self):
+        quote = self.text[self.pos]
+        i = self.pos + 1
+        while i < len(self.text):
+            c = self.text[i]
+            if c == '\\':
+                i += 2
+                continue
+            if quote == '`' and self.text.startswith('${', i):
+                sub = _Reader(self.text, i + 2)
+                sub.balanced('}')
+                i = sub.pos
+                continue
+            if c == quote:
+                break
+            i += 1
+        value = self.text[self.pos:i + 1]
+        self.pos = i + 1
+        return value
+
+    def balanced(self, close):
+        """Skip to just past ``close``, honouring nesting and strings."""
+        while self.pos < len(self.text):
+            c = self.peek()
+            if c in '"\'`':
+                self.string()
+            elif c in self.CLOSE:
+                self.pos += 1
+                self.balanced(self.CLOSE[c])
+            elif c == close:
+                self.pos += 1
+                return
+            else:
+                self.pos += 1
+
+    def value(self):
+        c = self.peek()
+        if c == '{':
+            return self.obj()
+        if c == '[':
+            return self.arr()
+        return self.expr()
+
+    def obj(self):
+        node = Obj(start=self.pos)
+        self.pos += 1
+        while True:
+            c = self.peek()
+            if c == '}' or not c:
+                self.pos += 1
+                node.end = self.pos
+                return node
+            if c == ',':
+                self.pos += 1
+                continue
+            entry_start = self.pos
+            if self.text.startswith('...', self.pos):
+                self.pos += 3
+                spread = self.expr()
+                node.entries.append((None, spread))
+                node.spans.append((entry_start, spread.end))
+                continue
+            if c in '"\'':
+                key = self.string()[1:-1]
+            elif c == '[':
+                start = self.pos
+                self.pos += 1
+                self.balanced(']')
+                key = self.text[start:self.pos]
+            else:
+                m = re.compile(r'[\w$]+').match(self.text, self.pos)
+                if not m:
+                    self.pos += 1
+                    continue
+                key = m.group(0)
+                self.pos = m.end()
+            if self.peek() == ':':
+                self.pos += 1
+                value = self.value()
+            else:
+                value = Expr(key, start=entry_start, end=self.pos)
+            node.entries.append((key, value))
+            node.spans.append((entry_start, value.end))
+
+    def arr(self):
+        node = Arr(start=self.pos)
+        self.pos += 1
+        while True:
+            c = self.peek()
+            if c == ']' or not c:
+                self.pos += 1
+                node.end = self.pos
+                return node
+            if c == ',':
+                self.pos += 1
+                continue
+            node.items.append(self.value())
+
+    def expr(self):
+        self.skip()
+        start = self.pos
+        nested = []
+        while True:
+            c = self.peek()
+            if not c or c in ',}])':
+                break
+            if c in '"\'`':
+                self.string()
+            elif c == '{':
+                nested.append(self.obj())
+            elif c == '[':
+                nested.append(self.arr())
+            elif c == '(':
+                self.pos += 1
+                while self.peek() not in (')', ''):
+                    if self.peek() == ',':
+                        self.pos += 1
+                        continue
+                    inner = self.expr()
+                    nested.extend([inner] if inner.nested or inner.text.strip() else [])
+                self.pos += 1
+            elif self.text.startswith('=>', self.pos):
+                self.pos += 2
+            else:
+                self.pos += 1
+        end = self.pos
+        while end > start and self.text[end - 1].isspace():
+            end -= 1
+        return Expr(self.text[start:end], nested, start, end)
+
+
+def parse_call(text, open_paren):
+    """Parse the first argument of the call whose ``(`` is at ``open_paren``."""
+    reader = _Reader(text, open_paren + 1)
+    node = reader.value() if reader.peek() != ')' else Obj()
+    reader.balanced(')')
+    return (node if isinstance(node, Obj) else Obj()), reader.pos
+
+
+def extract(text, template=''):
+    out = []
+    for m in _CALL.finditer(text):
+        args, end = parse_call(text, m.end() - 1)
+        line = text.count('\n', 0, m.start()) + 1
+        out.append(Call(template, line, m.group(1), m.group(2), args, m.start(), end))
+    return out
+
+
+def calls(templates=None, options=None):
+    """Every Prisma call in the TS templates, in registry order."""
+    out = []
+    for t in templates or select(None, options):
+        if t.path.endswith(('.ts', '.tsx')):
+            out.extend(extract(render(t.name, options), t.name))
+    return out
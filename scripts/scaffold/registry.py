@@ -0,0 +1,166 @@
+"""Named scaffold templates.
+
+The index below only carries metadata. A template's body lives in its own
+module under ``scaffold.templates`` and is imported the first time it is
+rendered, so looking up or rendering one template never pulls in the rest.
+A module exposes either a static ``CONTENT`` string or ``render(options)``
+for bodies that depend on build options such as ``counters``, ``cache`` or ``isr``. Route
+handlers are additionally instrumented when ``timing`` is on (see
+``instrument``).
+"""
+import importlib
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Template:
+    name: str
+    path: str
+    module: str
+    kind: str
+    description: str
+    tags: tuple = field(default=())
+    feature: str = None  # or a tuple: emitted when any of them is enabled
+
+    @property
+    def features(self):
+        return (self.feature,) if isinstance(self.feature, str) else tuple(self.feature or ())
+
+
+TEMPLATES = [
+    Template('schema', 'prisma/schema.prisma', 'prisma_schema', 'prisma',
+             'Prisma data model', ('db',)),
+    Template('search-sql', 'prisma/search.sql', 'search_sql', 'sql',
+             'Search vector columns, triggers and indexes', ('db',)),
+    Template('deploy-script', 'vps-configs/deploy.sh', 'deploy_sh', 'shell',
+             'VPS deploy script', ('ops',)),
+    Template('deploy-runner', 'vps-configs/deploy.py', 'deploy_py', 'script',
+             'Incremental VPS deploy runner', ('ops',)),
+    Template('build-cache', 'vps-configs/build_cache.py', 'build_cache_py', 'script',
+             'Content-addressed build output cache', ('ops',)),
+    Template('pm2-config', 'vps-configs/ecosystem.config.js', 'ecosystem_config', 'config',
+             'Host-sized PM2 cluster config', ('ops',)),
+    Template('nginx-config', 'vps-configs/nginx-novaclio.io.conf', 'nginx_config', 'config',
+             'nginx site with static caching and API micro-cache', ('ops',)),
+    Template('pgbouncer-config', 'vps-configs/pgbouncer.ini', 'pgbouncer_ini', 'config',
+             'PgBouncer pool sized for the PM2 cluster', ('ops', 'db')),
+    Template('pool-check', 'vps-configs/check_pool.py', 'check_pool_py', 'script',
+             'Pre-deploy Postgres connection budget check', ('ops', 'db')),
+    Template('search-index', 'vps-configs/search_index.py', 'search_index_py', 'script',
+             'Applies search.sql, backfills vectors, builds indexes concurrently', ('ops', 'db')),
+    Template('match-creators', 'vps-configs/match_creators.py', 'match_creators_py', 'script',
+             'Offline top-k creator matching per active campaign', ('ai', 'db')),
+    Template('next-config', 'next.config.ts', 'next_config', 'config',
+             'Next.js config, with the shared cache handler under --isr', ('ops',)),
+    Template('compose', 'docker-compose.yml', 'docker_compose', 'config',
+             'Local stack with Postgres behind PgBouncer', ('ops', 'db')),
+    Template('auth-lib', 'src/lib/auth.ts', 'auth_lib', 'lib',
+             'next-auth options with role ids in the JWT', ('auth',)),
+    Template('session-lib', 'src/lib/session.ts', 'session_lib', 'lib',
+             'Creator/Brand id from the session', ('auth',)),
+    Template('next-auth-types', 'src/types/next-auth.d.ts', 'next_auth_types', 'types',
+             'Session and JWT type augmentation', ('auth',)),
+    Template('login-page', 'src/app/(auth)/login/page.tsx', 'login_page', 'page',
+             'Credentials sign-in page', ('auth',)),
+    Template('signup-page', 'src/app/(auth)/signup/page.tsx', 'signup_page', 'page',
+             'Creator/brand sign-up chooser', ('auth',)),
+    Template('brand-signup-page', 'src/app/(auth)/signup/brand/page.tsx', 'brand_signup_page', 'page',
+             'Brand sign-up form', ('auth', 'brand')),
+    Template('creator-signup-page', 'src/app/(auth)/signup/creator/page.tsx', 'creator_signup_page', 'page',
+             'Creator sign-up form', ('auth', 'creator')),
+    Template('brand-layout', 'src/app/(dashboard)/brand/layout.tsx', 'brand_layout', 'layout',
+             'Brand portal shell', ('brand',)),
+    Template('brand-dashboard', 'src/app/(dashboard)/brand/page.tsx', 'brand_dashboard', 'page',
+             'Brand dashboard with campaign stats', ('brand',)),
+    Template('new-campaign-page', 'src/app/(dashboard)/brand/campaigns/new/page.tsx', 'new_campaign_page', 'page',
+             'Campaign creation form', ('brand',)),
+    Template('discover-page', 'src/app/(dashboard)/brand/discover/page.tsx', 'discover_page', 'page',
+             'Creator discovery grid', ('brand',)),
+    Template('creator-layout', 'src/app/(dashboard)/creator/layout.tsx', 'creator_layout', 'layout',
+             'Creator portal shell', ('creator',)),
+    Template('creator-dashboard', 'src/app/(dashboard)/creator/page.tsx', 'creator_dashboard', 'page',
+             'Creator dashboard with proposal stats', ('creator',)),
+    Template('briefs-page', 'src/app/(dashboard)/creator/briefs/page.tsx', 'briefs_page', 'page',
+             'Active campaign listing', ('creator',)),
+    Template('proposals-page', 'src/app/(dashboard)/creator/proposals/page.tsx', 'proposals_page', 'page',
+             "Creator's submitted proposals", ('creator',)),
+    Template('earnings-page', 'src/app/(dashboard)/creator/earnings/page.tsx', 'earnings_page', 'page',
+             'Creator earnings and history', ('creator',)),
+    Template('creator-profile-page', 'src/app/(dashboard)/creator/profile/page.tsx', 'creator_profile_page', 'page',
+             'Creator profile editor', ('creator',)),
+    Template('campaigns-api', 'src/app/api/campaigns/route.ts', 'campaigns_route', 'route',
+             'GET/POST /api/campaigns', ('api',)),
+    Template('campaign-proposals-api', 'src/app/api/campaigns/[id]/proposals/route.ts', 'campaign_proposals_route', 'route',
+             'GET/POST /api/campaigns/[id]/proposals', ('api',)),
+    Template('search-campaigns-api', 'src/app/api/search/campaigns/route.ts', 'search_campaigns_route', 'route',
+             'GET /api/search/campaigns', ('api',)),
+    Template('search-creators-api', 'src/app/api/search/creators/route.ts', 'search_creators_route', 'route',
+             'GET /api/search/creators', ('api',)),
+    Template('paystack-webhook', 'src/app/api/webhooks/paystack/route.ts', 'paystack_webhook_route', 'route',
+             'Paystack charge webhook', ('api', 'payments')),
+    Template('timing-lib', 'src/lib/timing.ts', 'timing_lib', 'lib',
+             'Sampled Server-Timing phase timers', ('api',), feature='timing'),
+    Template('cache-json-lib', 'src/lib/cache-json.ts', 'cache_json_lib', 'lib',
+             'Date-preserving JSON for cached values', ('db',), feature=('cache', 'isr')),
+    Template('cache-lib', 'src/lib/cache.ts', 'cache_lib', 'lib',
+             'Redis read-through cache for public listings', ('db',), feature='cache'),
+    Template('data-cache-lib', 'src/lib/data-cache.ts', 'data_cache_lib', 'lib',
+             'Tagged Next.js data cache for pages and stats', ('db',), feature='isr'),
+    Template('cache-handler', 'cache-handler.js', 'cache_handler', 'lib',
+             'Redis-backed Next.js cache shared by the web workers', ('ops',), feature='isr'),
+    Template('pagination-lib', 'src/lib/pagination.ts', 'pagination_lib', 'lib',
+             'Keyset cursor helpers for list queries', ('db',)),
+    Template('search-lib', 'src/lib/search.ts', 'search_lib', 'lib',
+             'Ranked full-text and trigram search', ('db',)),
+    Template('load-more', 'src/components/LoadMore.tsx', 'load_more', 'component',
+             'Next-page link for paginated lists', ()),
+    Template('stats-lib', 'src/lib/stats.ts', 'stats_lib', 'lib',
+             'Aggregate dashboard stats', ('db',)),
+    Template('counters-lib', 'src/lib/counters.ts', 'counters_lib', 'lib',
+             'Transactional proposal counter updates', ('db',), feature='counters'),
+    Template('scoring-lib', 'src/lib/scoring.ts', 'scoring_lib', 'lib',
+             'Proposal scoring queue and cache keys', ('ai',)),
+    Template('scoring-worker', 'src/workers/scoring-worker.ts', 'scoring_worker', 'worker',
+             'Batched, rate-limited proposal scoring worker', ('ai',)),
+    Template('score-updates', 'src/components/ScoreUpdates.tsx', 'score_updates', 'component',
+             'Refreshes a page when a proposal score is pushed', ('ai',)),
+]
+
+_BY_NAME = {t.name: t for t in TEMPLATES}
+_BY_PATH = {t.path: t for t in TEMPLATES}
+
+
+def names():
+    return [t.name for t in TEMPLATES]
+
+
+def get(name):
+    """Look a template up by name or by its output path."""
+    template = _BY_NAME.get(name) or _BY_PATH.get(name)
+    if template is None:
+        raise KeyError(f'unknown template: {name}')
+    return template
+
+
+def select(names=None, options=None):
+    """Resolve names/paths to templates, in registry order.
+
+    With no names, every template with no ``feature``, or with one of its
+    features enabled in ``options``.
+    """
+    if not names:
+        options = options or {}
+        return [t for t in TEMPLATES if not t.features or any(options.get(f) for f in t.features)]
+    wanted = {get(n).name for n in names}
+    return [t for t in TEMPLATES if t.name in wanted]
+
+
+def render(name, options=None):
+    template = get(name)
+    options = options or {}
+    module = importlib.import_module(f'{__package__}.templates.{template.module}')
+    text = module.render(options) if hasattr(module, 'render') else module.CONTENT
+    if options.get('timing') and template.kind == 'route':
+        from .instrument import instrument
+        text = instrument(text, template.path)
+    return text
@@ -0,0 +1,14 @@
+"""Template bodies, one module per generated file; imported on demand by the registry."""
+
+
+def _swap(text, old, new):
+    """``text`` with ``old`` replaced by ``new``; ``old`` must occur exactly once.
+
+    Variant templates are built by swapping blocks of the base body, so an
+    anchor that no longer matches must fail the render rather than emit the
+    base code unchanged.
+    """
+    count = text.count(old)
+    if count != 1:
+        raise ValueError(f'variant anchor found {count} times, expected once: {old.splitlines()[0]!r}')
+    return text.replace(old, new)
@@ -0,0 +1,92 @@
+"""src/lib/auth.ts"""
+
+CONTENT = '''import type { NextAuthOptions } from "next-auth";
+import CredentialsProvider from "next-auth/providers/credentials";
+import GoogleProvider from "next-auth/providers/google";
+import { PrismaAdapter } from "@auth/prisma-adapter";
+import bcrypt from "bcryptjs";
+import { db } from "@/lib/db";
+
+// The user's role and Creator/Brand ids ride in the JWT, so pages and API
+// routes key on session.user.creatorId / brandId instead of resolving the
+// profile through User.email on every request. They are resolved once at
+// sign-in and again on useSession().update(), which onboarding calls after
+// creating a profile. Tokens minted before this change have no ids and are
+// resolved on their next use.
+
+async function profileIds(userId: string) {
+  const user = await db.user.findUnique({
+    where: { id: userId },
+    select: { role: true, creator: { select: { id: true } }, brand: { select: { id: true } } },
+  });
+  return {
+    role: user?.role,
+    creatorId: user?.creator?.id ?? null,
+    brandId: user?.brand?.id ?? null,
+  };
+}
+
+export const authOptions: NextAuthOptions = {
+  adapter: PrismaAdapter(db) as NextAuthOptions["adapter"],
+  session: { strategy: "jwt" },
+  pages: { signIn: "/login" },
+  providers: [
+    GoogleProvider({
+      clientId: process.env.GOOGLE_CLIENT_ID!,
+      clientSecret: process.env.GOOGLE_CLIENT_SECRET!,
+      allowDangerousEmailAccountLinking: true,
+    }),
+    CredentialsProvider({
+      name: "credentials",
+      credentials: {
+        email: { label: "Email", type: "email" },
+        password: { label: "Password", type: "password" },
+      },
+      async authorize(credentials) {
+        if (!credentials?.email || !credentials?.password) return null;
+        const user = await db.user.findUnique({
+          where: { email: credentials.email },
+          select: {
+            id: true, email: true, name: true, image: true, role: true, password: true,
+            creator: { select: { id: true } },
+            brand: { select: { id: true } },
+          },
+        });
+        if (!user?.password || !(await bcrypt.compare(credentials.password, user.password))) return null;
+        return {
+          id: user.id,
+          email: user.email,
+          name: user.name,
+          image: user.image,
+          role: user.role,
+          creatorId: user.creator?.id ?? null,
+          brandId: user.brand?.id ?? null,
+        };
+      },
+    }),
+  ],
+  callbacks: {
+    async jwt({ token, user, trigger }) {
+      if (user) token.id = user.id;
+      if (user && user.creatorId !== undefined) {
+        // Credentials sign-in already loaded the profile ids.
+        token.role = user.role;
+        token.creatorId = user.creatorId;
+        token.brandId = user.brandId ?? null;
+      } else if (token.id && (user || trigger === "update" || token.creatorId === undefined)) {
+        Object.assign(token, await profileIds(token.id));
+      }
+      return token;
+    },
+    async session({ session, token }) {
+      if (session.user) {
+        session.user.id = token.id!;
+        session.user.role = token.role!;
+        session.user.creatorId = token.creatorId ?? null;
+        session.user.brandId = token.brandId ?? null;
+      }
+      return session;
+    },
+  },
+};
+'''
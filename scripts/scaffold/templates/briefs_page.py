@@ -0,0 +1,98 @@
+"""src/app/(dashboard)/creator/briefs/page.tsx"""
+from . import _swap
+
+CONTENT = '''import { db } from "@/lib/db";
+import { DEFAULT_PAGE_SIZE, decodeCursor, keysetWhere, toPage } from "@/lib/pagination";
+import LoadMore from "@/components/LoadMore";
+import Link from "next/link";
+
+export default async function BriefsPage({ searchParams }: { searchParams: { cursor?: string } }) {
+  const take = DEFAULT_PAGE_SIZE;
+  const rows = await db.campaign.findMany({
+    where: { status: "ACTIVE", ...keysetWhere("createdAt", decodeCursor(searchParams.cursor)) },
+    include: { brand: { include: { user: { select: { name: true } } } }, _count: { select: { proposals: true } } },
+    orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+    take: take + 1,
+  });
+  const { items: campaigns, nextCursor } = toPage(rows, take, "createdAt");
+
+  return (
+    <div>
+      <div className="mb-8">
+        <h1 className="text-2xl font-bold text-white">Browse Briefs</h1>
+        <p className="text-gray-400">Find campaigns that match your style</p>
+      </div>
+
+      {campaigns.length > 0 ? (
+        <div className="space-y-4">
+          {campaigns.map(c => (
+            <div key={c.id} className="bg-gray-900 border border-gray-800 rounded-xl p-6">
+              <div className="flex items-start justify-between">
+                <div className="flex-1">
+                  <h3 className="text-white font-semibold text-lg">{c.title}</h3>
+                  <p className="text-gray-400 text-sm mt-1">{c.brand.user.name} · {c.brand.industry}</p>
+                  <p className="text-gray-300 text-sm mt-3 line-clamp-2">{c.description}</p>
+                  <div className="flex flex-wrap gap-2 mt-3">
+                    {c.niche.map(n => <span key={n} className="bg-violet-900/30 text-violet-400 px-2 py-1 rounded-md text-xs">{n}</span>)}
+                  </div>
+                </div>
+                <div className="text-right ml-6">
+                  <p className="text-white font-semibold">₦{c.budget.toLocaleString()}</p>
+                  <p className="text-gray-400 text-xs mt-1">{c._count.proposals} proposals</p>
+                  <Link href={`/creator/briefs/${c.id}`}
+                    className="inline-block mt-3 bg-violet-600 hover:bg-violet-700 text-white text-sm px-4 py-2 rounded-lg transition-colors">
+                    Apply →
+                  </Link>
+                </div>
+              </div>
+            </div>
+          ))}
+          <LoadMore cursor={nextCursor} />
+        </div>
+      ) : (
+        <div className="bg-gray-900 border border-gray-800 rounded-xl p-12 text-center">
+          <p className="text-gray-400">No active campaigns right now. Check back soon!</p>
+        </div>
+      )}
+    </div>
+  );
+}
+'''
+
+QUERY = '''  const rows = await db.campaign.findMany({
+    where: { status: "ACTIVE", ...keysetWhere("createdAt", decodeCursor(searchParams.cursor)) },
+    include: { brand: { include: { user: { select: { name: true } } } }, _count: { select: { proposals: true } } },
+    orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+    take: take + 1,
+  });
+'''
+
+# With ``cache`` the first page is read through Redis (src/lib/cache.ts);
+# later pages are cursor-specific and go to the database.
+CACHED_QUERY = '''  const cursor = decodeCursor(searchParams.cursor);
+  const query = () => db.campaign.findMany({
+    where: { status: "ACTIVE", ...keysetWhere("createdAt", cursor) },
+    include: { brand: { include: { user: { select: { name: true } } } }, _count: { select: { proposals: true } } },
+    orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+    take: take + 1,
+  });
+  const rows = cursor ? await query() : await cachedListing("campaigns", null, `briefs:${take}`, query);
+'''
+
+# With ``isr`` the first page goes through the tagged Next.js data cache
+# (src/lib/data-cache.ts) instead; it takes precedence over ``cache``.
+ISR_QUERY = _swap(
+    CACHED_QUERY,
+    'await cachedListing("campaigns", null, `briefs:${take}`, query);',
+    'await cached(query, ["briefs", String(take)], [tags.campaigns()], REVALIDATE.briefs);')
+
+
+def render(options):
+    if options.get('isr'):
+        lib, query = 'import { REVALIDATE, cached, tags } from "@/lib/data-cache";\n', ISR_QUERY
+    elif options.get('cache'):
+        lib, query = 'import { cachedListing } from "@/lib/cache";\n', CACHED_QUERY
+    else:
+        return CONTENT
+    text = _swap(CONTENT, 'import { db } from "@/lib/db";\n', 'import { db } from "@/lib/db";\n' + lib)
+    return _swap(text, QUERY, query)
@@ -0,0 +1,255 @@
+"""vps-configs/build_cache.py"""
+
+CONTENT = '''#!/usr/bin/env python3
+"""Content-addressed store for build outputs, used by deploy.py.
+
+    python3 vps-configs/build_cache.py [--dir DIR] [--budget SIZE] list|gc|clear
+
+An entry is a manifest of the files under some output paths
+(``.next``, ``node_modules/.prisma/client``) stored under the hash of the
+inputs that produced them. File contents live once in ``objects/`` by
+sha256 and are hardlinked into the app on restore, so restoring a build
+costs a directory walk, not a copy; across filesystems it falls back to
+copying. Objects are read-only: a tool that rewrites a restored file in
+place fails instead of corrupting the store, and deploy.py removes a
+step's outputs before rerunning it.
+
+Scratch trees (``.next/cache``) are mutated by the next build, so they are
+stored and restored by copying.
+
+Entries are evicted least recently used first once the objects they
+reference exceed the size budget.
+"""
+import argparse
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+
+DEFAULT_DIR = os.environ.get('DEPLOY_CACHE_DIR', '/var/www/gravy-cc-deploy/.deploy/cache')
+DEFAULT_BUDGET = os.environ.get('DEPLOY_CACHE_BUDGET', '5G')
+
+
+def parse_size(text):
+    text = str(text).strip().upper().rstrip('B')
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def human(size):
+    for unit in ('B', 'K', 'M', 'G'):
+        if size < 1024:
+            return f'{size:.0f}{unit}' if unit == 'B' else f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}T'
+
+
+def _digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _walk(root, rel, exclude):
+    """``(relpath, lstat)`` for every file and symlink under ``root/rel``."""
+    path = os.path.join(root, rel)
+    if not os.path.lexists(path):
+        return
+    if not os.path.isdir(path) or os.path.islink(path):
+        yield rel, os.lstat(path)
+        return
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [d for d in dirnames
+                       if os.path.relpath(os.path.join(dirpath, d), root) not in exclude]
+        for name in dirnames + filenames:
+            full = os.path.join(dirpath, name)
+            if name in filenames or os.path.islink(full):
+                yield os.path.relpath(full, root), os.lstat(full)
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.unlink(path)
+
+
+def clear(root, paths, exclude=()):
+    """Remove ``paths`` under ``root``, keeping the excluded children (e.g. ``.next/cache``)."""
+    for rel in paths:
+        path = os.path.join(root, rel)
+        kept = [e for e in exclude if os.path.dirname(e) == rel]
+        if kept and os.path.isdir(path) and not os.path.islink(path):
+            for name in os.listdir(path):
+                if os.path.join(rel, name) not in kept:
+                    _remove(os.path.join(path, name))
+        else:
+            _remove(path)
+
+
+class Cache:
+    def __init__(self, directory=DEFAULT_DIR, budget=DEFAULT_BUDGET):
+        self.dir = directory
+        self.budget = parse_size(budget)
+        self.lock = threading.Lock()
+        for sub in ('objects', 'entries', 'tmp'):
+            os.makedirs(os.path.join(directory, sub), exist_ok=True)
+
+    def _entry(self, kind, key):
+        return os.path.join(self.dir, 'entries', kind, key + '.json')
+
+    def _object(self, name):
+        return os.path.join(self.dir, 'objects', name[:2], name)
+
+    def has(self, kind, key):
+        return os.path.exists(self._entry(kind, key))
+
+    def store(self, kind, key, root, paths, exclude=(), copy=False):
+        """Record ``paths`` under ``root`` as entry ``kind/key``; returns bytes added to the store."""
+        with self.lock:
+            return self._store(kind, key, root, paths, set(exclude), copy)
+
+    def _store(self, kind, key, root, paths, exclude, copy):
+        files, added = {}, 0
+        for rel in paths:
+            for path, st in _walk(root, rel, exclude):
+                full = os.path.join(root, path)
+                if stat.S_ISLNK(st.st_mode):
+                    files[path] = {'link': os.readlink(full)}
+                    continue
+                executable = bool(st.st_mode & 0o111)
+                name = _digest(full) + ('x' if executable else '')
+                obj = self._object(name)
+                if not os.path.exists(obj):
+                    os.makedirs(os.path.dirname(obj), exist_ok=True)
+                    tmp = os.path.join(self.dir, 'tmp', f'{name}.{threading.get_ident()}')
+                    if copy or not self._link(full, tmp):
+                        shutil.copyfile(full, tmp)
+                    os.chmod(tmp, 0o555 if executable else 0o444)
+                    os.replace(tmp, obj)
+                    added += st.st_size
+                files[path] = {'object': name, 'size': st.st_size}
+        entry = self._entry(kind, key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        with open(entry + '.tmp', 'w') as f:
+            json.dump({'kind': kind, 'key': key, 'paths': list(paths), 'exclude': sorted(exclude), 'copy': copy,
+                       'stored': time.time(), 'files': files}, f)
+        os.replace(entry + '.tmp', entry)
+        self.evict(keep={entry})
+        return added
+
+    def restore(self, kind, key, root):
+        """Materialise entry ``kind/key`` under ``root``, replacing its paths; False on a miss."""
+        with self.lock:
+            return self._restore(kind, key, root)
+
+    def _restore(self, kind, key, root):
+        entry = self._entry(kind, key)
+        try:
+            with open(entry) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return False
+        if any(not os.path.exists(self._object(meta['object']))
+               for meta in manifest['files'].values() if 'object' in meta):
+            return False
+        clear(root, manifest['paths'], manifest['exclude'])
+        for path, meta in manifest['files'].items():
+            target = os.path.join(root, path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if 'link' in meta:
+                os.symlink(meta['link'], target)
+            elif manifest['copy'] or not self._link(self._object(meta['object']), target):
+                shutil.copyfile(self._object(meta['object']), target)
+                os.chmod(target, 0o755 if meta['object'].endswith('x') else 0o644)
+        os.utime(entry)
+        return True
+
+    @staticmethod
+    def _link(source, target):
+        try:
+            os.link(source, target)
+            return True
+        except OSError as e:
+            if e.errno in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                return False
+            raise
+
+    def entries(self):
+        out = []
+        base = os.path.join(self.dir, 'entries')
+        for kind in sorted(os.listdir(base)):
+            for name in os.listdir(os.path.join(base, kind)):
+                if name.endswith('.json'):
+                    path = os.path.join(base, kind, name)
+                    with open(path) as f:
+                        manifest = json.load(f)
+                    out.append((os.stat(path).st_mtime, path, manifest))
+        return sorted(out, key=lambda e: e[0])
+
+    def evict(self, keep=()):
+        """Drop least recently used entries until their objects fit the budget, then unreferenced objects."""
+        entries = self.entries()
+        sizes = {}
+        for _, _, manifest in entries:
+            for meta in manifest['files'].values():
+                if 'object' in meta:
+                    sizes[meta['object']] = meta['size']
+        refs = {}
+        for _, path, manifest in entries:
+            refs[path] = {m['object'] for m in manifest['files'].values() if 'object' in m}
+        total = sum(sizes.values())
+        evicted = []
+        for _, path, _ in entries:
+            if total <= self.budget:
+                break
+            if path in keep:
+                continue
+            others = set().union(*(r for p, r in refs.items() if p != path))
+            total -= sum(sizes[o] for o in refs[path] - others)
+            del refs[path]
+            os.unlink(path)
+            evicted.append(path)
+        live = set().union(*refs.values())
+        objects = os.path.join(self.dir, 'objects')
+        for prefix in os.listdir(objects):
+            for name in os.listdir(os.path.join(objects, prefix)):
+                if name not in live:
+                    os.unlink(os.path.join(objects, prefix, name))
+        return evicted, total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Inspect the deploy build cache')
+    parser.add_argument('--dir', default=DEFAULT_DIR, help='cache directory (default: $DEPLOY_CACHE_DIR)')
+    parser.add_argument('--budget', default=DEFAULT_BUDGET, help='size budget, e.g. 5G (default: $DEPLOY_CACHE_BUDGET)')
+    parser.add_argument('command', choices=['list', 'gc', 'clear'])
+    args = parser.parse_args(argv)
+
+    if args.command == 'clear':
+        shutil.rmtree(args.dir, ignore_errors=True)
+        return 0
+    cache = Cache(args.dir, args.budget)
+    if args.command == 'gc':
+        evicted, total = cache.evict()
+        print(f'evicted {len(evicted)} entries, {human(total)} of {human(cache.budget)} in use')
+        return 0
+    for used, _, manifest in reversed(cache.entries()):
+        size = sum(m.get('size', 0) for m in manifest['files'].values())
+        print(f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(used))}  {manifest['kind']:10} "
+              f"{manifest['key'][:12]}  {len(manifest['files']):6} files  {human(size):>7}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+'''
@@ -0,0 +1,113 @@
+"""cache-handler.js"""
+
+CONTENT = '''// Shared Next.js cache handler for the web cluster (emitted with --isr and
+// wired in by next.config.ts).
+//
+// PM2 runs the web app as one worker per core. Next's default cache keeps
+// its entries and the tags passed to revalidateTag() in each worker's
+// memory, so a write handled by one worker would leave the others serving
+// the old briefs, discover and stats data until their windows ran out.
+// This handler keeps both in Redis instead:
+//
+// - An entry is stored under next-cache:entry:<key> with the time it was
+//   written and its tags.
+// - revalidateTag() stores the current time under next-cache:tag:<tag>. An
+//   entry written before any of its tags was revalidated is a miss on
+//   every worker.
+// - next.config.ts sets cacheMaxMemorySize to 0, so no worker keeps a copy
+//   of its own.
+// - Redis trouble is a cache miss, never a failed page.
+//
+// Plain CommonJS: Next loads this file at runtime without compiling it.
+const IORedis = require("ioredis");
+
+const PREFIX = "next-cache:";
+// Entries in use are rewritten every revalidation window; idle ones age out.
+const TTL = parseInt(process.env.NEXT_CACHE_TTL || "86400");
+
+// Same variables as the scoring queue in src/lib/scoring.ts.
+const redis = new IORedis({
+  host: process.env.REDIS_HOST || "127.0.0.1",
+  port: parseInt(process.env.REDIS_PORT || "6379"),
+  enableOfflineQueue: false,
+  maxRetriesPerRequest: 1,
+  commandTimeout: 250,
+});
+redis.on("error", () => {});  // reported per call below
+
+// Page entries hold Buffers and Maps, which plain JSON would flatten.
+function encode(value) {
+  return JSON.stringify(value, function (key, v) {
+    const raw = this[key];
+    if (Buffer.isBuffer(raw)) return { $buffer: raw.toString("base64") };
+    if (raw instanceof Map) return { $map: [...raw] };
+    return v;
+  });
+}
+
+function decode(text) {
+  return JSON.parse(text, (_, v) => {
+    if (!v || typeof v !== "object") return v;
+    if (typeof v.$buffer === "string") return Buffer.from(v.$buffer, "base64");
+    if (Array.isArray(v.$map)) return new Map(v.$map);
+    return v;
+  });
+}
+
+function warn(err) {
+  console.error("[CacheHandler]", err instanceof Error ? err.message : err);
+}
+
+// Tags a page entry carries in its headers rather than in the set() context.
+function headerTags(value) {
+  const header = value && value.headers && value.headers["x-next-cache-tags"];
+  return typeof header === "string" ? header.split(",") : [];
+}
+
+module.exports = class CacheHandler {
+  async get(key, ctx) {
+    try {
+      const text = await redis.get(`${PREFIX}entry:${key}`);
+      if (!text) return null;
+      const entry = decode(text);
+      const tags = [...new Set([...entry.tags, ...((ctx && ctx.tags) || []), ...((ctx && ctx.softTags) || [])])];
+      if (tags.length) {
+        const revalidated = await redis.mget(tags.map(tag => `${PREFIX}tag:${tag}`));
+        if (revalidated.some(at => at && Number(at) >= entry.lastModified)) return null;
+      }
+      return { value: entry.value, lastModified: entry.lastModified };
+    } catch (err) {
+      warn(err);
+      return null;
+    }
+  }
+
+  async set(key, value, ctx) {
+    try {
+      if (!value) {
+        await redis.del(`${PREFIX}entry:${key}`);
+        return;
+      }
+      const tags = [...new Set([...((ctx && ctx.tags) || []), ...headerTags(value)])];
+      await redis.set(`${PREFIX}entry:${key}`, encode({ value, lastModified: Date.now(), tags }), "EX", TTL);
+    } catch (err) {
+      warn(err);
+    }
+  }
+
+  async revalidateTag(tags) {
+    tags = [tags].flat();
+    if (!tags.length) return;
+    try {
+      const now = String(Date.now());
+      const multi = redis.multi();
+      for (const tag of tags) multi.set(`${PREFIX}tag:${tag}`, now, "EX", TTL);
+      await multi.exec();
+    } catch (err) {
+      warn(err);
+    }
+  }
+
+  resetRequestCache() {}
+};
+'''
@@ -0,0 +1,18 @@
+"""src/lib/cache-json.ts"""
+
+CONTENT = '''// JSON for cached values, shared by the Redis listing cache (src/lib/cache.ts)
+// and the tagged data cache (src/lib/data-cache.ts). Dates are tagged on the
+// way in and revived on the way out, so cached Prisma rows keep their types.
+export function encode(value: unknown): string {
+  return JSON.stringify(value, function (this: Record<string, unknown>, key, v) {
+    const raw = this[key];
+    return raw instanceof Date ? { $date: raw.getTime() } : v;
+  });
+}
+
+export function decode<T>(text: string): T {
+  return JSON.parse(text, (_, v) =>
+    v && typeof v === "object" && typeof v.$date === "number" && Object.keys(v).length === 1 ? new Date(v.$date) : v
+  );
+}
+'''
@@ -0,0 +1,191 @@
+"""src/lib/cache.ts"""
+
+CONTENT = '''// Redis read-through cache for the public listings: active campaigns (GET
+// /api/campaigns, the briefs page) and top creators (the discover page).
+//
+// - Keys are per listing, niche filter and page size, e.g.
+//   listing:campaigns:n=beauty:20 or listing:campaigns:all:20. Each key is
+//   registered under its filter's tag, and invalidateCampaigns() or
+//   invalidateCreators() clear the unfiltered listing and the listings
+//   filtered to the niches a write touched.
+// - Concurrent misses load once. Callers in the same process share one
+//   promise. Across PM2 workers, one holds a short lock while the rest poll
+//   for its result.
+// - A load that started before an invalidation is not stored. Each tag has
+//   a generation counter that is read before the load and checked when
+//   storing.
+// - Redis trouble never fails a page: every error falls through to the
+//   database.
+//
+// Hit, load and wait counts per listing are kept in the listing:stats hash.
+import IORedis from "ioredis";
+import { decode, encode } from "@/lib/cache-json";
+
+export const TTL = {
+  campaigns: parseInt(process.env.CAMPAIGN_CACHE_TTL || "60"),
+  creators: parseInt(process.env.CREATOR_CACHE_TTL || "300"),
+};
+export type Listing = keyof typeof TTL;
+
+const PREFIX = "listing:";
+const STATS = `${PREFIX}stats`;
+const LOCK_MS = 5000;
+const WAIT_MS = 2000;
+const POLL_MS = 25;
+
+const globalForCache = globalThis as unknown as { listingRedis: IORedis | undefined };
+
+// Same variables as the scoring queue in src/lib/scoring.ts.
+const redis =
+  globalForCache.listingRedis ??
+  new IORedis({
+    host: process.env.REDIS_HOST || "127.0.0.1",
+    port: parseInt(process.env.REDIS_PORT || "6379"),
+    enableOfflineQueue: false,
+    maxRetriesPerRequest: 1,
+    commandTimeout: 250,
+  });
+redis.on("error", () => {});  // reported per call below
+
+if (process.env.NODE_ENV !== "production") globalForCache.listingRedis = redis;
+
+const inflight = new Map<string, Promise<unknown>>();
+
+// Stores the value unless a tag's generation moved since the load began, then
+// registers the key under its tags and releases the lock.
+// KEYS: value key, lock key, then a tag set and its generation key per tag.
+// ARGV: value, ttl, lock token, then the generation read before loading per tag.
+const STORE = `
+local tags = (#KEYS - 2) / 2
+for i = 1, tags do
+  if (redis.call("GET", KEYS[2 + tags + i]) or "0") ~= ARGV[3 + i] then
+    if redis.call("GET", KEYS[2]) == ARGV[3] then redis.call("DEL", KEYS[2]) end
+    return 0
+  end
+end
+redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[2])
+for i = 1, tags do
+  redis.call("SADD", KEYS[2 + i], KEYS[1])
+  redis.call("EXPIRE", KEYS[2 + i], ARGV[2] * 2)
+end
+if redis.call("GET", KEYS[2]) == ARGV[3] then redis.call("DEL", KEYS[2]) end
+return 1
+`;
+
+const RELEASE = `if redis.call("GET", KEYS[1]) == ARGV[1] then return redis.call("DEL", KEYS[1]) end return 0`;
+
+function nicheKey(niche?: string | null): string {
+  return niche ? `n=${encodeURIComponent(niche).slice(0, 64)}` : "all";
+}
+
+function tagKeys(listing: Listing, niches: (string | null)[]) {
+  const names = [...new Set(niches.map(nicheKey))];
+  return {
+    sets: names.map(n => `${PREFIX}tag:${listing}:${n}`),
+    gens: names.map(n => `${PREFIX}gen:${listing}:${n}`),
+  };
+}
+
+function warn(err: unknown) {
+  console.error("[Cache]", err instanceof Error ? err.message : err);
+}
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * The cached value of `load()` for one page of a listing. `niche` is the
+ * listing's filter (null for all niches), and `variant` separates keys that
+ * share a niche, such as the page size.
+ */
+export function cachedListing<T>(
+  listing: Listing,
+  niche: string | null | undefined,
+  variant: string | number,
+  load: () => Promise<T>
+): Promise<T> {
+  const key = `${PREFIX}${listing}:${nicheKey(niche)}:${variant}`;
+  const shared = inflight.get(key);
+  if (shared) return shared as Promise<T>;
+  const promise = readThrough(listing, key, niche ?? null, load)
+    .finally(() => inflight.delete(key));
+  inflight.set(key, promise);
+  return promise;
+}
+
+async function readThrough<T>(listing: Listing, key: string, niche: string | null, load: () => Promise<T>): Promise<T> {
+  const lock = `${key}:lock`;
+  const token = Math.random().toString(36).slice(2);
+  const { sets, gens } = tagKeys(listing, [niche]);
+  let generations: (string | null)[];
+  try {
+    const hit = await redis.get(key);
+    if (hit) {
+      redis.hincrby(STATS, `${listing}:hit`, 1).catch(() => {});
+      return decode<T>(hit);
+    }
+    const [[, acquired], [, current]] = (await redis.pipeline().set(lock, token, "PX", LOCK_MS, "NX").mget(...gens).exec())!;
+    if (!acquired) return await waitFor(listing, key, lock, load);
+    generations = current as (string | null)[];
+  } catch (err) {
+    warn(err);
+    return load();
+  }
+
+  let value: T;
+  try {
+    value = await load();
+  } catch (err) {
+    redis.eval(RELEASE, 1, lock, token).catch(() => {});
+    throw err;
+  }
+  redis
+    .eval(STORE, 2 + sets.length * 2, key, lock, ...sets, ...gens,
+      encode(value), jitter(TTL[listing]), token, ...generations.map(g => g ?? "0"))
+    .then(() => redis.hincrby(STATS, `${listing}:load`, 1))
+    .catch(warn);
+  return value;
+}
+
+// Another process is loading: poll for its result. Load here instead if it
+// gives up (lock released without a value) or takes longer than WAIT_MS.
+async function waitFor<T>(listing: Listing, key: string, lock: string, load: () => Promise<T>): Promise<T> {
+  redis.hincrby(STATS, `${listing}:wait`, 1).catch(() => {});
+  for (let waited = 0; waited < WAIT_MS; waited += POLL_MS) {
+    await sleep(POLL_MS);
+    const [[, value], [, locked]] = (await redis.pipeline().get(key).exists(lock).exec())!;
+    if (value) return decode<T>(value as string);
+    if (!locked) break;
+  }
+  return load();
+}
+
+// Spread expiries so keys written together do not all miss together.
+function jitter(ttl: number): number {
+  return ttl + Math.floor(Math.random() * ttl * 0.1);
+}
+
+async function invalidate(listing: Listing, niches: string[]) {
+  const { sets, gens } = tagKeys(listing, [null, ...niches]);
+  try {
+    const members = await redis.sunion(...sets);
+    const pipeline = redis.pipeline();
+    for (const gen of gens) pipeline.incr(gen);
+    if (members.length) pipeline.unlink(...members);
+    pipeline.unlink(...sets);
+    await pipeline.exec();
+  } catch (err) {
+    warn(err);  // the TTL bounds staleness
+  }
+}
+
+// Call after a campaign is created or changes status, with its niches.
+export function invalidateCampaigns(niches: string[]) {
+  return invalidate("campaigns", niches);
+}
+
+// Call after a creator's aiScore, niches or profile change, with their niches
+// (old and new if they changed).
+export function invalidateCreators(niches: string[]) {
+  return invalidate("creators", niches);
+}
+'''
@@ -0,0 +1,119 @@
+"""src/app/api/campaigns/[id]/proposals/route.ts"""
+from . import _swap
+
+CONTENT = '''import { NextRequest, NextResponse } from "next/server";
+import { getServerSession } from "next-auth";
+import { authOptions } from "@/lib/auth";
+import { db } from "@/lib/db";
+import { sessionCreatorId } from "@/lib/session";
+import { enqueueScoring } from "@/lib/scoring";
+import { decodeCursor, keysetWhere, pageSize, toPage } from "@/lib/pagination";
+
+export async function GET(req: NextRequest, { params }: { params: { id: string } }) {
+  try {
+    const session = await getServerSession(authOptions);
+    if (!session) return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
+
+    const { searchParams } = new URL(req.url);
+    const take = pageSize(searchParams.get("limit"));
+    const cursor = decodeCursor(searchParams.get("cursor"));
+    const rows = await db.proposal.findMany({
+      where: { campaignId: params.id, ...keysetWhere("aiScore", cursor) },
+      include: { creator: { include: { user: { select: { name: true, email: true, image: true } } } } },
+      orderBy: [{ aiScore: "desc" }, { id: "desc" }],
+      take: take + 1,
+    });
+    return NextResponse.json(toPage(rows, take, "aiScore"));
+  } catch (error) {
+    return NextResponse.json({ error: "Failed to fetch proposals" }, { status: 500 });
+  }
+}
+
+export async function POST(req: NextRequest, { params }: { params: { id: string } }) {
+  try {
+    const session = await getServerSession(authOptions);
+    if (!session) return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
+
+    const creatorId = await sessionCreatorId(session);
+    if (!creatorId) return NextResponse.json({ error: "Creator profile not found" }, { status: 404 });
+
+    const campaign = await db.campaign.findUnique({ where: { id: params.id }, select: { id: true } });
+    if (!campaign) return NextResponse.json({ error: "Campaign not found" }, { status: 404 });
+
+    const body = await req.json();
+
+    const proposal = await db.proposal.create({
+      data: {
+        campaignId: params.id,
+        creatorId,
+        pitch: body.pitch,
+        rate: body.rate,
+      },
+    });
+
+    // Scored in the background by the scoring worker; the creator is notified
+    // when aiScore lands. A queue outage must not fail the submit.
+    await enqueueScoring(proposal.id).catch(e => console.error("Failed to queue AI scoring:", e));
+    return NextResponse.json(proposal, { status: 201 });
+  } catch (error) {
+    return NextResponse.json({ error: "Failed to create proposal" }, { status: 500 });
+  }
+}
+'''
+
+CREATE = '''    const proposal = await db.proposal.create({
+      data: {
+        campaignId: params.id,
+        creatorId,
+        pitch: body.pitch,
+        rate: body.rate,
+      },
+    });
+'''
+
+# With ``counters`` the insert and the counter increments share a transaction.
+COUNTED_CREATE = '''    const proposal = await db.$transaction(async (tx) => {
+      const created = await tx.proposal.create({
+        data: {
+          campaignId: params.id,
+          creatorId,
+          pitch: body.pitch,
+          rate: body.rate,
+        },
+      });
+      await proposalCreated(tx, created);
+      return created;
+    });
+'''
+
+
+# With ``isr`` a new proposal revalidates the data-cache tags it moves: the
+# campaign listings (proposal counts) and both parties' stats.
+CAMPAIGN = '''    const campaign = await db.campaign.findUnique({ where: { id: params.id }, select: { id: true } });
+'''
+
+ISR_CAMPAIGN = '''    const campaign = await db.campaign.findUnique({ where: { id: params.id }, select: { id: true, brandId: true, niche: true } });
+'''
+
+CREATED = '''    return NextResponse.json(proposal, { status: 201 });
+'''
+
+ISR_CREATED = '''    revalidateCampaigns(campaign.niche);
+    revalidateCreatorStats(creatorId);
+    revalidateBrandStats(campaign.brandId);
+'''
+
+
+def render(options):
+    text = CONTENT
+    if options.get('counters'):
+        text = _swap(text, 'import { enqueueScoring } from "@/lib/scoring";\n',
+                     'import { enqueueScoring } from "@/lib/scoring";\nimport { proposalCreated } from "@/lib/counters";\n')
+        text = _swap(text, CREATE, COUNTED_CREATE)
+    if options.get('isr'):
+        text = _swap(text, 'import { decodeCursor',
+                     'import { revalidateBrandStats, revalidateCampaigns, revalidateCreatorStats } from "@/lib/data-cache";\n'
+                     'import { decodeCursor')
+        text = _swap(text, CAMPAIGN, ISR_CAMPAIGN)
+        text = _swap(text, CREATED, ISR_CREATED + CREATED)
+    return text
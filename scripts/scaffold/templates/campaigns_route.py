@@ -0,0 +1,102 @@
+"""src/app/api/campaigns/route.ts"""
+from . import _swap
+
+CONTENT = '''import { NextRequest, NextResponse } from "next/server";
+import { getServerSession } from "next-auth";
+import { authOptions } from "@/lib/auth";
+import { db } from "@/lib/db";
+import { sessionBrandId } from "@/lib/session";
+import { decodeCursor, keysetWhere, pageSize, toPage } from "@/lib/pagination";
+
+export async function GET(req: NextRequest) {
+  try {
+    const { searchParams } = new URL(req.url);
+    const niche = searchParams.get("niche");
+    const take = pageSize(searchParams.get("limit"));
+    const cursor = decodeCursor(searchParams.get("cursor"));
+    const rows = await db.campaign.findMany({
+      where: { status: "ACTIVE", ...(niche ? { niche: { has: niche } } : {}), ...keysetWhere("createdAt", cursor) },
+      include: { brand: { include: { user: { select: { name: true, email: true } } } }, _count: { select: { proposals: true } } },
+      orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+      take: take + 1,
+    });
+    return NextResponse.json(toPage(rows, take, "createdAt"));
+  } catch (error) {
+    return NextResponse.json({ error: "Failed to fetch campaigns" }, { status: 500 });
+  }
+}
+
+export async function POST(req: NextRequest) {
+  try {
+    const session = await getServerSession(authOptions);
+    if (!session) return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
+
+    const brandId = await sessionBrandId(session);
+    if (!brandId) return NextResponse.json({ error: "Brand not found" }, { status: 404 });
+
+    const body = await req.json();
+    const campaign = await db.campaign.create({
+      data: {
+        brandId,
+        title: body.title,
+        description: body.description,
+        budget: body.budget,
+        deadline: new Date(body.deadline),
+        niche: body.niche || [],
+        platforms: body.platforms || [],
+        requirements: body.requirements,
+      },
+    });
+    return NextResponse.json(campaign, { status: 201 });
+  } catch (error) {
+    return NextResponse.json({ error: "Failed to create campaign" }, { status: 500 });
+  }
+}
+'''
+
+LIST = '''    const rows = await db.campaign.findMany({
+      where: { status: "ACTIVE", ...(niche ? { niche: { has: niche } } : {}), ...keysetWhere("createdAt", cursor) },
+      include: { brand: { include: { user: { select: { name: true, email: true } } } }, _count: { select: { proposals: true } } },
+      orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+      take: take + 1,
+    });
+'''
+
+# With ``cache`` the first page per niche and page size is read through Redis
+# (src/lib/cache.ts) and creating a campaign invalidates its niches.
+CACHED_LIST = '''    const query = () => db.campaign.findMany({
+      where: { status: "ACTIVE", ...(niche ? { niche: { has: niche } } : {}), ...keysetWhere("createdAt", cursor) },
+      include: { brand: { include: { user: { select: { name: true, email: true } } } }, _count: { select: { proposals: true } } },
+      orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+      take: take + 1,
+    });
+    const rows = cursor ? await query() : await cachedListing("campaigns", niche, `api:${take}`, query);
+'''
+
+CREATED = '''    return NextResponse.json(campaign, { status: 201 });
+'''
+
+CACHED_CREATED = '''    await invalidateCampaigns(campaign.niche);
+    return NextResponse.json(campaign, { status: 201 });
+'''
+
+
+# With ``isr`` creating a campaign also revalidates the data-cache tags of the
+# listings and the brand's stats (src/lib/data-cache.ts).
+ISR_CREATED = '''    revalidateCampaigns(campaign.niche);
+    revalidateBrandStats(brandId);
+'''
+
+
+def render(options):
+    text = CONTENT
+    if options.get('cache'):
+        text = _swap(text, 'import { decodeCursor',
+                     'import { cachedListing, invalidateCampaigns } from "@/lib/cache";\nimport { decodeCursor')
+        text = _swap(text, LIST, CACHED_LIST)
+        text = _swap(text, CREATED, CACHED_CREATED)
+    if options.get('isr'):
+        text = _swap(text, 'import { decodeCursor',
+                     'import { revalidateBrandStats, revalidateCampaigns } from "@/lib/data-cache";\nimport { decodeCursor')
+        text = _swap(text, CREATED, ISR_CREATED + CREATED)
+    return text
@@ -0,0 +1,168 @@
+"""vps-configs/check_pool.py"""
+
+CONTENT = '''#!/usr/bin/env python3
+"""Check the Postgres connection budget before a deploy.
+
+    python3 vps-configs/check_pool.py [--app-dir DIR] [--ini PATH] [--max-connections N]
+
+Reads PgBouncer's config, DATABASE_URL and DIRECT_URL (environment, then
+the app's .env files, as Next.js loads them), the PM2 apps in
+vps-configs/ecosystem.config.js and max_connections from the live server
+over DIRECT_URL. Fails if:
+
+* the pooler may open more server connections than Postgres has left
+  after superuser and direct (migrate, psql) connections;
+* the PM2 processes' Prisma pools, with one extra web worker during a
+  rolling reload, add up to more clients than max_client_conn;
+* DATABASE_URL does not go through the pooler with pgbouncer=true and a
+  connection_limit, or DIRECT_URL is missing or does.
+
+Standard library only; the live server is queried with psql.
+"""
+import argparse
+import configparser
+import json
+import os
+import subprocess
+import sys
+import urllib.parse
+
+APP_DIR = '/var/www/gravy-cc-deploy'
+INI_PATHS = ('/etc/pgbouncer/pgbouncer.ini', 'vps-configs/pgbouncer.ini')
+ENV_FILES = ('.env', '.env.production', '.env.local', '.env.production.local')
+DIRECT_RESERVED = 7
+NO_DATABASE = ('novaclio-socket',)
+PRISMA_PARAMS = ('schema', 'pgbouncer', 'connection_limit', 'pool_timeout', 'statement_cache_size')
+
+
+def load_env(app_dir):
+    """Variables as the app sees them: later .env files override earlier ones, the environment wins."""
+    env = {}
+    for name in ENV_FILES:
+        try:
+            with open(os.path.join(app_dir, name)) as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            continue
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.removeprefix('export ').split('=', 1)
+            env[key.strip()] = value.strip().strip('"').strip("'")
+    env.update(os.environ)
+    return env
+
+
+def load_ini(app_dir, path=None):
+    for candidate in [path] if path else INI_PATHS:
+        full = os.path.join(app_dir, candidate)
+        if os.path.exists(full):
+            parser = configparser.ConfigParser(inline_comment_prefixes=(';', '#'), interpolation=None)
+            parser.read(full)
+            return full, parser['pgbouncer']
+    sys.exit(f'no pgbouncer.ini found (looked in {", ".join(INI_PATHS)})')
+
+
+def pm2_apps(app_dir):
+    script = ('const c = require(require("path").resolve("vps-configs/ecosystem.config.js"));'
+              'console.log(JSON.stringify(c.apps.map(a => [a.name, a.instances || 1, a.exec_mode || "fork"])))')
+    out = subprocess.run(['node', '-e', script], cwd=app_dir, capture_output=True, text=True)
+    if out.returncode:
+        sys.exit(f'could not load the PM2 config: {out.stderr.strip()}')
+    apps = []
+    for name, instances, mode in json.loads(out.stdout):
+        if instances in ('max', 0, -1):
+            instances = os.cpu_count()
+        apps.append((name, int(instances), mode))
+    return apps
+
+
+def server_limits(direct_url):
+    parts = urllib.parse.urlsplit(direct_url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query) if k not in PRISMA_PARAMS]
+    url = urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+    sql = "SELECT current_setting('max_connections'), current_setting('superuser_reserved_connections');"
+    try:
+        out = subprocess.run(['psql', url, '-X', '-q', '-At', '-F', ' ', '-c', sql], capture_output=True, text=True)
+    except FileNotFoundError:
+        sys.exit('psql is not installed; pass --max-connections to check without the server')
+    if out.returncode:
+        sys.exit(f'psql failed: {out.stderr.strip()}')
+    max_connections, reserved = out.stdout.split()
+    return int(max_connections), int(reserved)
+
+
+def check(env, ini, apps, max_connections, superuser_reserved, direct_reserved=DIRECT_RESERVED):
+    """``(ok, message)`` results for each rule."""
+    results = []
+    port = ini.getint('listen_port', 6432)
+
+    url = env.get('DATABASE_URL')
+    if not url:
+        results.append((False, 'DATABASE_URL is not set'))
+        limit = None
+    else:
+        parts = urllib.parse.urlsplit(url)
+        params = dict(urllib.parse.parse_qsl(parts.query))
+        results.append((parts.port == port, f'DATABASE_URL uses port {parts.port}, pgbouncer listens on {port}'))
+        results.append((params.get('pgbouncer') == 'true', 'DATABASE_URL has pgbouncer=true'))
+        limit = int(params['connection_limit']) if params.get('connection_limit', '').isdigit() else None
+        results.append((limit is not None, f'DATABASE_URL connection_limit={params.get("connection_limit", "unset")}'))
+
+    direct = env.get('DIRECT_URL')
+    if not direct:
+        results.append((False, 'DIRECT_URL is not set (prisma migrate deploy needs a direct connection)'))
+    else:
+        direct_port = urllib.parse.urlsplit(direct).port or 5432
+        results.append((direct_port != port, f'DIRECT_URL uses port {direct_port}, bypassing pgbouncer'))
+
+    pool = ini.getint('default_pool_size', 20) + ini.getint('reserve_pool_size', 0)
+    capped = ini.getint('max_db_connections', 0)
+    server = min(pool, capped) if capped else pool
+    available = max_connections - superuser_reserved - direct_reserved
+    results.append((server <= available,
+                    f'pgbouncer opens up to {server} server connections; Postgres has {available} '
+                    f'({max_connections} max - {superuser_reserved} superuser - {direct_reserved} direct)'))
+
+    if limit is not None:
+        processes = sum(n + (1 if mode == 'cluster' else 0) for name, n, mode in apps if name not in NO_DATABASE)
+        clients = processes * limit
+        max_client = ini.getint('max_client_conn', 100)
+        detail = ', '.join(f'{name} x{n}' for name, n, _ in apps if name not in NO_DATABASE)
+        results.append((clients <= max_client,
+                        f'{processes} processes ({detail}, +1 per cluster during reload) x connection_limit '
+                        f'{limit} = {clients} clients; max_client_conn {max_client}'))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the Postgres connection budget before a deploy')
+    parser.add_argument('--app-dir', default=APP_DIR)
+    parser.add_argument('--ini', help=f'pgbouncer.ini (default: first of {", ".join(INI_PATHS)})')
+    parser.add_argument('--max-connections', type=int, help='skip querying the server')
+    parser.add_argument('--superuser-reserved', type=int, default=3, help='with --max-connections')
+    parser.add_argument('--direct-reserved', type=int, default=DIRECT_RESERVED,
+                        help='connections kept for migrate and psql sessions')
+    args = parser.parse_args(argv)
+
+    env = load_env(args.app_dir)
+    path, ini = load_ini(args.app_dir, args.ini)
+    apps = pm2_apps(args.app_dir)
+    if args.max_connections:
+        limits = args.max_connections, args.superuser_reserved
+    elif env.get('DIRECT_URL'):
+        limits = server_limits(env['DIRECT_URL'])
+    else:
+        sys.exit('DIRECT_URL is not set; pass --max-connections to check without the server')
+
+    print(f'pgbouncer config: {path}')
+    results = check(env, ini, apps, *limits, args.direct_reserved)
+    for ok, message in results:
+        print(f'{"ok  " if ok else "FAIL"}  {message}')
+    return 0 if all(ok for ok, _ in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+'''
@@ -0,0 +1,71 @@
+"""src/lib/counters.ts"""
+
+CONTENT = '''// Denormalised counters behind src/lib/stats.ts. Every proposal write that
+// creates a row or moves its status calls one of these with the same
+// transaction client, so the counters commit or roll back with the write.
+// The Paystack webhook does the same arithmetic inside its single UPDATE;
+// keep the two in step.
+import { Prisma } from "@prisma/client";
+import { db } from "@/lib/db";
+
+type Tx = Prisma.TransactionClient;
+type Counted = { campaignId: string; creatorId: string; rate: number; status: string };
+
+// Creator columns that track proposals currently in a given status.
+const BUCKETS: Record<string, { count: string; total: string }> = {
+  ACCEPTED: { count: "acceptedCount", total: "pendingTotal" },
+  COMPLETED: { count: "completedCount", total: "earnedTotal" },
+};
+
+function bump(data: Record<string, { increment: number }>, status: string, rate: number, sign: number) {
+  const bucket = BUCKETS[status];
+  if (!bucket) return;
+  data[bucket.count] = { increment: (data[bucket.count]?.increment ?? 0) + sign };
+  data[bucket.total] = { increment: (data[bucket.total]?.increment ?? 0) + sign * rate };
+}
+
+export async function proposalCreated(tx: Tx, p: Counted) {
+  const data: Record<string, { increment: number }> = { proposalCount: { increment: 1 } };
+  bump(data, p.status, p.rate, 1);
+  await tx.campaign.update({ where: { id: p.campaignId }, data: { proposalCount: { increment: 1 } } });
+  await tx.creator.update({ where: { id: p.creatorId }, data });
+}
+
+export async function proposalStatusChanged(tx: Tx, p: Counted, from: string, to: string) {
+  if (from === to) return;
+  const data: Record<string, { increment: number }> = {};
+  bump(data, from, p.rate, -1);
+  bump(data, to, p.rate, 1);
+  if (Object.keys(data).length) await tx.creator.update({ where: { id: p.creatorId }, data });
+}
+
+// Recompute every counter from the proposal rows. Run after bulk imports or
+// manual SQL, or periodically as a safety net; returns rows updated per table.
+export async function reconcileCounters() {
+  return db.$transaction([
+    db.$executeRaw`
+      UPDATE "Creator" c SET
+        "proposalCount" = s.proposals, "acceptedCount" = s.accepted, "completedCount" = s.completed,
+        "earnedTotal" = s.earned, "pendingTotal" = s.pending
+      FROM (
+        SELECT cr.id,
+          count(p.id)::int AS proposals,
+          (count(p.id) FILTER (WHERE p.status = 'ACCEPTED'))::int AS accepted,
+          (count(p.id) FILTER (WHERE p.status = 'COMPLETED'))::int AS completed,
+          COALESCE(sum(p.rate) FILTER (WHERE p.status = 'COMPLETED'), 0) AS earned,
+          COALESCE(sum(p.rate) FILTER (WHERE p.status = 'ACCEPTED'), 0) AS pending
+        FROM "Creator" cr LEFT JOIN "Proposal" p ON p."creatorId" = cr.id
+        GROUP BY cr.id
+      ) s
+      WHERE s.id = c.id`,
+    db.$executeRaw`
+      UPDATE "Campaign" c SET "proposalCount" = s.proposals
+      FROM (
+        SELECT ca.id, count(p.id)::int AS proposals
+        FROM "Campaign" ca LEFT JOIN "Proposal" p ON p."campaignId" = ca.id
+        GROUP BY ca.id
+      ) s
+      WHERE s.id = c.id`,
+  ]);
+}
+'''
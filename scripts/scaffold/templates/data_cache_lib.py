@@ -0,0 +1,70 @@
+"""src/lib/data-cache.ts"""
+
+CONTENT = '''// Tagged Next.js data cache for server-rendered pages. Page data is read
+// through unstable_cache, so most loads come from the cache, and each entry
+// carries tags that the write handlers pass to revalidateTag:
+//
+//   campaigns:all, campaigns:niche:<n>  active campaign listings (briefs)
+//   creators:all, creators:niche:<n>    top creators (discover)
+//   creator:<id>:stats                  creator dashboard and earnings totals
+//   brand:<id>:stats                    brand dashboard totals
+//
+// An untagged write still shows up once the page's revalidation window below
+// runs out. Entries and revalidated tags live in Redis (cache-handler.js,
+// set as next.config.ts's cacheHandler), so a revalidateTag() from the web
+// worker that handled a write reaches every worker in the PM2 cluster.
+import { revalidateTag, unstable_cache } from "next/cache";
+import { decode, encode } from "@/lib/cache-json";
+import { brandStats, creatorStats } from "@/lib/stats";
+
+// Seconds before a cached entry is refreshed even without a revalidateTag.
+export const REVALIDATE = {
+  briefs: 60,
+  discover: 300,
+  stats: 300,
+};
+
+export const tags = {
+  campaigns: (niche?: string | null) => (niche ? `campaigns:niche:${niche}` : "campaigns:all"),
+  creators: (niche?: string | null) => (niche ? `creators:niche:${niche}` : "creators:all"),
+  creatorStats: (creatorId: string) => `creator:${creatorId}:stats`,
+  brandStats: (brandId: string) => `brand:${brandId}:stats`,
+};
+
+/**
+ * `load()` through the data cache under `key`, tagged with `entryTags`.
+ * unstable_cache stores results as JSON, so values go through the Date-aware
+ * encoding in cache-json.ts.
+ */
+export function cached<T>(load: () => Promise<T>, key: string[], entryTags: string[], revalidate: number): Promise<T> {
+  return unstable_cache(async () => encode(await load()), key, { tags: entryTags, revalidate })().then(text => decode<T>(text));
+}
+
+export function cachedCreatorStats(creatorId: string) {
+  return cached(() => creatorStats(creatorId), ["creator-stats", creatorId], [tags.creatorStats(creatorId)], REVALIDATE.stats);
+}
+
+export function cachedBrandStats(brandId: string) {
+  return cached(() => brandStats(brandId), ["brand-stats", brandId], [tags.brandStats(brandId)], REVALIDATE.stats);
+}
+
+// Call after a proposal is created or changes status or amount.
+export function revalidateCreatorStats(creatorId: string) {
+  revalidateTag(tags.creatorStats(creatorId));
+}
+
+// Call after a brand's campaign is created or changes status, or gains a proposal.
+export function revalidateBrandStats(brandId: string) {
+  revalidateTag(tags.brandStats(brandId));
+}
+
+// Call after a campaign is created, changes status or gains a proposal.
+export function revalidateCampaigns(niches: string[]) {
+  for (const tag of [tags.campaigns(), ...niches.map(n => tags.campaigns(n))]) revalidateTag(tag);
+}
+
+// Call after a creator's aiScore, niches or profile change (old and new niches).
+export function revalidateCreators(niches: string[]) {
+  for (const tag of [tags.creators(), ...niches.map(n => tags.creators(n))]) revalidateTag(tag);
+}
+'''
@@ -0,0 +1,276 @@
+"""vps-configs/deploy.py"""
+
+CONTENT = '''#!/usr/bin/env python3
+"""Novaclio deploy runner.
+
+    python3 vps-configs/deploy.py [--app-dir DIR] [--force STEP ...] [--all] [--dry-run] [--no-pull]
+                                  [--no-cache] [--cache-dir DIR] [--cache-budget SIZE]
+
+Runs the same steps as deploy.sh, but each step records a hash of its
+inputs after it succeeds and is skipped on the next deploy if that hash is
+unchanged (and its output is still there). A step's hash covers the hashes
+of the steps it depends on, so a new package-lock.json reruns everything
+downstream of npm ci. Steps whose dependencies are done run concurrently:
+migrations apply while the client is generated and the app builds.
+
+Steps with cacheable outputs (the Prisma client and .next) store them in
+a content-addressed build cache under their input hash (see
+build_cache.py). When a step's inputs match a cached entry its outputs are
+hardlinked back instead of rebuilt, so rolling back is
+
+    git checkout <commit> && python3 vps-configs/deploy.py --no-pull
+
+a restore and a PM2 reload. .next/cache is copied back before a build
+that does miss, so even a real rebuild starts warm.
+
+Per-step timings are printed and appended to .deploy/history.jsonl.
+Standard library only, so it runs on the bare VPS Python.
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from build_cache import Cache, clear
+
+APP_DIR = '/var/www/gravy-cc-deploy'
+STATE_DIR = '.deploy'
+SKIP_DIRS = {'node_modules', '.next', '.git', STATE_DIR, '__pycache__'}
+
+
+class Step:
+    def __init__(self, name, command, inputs=(), deps=(), output=None, always=False, cache=(), scratch=None):
+        self.name = name
+        self.command = command
+        self.inputs = inputs
+        self.deps = deps
+        self.output = output
+        self.always = always
+        self.cache = cache
+        self.scratch = scratch
+
+
+STEPS = [
+    Step('pull', 'git pull origin main', always=True),
+    Step('install', 'npm ci --omit=dev', ['package.json', 'package-lock.json'], ['pull'],
+         output='node_modules'),
+    Step('generate', 'npx prisma generate', ['prisma/schema.prisma'], ['install'],
+         output='node_modules/.prisma/client', cache=['node_modules/.prisma/client']),
+    Step('check-pool', 'python3 vps-configs/check_pool.py --app-dir .', deps=['pull'], always=True),
+    Step('migrate', 'npx prisma migrate deploy', ['prisma/schema.prisma', 'prisma/migrations'],
+         ['install', 'check-pool']),
+    Step('search', 'python3 vps-configs/search_index.py migrate --app-dir .',
+         ['prisma/search.sql', 'vps-configs/search_index.py'], ['migrate']),
+    Step('build', 'npm run build',
+         ['src', 'public', 'next.config.ts', 'next.config.js', 'next.config.mjs', 'cache-handler.js', 'tsconfig.json',
+          'tailwind.config.ts', 'postcss.config.js', '.env.production'],
+         ['install', 'generate'], output='.next/BUILD_ID', cache=['.next'], scratch='.next/cache'),
+    Step('worker', 'npx --yes esbuild@0.24.2 src/workers/scoring-worker.ts --bundle --platform=node '
+         '--target=node20 --format=cjs --packages=external --outfile=dist-workers/scoring-worker.js',
+         ['src/workers', 'src/lib', 'tsconfig.json', 'package-lock.json'], ['install'],
+         output='dist-workers/scoring-worker.js'),
+    Step('reload', 'pm2 reload vps-configs/ecosystem.config.js --update-env || pm2 start vps-configs/ecosystem.config.js',
+         ['vps-configs/ecosystem.config.js', 'dist-socket', 'dist-workers'],
+         ['check-pool', 'migrate', 'search', 'build', 'worker']),
+]
+
+
+class Hasher:
+    """Content hashes of files and trees, reusing digests whose size and mtime are unchanged."""
+
+    def __init__(self, root, cache):
+        self.root = root
+        self.cache = cache
+        self.lock = threading.Lock()
+
+    def file(self, rel):
+        path = os.path.join(self.root, rel)
+        st = os.stat(path)
+        with self.lock:
+            hit = self.cache.get(rel)
+        if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            return hit[2]
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        digest = h.hexdigest()
+        with self.lock:
+            self.cache[rel] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def files(self, rel):
+        path = os.path.join(self.root, rel)
+        if os.path.isfile(path):
+            yield rel
+            return
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for name in sorted(filenames):
+                yield os.path.relpath(os.path.join(dirpath, name), self.root)
+
+    def inputs(self, paths):
+        h = hashlib.sha256()
+        for rel in paths:
+            if not os.path.exists(os.path.join(self.root, rel)):
+                h.update(f'missing {rel}\\n'.encode())
+                continue
+            for f in self.files(rel):
+                h.update(f'{f}\\0{self.file(f)}\\n'.encode())
+        return h.hexdigest()
+
+
+def load_state(root):
+    try:
+        with open(os.path.join(root, STATE_DIR, 'state.json')) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {'steps': {}, 'files': {}}
+
+
+def save_state(root, state):
+    os.makedirs(os.path.join(root, STATE_DIR), exist_ok=True)
+    path = os.path.join(root, STATE_DIR, 'state.json')
+    with open(path + '.tmp', 'w') as f:
+        json.dump(state, f)
+    os.replace(path + '.tmp', path)
+
+
+_print_lock = threading.Lock()
+
+
+def log(step, message):
+    with _print_lock:
+        print(f'[{step:8}] {message}', flush=True)
+
+
+def run(step, root):
+    proc = subprocess.Popen(step.command, shell=True, cwd=root, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in proc.stdout:
+        log(step.name, line.rstrip())
+    return proc.wait()
+
+
+def deploy(root, force=(), dry_run=False, pull=True, cache=None):
+    state = load_state(root)
+    hasher = Hasher(root, state.setdefault('files', {}))
+    steps = {s.name: s for s in STEPS if pull or s.name != 'pull'}
+    keys, timings, failed = {}, {}, []
+
+    def key(step):
+        h = hashlib.sha256(step.command.encode())
+        h.update(hasher.inputs(step.inputs).encode())
+        for dep in step.deps:
+            if dep in keys:
+                h.update(keys[dep].encode())
+        return h.hexdigest()
+
+    def execute(step):
+        keys[step.name] = key(step)
+        fresh = (not step.always and step.name not in force
+                 and state['steps'].get(step.name) == keys[step.name]
+                 and (step.output is None or os.path.exists(os.path.join(root, step.output))))
+        if fresh:
+            log(step.name, 'skipped, inputs unchanged')
+            timings[step.name] = None
+            return True
+        cached = cache is not None and step.cache and step.name not in force
+        if dry_run:
+            restore = cached and cache.has(step.name, keys[step.name])
+            log(step.name, 'would restore from cache' if restore else f'would run: {step.command}')
+            timings[step.name] = 'would restore' if restore else 'would run'
+            return True
+        start = time.monotonic()
+        if cached and cache.restore(step.name, keys[step.name], root):
+            timings[step.name] = round(time.monotonic() - start, 2)
+            state['steps'][step.name] = keys[step.name]
+            log(step.name, f'restored from cache in {timings[step.name]}s')
+            return True
+        if cache is not None and step.cache:
+            # Restored files are hardlinks into the store; never let a build write through them.
+            clear(root, step.cache, [step.scratch] if step.scratch else [])
+            if step.scratch and not os.path.exists(os.path.join(root, step.scratch)):
+                cache.restore(step.name + '-scratch', 'latest', root)
+        log(step.name, f'$ {step.command}')
+        code = run(step, root)
+        timings[step.name] = round(time.monotonic() - start, 2)
+        if code:
+            log(step.name, f'failed with exit code {code} after {timings[step.name]}s')
+            return False
+        state['steps'][step.name] = keys[step.name]
+        log(step.name, f'done in {timings[step.name]}s')
+        if cache is not None and step.cache:
+            stored = time.monotonic()
+            added = cache.store(step.name, keys[step.name], root, step.cache,
+                                exclude=[step.scratch] if step.scratch else [])
+            if step.scratch:
+                added += cache.store(step.name + '-scratch', 'latest', root, [step.scratch], copy=True)
+            log(step.name, f'cached {added >> 20}MB new in {time.monotonic() - stored:.2f}s')
+        return True
+
+    started = time.monotonic()
+    pending = dict(steps)
+    running = {}
+    with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+        while pending or running:
+            if not failed:
+                for name, step in list(pending.items()):
+                    if all(d not in steps or (d in timings and d not in running) for d in step.deps):
+                        running[pool.submit(execute, step)] = name
+                        del pending[name]
+            else:
+                pending.clear()
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                if not future.result():
+                    failed.append(name)
+
+    total = round(time.monotonic() - started, 2)
+    if not dry_run:
+        save_state(root, state)
+        with open(os.path.join(root, STATE_DIR, 'history.jsonl'), 'a') as f:
+            f.write(json.dumps({'at': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'total': total,
+                                'steps': timings, 'failed': failed}) + '\\n')
+
+    print()
+    for name in steps:
+        t = timings.get(name, 'not run')
+        print(f'  {name:10} {"skipped" if t is None else f"{t}s" if isinstance(t, float) else t}')
+    print(f'  {"total":10} {total}s')
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Deploy Novaclio, skipping steps whose inputs are unchanged')
+    parser.add_argument('--app-dir', default=APP_DIR)
+    parser.add_argument('--force', nargs='+', default=[], choices=[s.name for s in STEPS], metavar='STEP',
+                        help='run these steps even if unchanged')
+    parser.add_argument('--all', action='store_true', help='run every step')
+    parser.add_argument('--no-pull', dest='pull', action='store_false', help='deploy the tree as it is')
+    parser.add_argument('--dry-run', action='store_true', help='show what would run')
+    parser.add_argument('--no-cache', dest='cache', action='store_false', help='do not use the build cache')
+    parser.add_argument('--cache-dir', default=os.environ.get('DEPLOY_CACHE_DIR'),
+                        help='build cache directory, on the same filesystem as the app for hardlinks '
+                             '(default: $DEPLOY_CACHE_DIR or APP_DIR/.deploy/cache)')
+    parser.add_argument('--cache-budget', default=os.environ.get('DEPLOY_CACHE_BUDGET', '5G'),
+                        help='evict least recently used builds beyond this size (default: 5G)')
+    args = parser.parse_args(argv)
+    force = {s.name for s in STEPS} if args.all else set(args.force)
+    cache = None
+    if args.cache:
+        cache = Cache(args.cache_dir or os.path.join(args.app_dir, STATE_DIR, 'cache'), args.cache_budget)
+    return deploy(args.app_dir, force, args.dry_run, args.pull, cache)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+'''
@@ -0,0 +1,40 @@
+"""vps-configs/deploy.sh"""
+
+CONTENT = '''#!/bin/bash
+# Novaclio Deploy Script
+# Usage: ./vps-configs/deploy.sh
+set -e
+
+APP_DIR="/var/www/gravy-cc-deploy"
+echo "Deploying Novaclio..."
+
+cd $APP_DIR
+
+echo "Pulling latest code..."
+git pull origin main
+
+echo "Installing dependencies..."
+npm ci --omit=dev
+
+echo "Generating Prisma client..."
+npx prisma generate
+
+echo "Running migrations..."
+npx prisma migrate deploy
+
+echo "Applying search indexes..."
+python3 vps-configs/search_index.py migrate --app-dir .
+
+echo "Building app..."
+npm run build
+
+echo "Compiling scoring worker..."
+npx --yes esbuild@0.24.2 src/workers/scoring-worker.ts --bundle --platform=node --target=node20 \\
+  --format=cjs --packages=external --outfile=dist-workers/scoring-worker.js
+
+echo "Restarting PM2..."
+pm2 reload vps-configs/ecosystem.config.js --update-env || pm2 start vps-configs/ecosystem.config.js
+
+echo "Deployment complete!"
+pm2 status
+'''
@@ -0,0 +1,107 @@
+"""src/app/(dashboard)/brand/discover/page.tsx"""
+from . import _swap
+
+CONTENT = '''import { getServerSession } from "next-auth";
+import { authOptions } from "@/lib/auth";
+import { db } from "@/lib/db";
+import { sessionBrandId } from "@/lib/session";
+import { CreatorCard } from "@/components/ui";
+
+type Creator = Parameters<typeof CreatorCard>[0]["creator"];
+
+export default async function DiscoverPage({ searchParams }: { searchParams: { niche?: string; campaign?: string } }) {
+  if (searchParams.campaign) return <CampaignMatches campaignId={searchParams.campaign} />;
+
+  const creators = await db.creator.findMany({
+    where: searchParams.niche ? { niche: { has: searchParams.niche } } : undefined,
+    include: { user: { select: { id: true, email: true, name: true, role: true, image: true, createdAt: true, updatedAt: true } } },
+    orderBy: { aiScore: "desc" },
+    take: 24,
+  });
+
+  return (
+    <div>
+      <div className="mb-8">
+        <h1 className="text-2xl font-bold text-white">Discover Creators</h1>
+        <p className="text-gray-400">Find the perfect creators for your campaigns</p>
+      </div>
+      <CreatorGrid creators={creators} empty="No creators found. Check back soon!" />
+    </div>
+  );
+}
+
+// A campaign's best creators, precomputed by vps-configs/match_creators.py
+// and read in rank order from CreatorMatch's (campaignId, rank) key.
+async function CampaignMatches({ campaignId }: { campaignId: string }) {
+  const session = await getServerSession(authOptions);
+  const brandId = await sessionBrandId(session);
+  const matches = brandId ? await db.creatorMatch.findMany({
+    where: { campaignId, campaign: { brandId } },
+    include: { creator: { include: { user: { select: { id: true, email: true, name: true, role: true, image: true, createdAt: true, updatedAt: true } } } } },
+    orderBy: { rank: "asc" },
+    take: 24,
+  }) : [];
+
+  return (
+    <div>
+      <div className="mb-8">
+        <h1 className="text-2xl font-bold text-white">Matched Creators</h1>
+        <p className="text-gray-400">Ranked for this campaign by niche, platforms, audience and rate</p>
+      </div>
+      <CreatorGrid creators={matches.map(m => m.creator)} empty="No matches yet. Matches are refreshed every half hour." />
+    </div>
+  );
+}
+
+function CreatorGrid({ creators, empty }: { creators: Creator[]; empty: string }) {
+  return creators.length > 0 ? (
+    <div className="grid grid-cols-3 gap-6">
+      {creators.map(creator => (
+        <CreatorCard key={creator.id} creator={creator} />
+      ))}
+    </div>
+  ) : (
+    <div className="bg-gray-900 border border-gray-800 rounded-xl p-12 text-center">
+      <p className="text-gray-400">{empty}</p>
+    </div>
+  );
+}
+'''
+
+QUERY = '''  const creators = await db.creator.findMany({
+    where: searchParams.niche ? { niche: { has: searchParams.niche } } : undefined,
+    include: { user: { select: { id: true, email: true, name: true, role: true, image: true, createdAt: true, updatedAt: true } } },
+    orderBy: { aiScore: "desc" },
+    take: 24,
+  });
+'''
+
+# With ``cache`` the top 24 per niche is read through Redis (src/lib/cache.ts).
+CACHED_QUERY = '''  const creators = await cachedListing("creators", searchParams.niche, 24, () => db.creator.findMany({
+    where: searchParams.niche ? { niche: { has: searchParams.niche } } : undefined,
+    include: { user: { select: { id: true, email: true, name: true, role: true, image: true, createdAt: true, updatedAt: true } } },
+    orderBy: { aiScore: "desc" },
+    take: 24,
+  }));
+'''
+
+# With ``isr`` it is read through the tagged Next.js data cache
+# (src/lib/data-cache.ts) instead; it takes precedence over ``cache``.
+ISR_QUERY = '''  const creators = await cached(() => db.creator.findMany({
+    where: searchParams.niche ? { niche: { has: searchParams.niche } } : undefined,
+    include: { user: { select: { id: true, email: true, name: true, role: true, image: true, createdAt: true, updatedAt: true } } },
+    orderBy: { aiScore: "desc" },
+    take: 24,
+  }), ["discover", searchParams.niche ?? ""], [tags.creators(searchParams.niche)], REVALIDATE.discover);
+'''
+
+
+def render(options):
+    if options.get('isr'):
+        lib, query = 'import { REVALIDATE, cached, tags } from "@/lib/data-cache";\n', ISR_QUERY
+    elif options.get('cache'):
+        lib, query = 'import { cachedListing } from "@/lib/cache";\n', CACHED_QUERY
+    else:
+        return CONTENT
+    text = _swap(CONTENT, 'import { db } from "@/lib/db";\n', 'import { db } from "@/lib/db";\n' + lib)
+    return _swap(text, QUERY, query)
@@ -0,0 +1,79 @@
+"""docker-compose.yml"""
+from ..pool import from_options
+
+
+def render(options):
+    pool = from_options(options)
+    return f'''version: "3.9"
+
+# The app reaches Postgres through PgBouncer (transaction pooling).
+# DIRECT_URL bypasses it for prisma migrate. Pool sizes are for
+# {pool.describe()}.
+
+services:
+  app:
+    build:
+      context: .
+      dockerfile: Dockerfile
+    ports:
+      - "3000:3000"
+    environment:
+      - NODE_ENV=production
+      - DATABASE_URL=postgresql://postgres:${{POSTGRES_PASSWORD:-secret}}@pgbouncer:6432/gravy_cc?pgbouncer=true&connection_limit={pool.connection_limit}
+      - DIRECT_URL=postgresql://postgres:${{POSTGRES_PASSWORD:-secret}}@postgres:5432/gravy_cc
+      - AUTH_SECRET=${{AUTH_SECRET}}
+      - ANTHROPIC_API_KEY=${{ANTHROPIC_API_KEY}}
+      - REDIS_URL=redis://redis:6379
+      - REDIS_HOST=redis
+    depends_on:
+      - pgbouncer
+      - redis
+    restart: unless-stopped
+
+  pgbouncer:
+    image: edoburu/pgbouncer
+    environment:
+      DB_HOST: postgres
+      DB_PORT: "5432"
+      DB_NAME: gravy_cc
+      DB_USER: postgres
+      DB_PASSWORD: ${{POSTGRES_PASSWORD:-secret}}
+      AUTH_TYPE: scram-sha-256
+      LISTEN_PORT: "6432"
+      POOL_MODE: transaction
+      DEFAULT_POOL_SIZE: "{pool.pool_size}"
+      RESERVE_POOL_SIZE: "{pool.reserve_pool}"
+      MAX_DB_CONNECTIONS: "{pool.server_connections}"
+      MAX_CLIENT_CONN: "{pool.max_client_conn}"
+      IGNORE_STARTUP_PARAMETERS: extra_float_digits,options
+    ports:
+      - "6432:6432"
+    depends_on:
+      - postgres
+    restart: unless-stopped
+
+  postgres:
+    image: postgres:16-alpine
+    command: ["postgres", "-c", "max_connections={pool.max_connections}"]
+    volumes:
+      - postgres_data:/var/lib/postgresql/data
+    environment:
+      POSTGRES_DB: gravy_cc
+      POSTGRES_USER: postgres
+      POSTGRES_PASSWORD: ${{POSTGRES_PASSWORD:-secret}}
+    ports:
+      - "5432:5432"
+    restart: unless-stopped
+
+  redis:
+    image: redis:7-alpine
+    volumes:
+      - redis_data:/data
+    ports:
+      - "6379:6379"
+    restart: unless-stopped
+
+volumes:
+  postgres_data:
+  redis_data:
+'''
@@ -0,0 +1,78 @@
+"""src/app/(dashboard)/creator/earnings/page.tsx"""
+from . import _swap
+
+CONTENT = '''import { getServerSession } from "next-auth";
+import { authOptions } from "@/lib/auth";
+import { db } from "@/lib/db";
+import { sessionCreatorId } from "@/lib/session";
+import { creatorStats } from "@/lib/stats";
+import { StatCard } from "@/components/ui";
+import { DEFAULT_PAGE_SIZE, decodeCursor, keysetWhere, toPage } from "@/lib/pagination";
+import LoadMore from "@/components/LoadMore";
+
+export default async function EarningsPage({ searchParams }: { searchParams: { cursor?: string } }) {
+  const session = await getServerSession(authOptions);
+  const creatorId = await sessionCreatorId(session);
+  const take = DEFAULT_PAGE_SIZE;
+  const [rows, stats] = creatorId ? await Promise.all([
+    db.proposal.findMany({
+      where: { creatorId, status: { in: ["ACCEPTED","COMPLETED"] }, ...keysetWhere("createdAt", decodeCursor(searchParams.cursor)) },
+      include: { campaign: { include: { brand: { include: { user: { select: { name: true } } } } } } },
+      orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+      take: take + 1,
+    }),
+    creatorStats(creatorId),
+  ]) : [[], null];
+  const { items: proposals, nextCursor } = toPage(rows, take, "createdAt");
+
+  return (
+    <div>
+      <div className="mb-8">
+        <h1 className="text-2xl font-bold text-white">Earnings</h1>
+        <p className="text-gray-400">Track your income from campaigns</p>
+      </div>
+
+      <div className="grid grid-cols-3 gap-6 mb-8">
+        <StatCard label="Total Earned" value={`₦${(stats?.earned ?? 0).toLocaleString()}`} />
+        <StatCard label="Pending Payout" value={`₦${(stats?.pending ?? 0).toLocaleString()}`} />
+        <StatCard label="Completed Deals" value={stats?.completed ?? 0} />
+      </div>
+
+      <div>
+        <h2 className="text-lg font-semibold text-white mb-4">Transaction History</h2>
+        {proposals.length > 0 ? (
+          <div className="space-y-4">
+            {proposals.map(p => (
+              <div key={p.id} className="bg-gray-900 border border-gray-800 rounded-xl p-6 flex items-center justify-between">
+                <div>
+                  <h3 className="text-white font-medium">{p.campaign.title}</h3>
+                  <p className="text-gray-400 text-sm">{p.campaign.brand.user.name}</p>
+                </div>
+                <div className="text-right">
+                  <p className="text-white font-semibold">₦{p.rate.toLocaleString()}</p>
+                  <span className={`text-xs ${p.status === "COMPLETED" ? "text-green-400" : "text-yellow-400"}`}>{p.status}</span>
+                </div>
+              </div>
+            ))}
+            <LoadMore cursor={nextCursor} />
+          </div>
+        ) : (
+          <div className="bg-gray-900 border border-gray-800 rounded-xl p-12 text-center">
+            <p className="text-gray-400">No earnings yet. Apply to campaigns to get started!</p>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+}
+'''
+
+
+# With ``isr`` the stats are read through the tagged Next.js data cache
+# (src/lib/data-cache.ts) and refreshed by the writes that move them.
+def render(options):
+    if not options.get('isr'):
+        return CONTENT
+    text = _swap(CONTENT, 'import { creatorStats } from "@/lib/stats";\n',
+                 'import { cachedCreatorStats } from "@/lib/data-cache";\n')
+    return _swap(text, '    creatorStats(creatorId),\n', '    cachedCreatorStats(creatorId),\n')
@@ -0,0 +1,113 @@
+"""vps-configs/ecosystem.config.js"""
+from ..pool import from_options
+from . import _swap
+
+CONTENT = '''// Novaclio PM2 config: pm2 reload vps-configs/ecosystem.config.js --update-env
+//
+// Sized from the host PM2 runs on each time the file is loaded:
+// - web: Next.js in cluster mode, one worker per core, leaving one core for
+//   Postgres, Redis and the side processes on hosts with more than two.
+// - Each web worker's memory ceiling is its share of RAM after the
+//   reserve and the side processes. Its V8 heap is capped below that so
+//   it collects garbage before PM2 recycles it.
+// - socket: the socket.io server, exactly one instance. Rooms live in its
+//   memory and the app and worker POST to it on 127.0.0.1.
+// - scoring-worker: the BullMQ proposal scoring worker, bundled to
+//   dist-workers/scoring-worker.js by deploy.py.
+//
+// The web worker count is capped at the instance count the Postgres
+// connection budget was generated for (create_files.py --instances, see
+// pgbouncer.ini). Raise both together; check_pool.py verifies they agree.
+//
+// Override with WEB_INSTANCES, WEB_MEMORY_MB or PM2_RESERVED_MB. Moving from
+// the old fork-mode app needs one `pm2 delete novaclio` first. After that,
+// `pm2 reload` replaces web workers one at a time without dropping
+// requests.
+
+const os = require("os");
+const path = require("path");
+
+const ROOT = path.resolve(__dirname, "..");
+const MB = 1024 * 1024;
+
+const CORES = os.availableParallelism ? os.availableParallelism() : os.cpus().length;
+const TOTAL_MB = Math.floor(os.totalmem() / MB);
+const RESERVED_MB = parseInt(process.env.PM2_RESERVED_MB || String(Math.min(2048, Math.floor(TOTAL_MB / 4))));
+const SOCKET_MB = 256;
+const WORKER_MB = 384;
+const MAX_WEB_INSTANCES = 4;
+
+const WEB_INSTANCES =
+  parseInt(process.env.WEB_INSTANCES || "0") || Math.min(MAX_WEB_INSTANCES, CORES > 2 ? CORES - 1 : CORES);
+const WEB_MB = parseInt(process.env.WEB_MEMORY_MB || "0") || Math.max(
+  256,
+  Math.min(2048, Math.floor((TOTAL_MB - RESERVED_MB - SOCKET_MB - WORKER_MB) / WEB_INSTANCES))
+);
+const heap = (mb) => `--max-old-space-size=${Math.floor(mb * 0.8)}`;
+
+const common = {
+  cwd: ROOT,
+  autorestart: true,
+  watch: false,
+  merge_logs: true,
+  time: true,
+  exp_backoff_restart_delay: 200,
+};
+
+module.exports = {
+  apps: [
+    {
+      ...common,
+      name: "novaclio",
+      script: "node_modules/next/dist/bin/next",
+      args: "start",
+      exec_mode: "cluster",
+      instances: WEB_INSTANCES,
+      node_args: heap(WEB_MB),
+      max_memory_restart: `${WEB_MB}M`,
+      // Graceful reload: a replacement must be listening before the old
+      // worker is sent SIGINT, which then has kill_timeout to finish.
+      listen_timeout: 15000,
+      kill_timeout: 10000,
+      env: {
+        NODE_ENV: "production",
+        PORT: "3001",
+      },
+    },
+    {
+      ...common,
+      name: "novaclio-socket",
+      script: "dist-socket/socket-server.js",
+      exec_mode: "fork",
+      instances: 1,
+      node_args: heap(SOCKET_MB),
+      max_memory_restart: `${SOCKET_MB}M`,
+      kill_timeout: 5000,
+      env: {
+        NODE_ENV: "production",
+        SOCKET_PORT: "3002",
+      },
+    },
+    {
+      ...common,
+      name: "novaclio-scoring",
+      script: "dist-workers/scoring-worker.js",
+      exec_mode: "fork",
+      instances: 1,
+      node_args: heap(WORKER_MB),
+      max_memory_restart: `${WORKER_MB}M`,
+      // PM2 stops with SIGINT; the worker closes and flushes its batch first.
+      kill_timeout: 30000,
+      env: {
+        NODE_ENV: "production",
+        SOCKET_PORT: "3002",
+      },
+    },
+  ],
+};
+'''
+
+
+def render(options):
+    instances = from_options(options).instances
+    return _swap(CONTENT, 'const MAX_WEB_INSTANCES = 4;', f'const MAX_WEB_INSTANCES = {instances};')
@@ -0,0 +1,22 @@
+"""src/components/LoadMore.tsx"""
+
+CONTENT = '''import Link from "next/link";
+
+export default function LoadMore({ cursor, params = {} }: { cursor: string | null; params?: Record<string, string | undefined> }) {
+  if (!cursor) return null;
+  const query = new URLSearchParams();
+  for (const [key, value] of Object.entries(params)) {
+    if (value && key !== "cursor") query.set(key, value);
+  }
+  query.set("cursor", cursor);
+
+  return (
+    <div className="mt-6 text-center">
+      <Link href={`?${query}`}
+        className="inline-block bg-gray-900 border border-gray-800 hover:border-violet-500 text-gray-300 hover:text-white text-sm px-6 py-3 rounded-lg transition-colors">
+        Load more →
+      </Link>
+    </div>
+  );
+}
+'''
@@ -0,0 +1,311 @@
+"""vps-configs/match_creators.py"""
+
+CONTENT = '''#!/usr/bin/env python3
+"""Precompute the best creators for each active campaign.
+
+    python3 vps-configs/match_creators.py [--app-dir DIR] [--database-url URL] [--top K]
+                                          [--batch B] [--campaign ID ...] [--dry-run]
+
+Loads every creator and the active campaigns into NumPy arrays, scores
+every (campaign, creator) pair a batch of campaigns at a time, and writes
+each campaign's top K creators to "CreatorMatch". The discover page reads
+/brand/discover?campaign=<id> from there with one range scan of the table's
+(campaignId, rank) key, so the page never scores anything itself.
+
+A pair's score is a weighted sum (WEIGHTS) of four terms, each in [0, 1]:
+
+* niche: cosine similarity of the multi-hot niche vectors. Creators who
+  share no niche with a campaign that lists niches are not matched.
+* platform: the share of the campaign's platforms the creator has a
+  handle on. Creators on none of them are not matched.
+* audience: the creator's percentile among all creators for followers
+  and for engagement rate, blended with aiScore.
+* price: 1 while ratePerPost fits the budget split BUDGET_SPLIT ways,
+  falling in proportion past that. An unknown rate scores 0.5, and a rate
+  above the whole budget is not matched.
+
+Campaigns are scored in batches that share a niche set, as float32
+(campaigns x creators) matrices. Only creators sharing a niche with the
+batch are considered, and of those only as many as can still beat the
+batch's k-th best scores (see ``match``), so a batch is usually a few
+thousand creators wide. 300,000 creators against 8,000 active campaigns
+take a few seconds.
+
+Each run replaces the table (or just the --campaign rows) in one
+transaction, so readers see either the old matches or the new ones. Run it
+from cron after the deploy, e.g.
+
+    */30 * * * * cd /var/www/gravy-cc-deploy && python3 vps-configs/match_creators.py
+
+Connects over DIRECT_URL (environment, then the app's .env files) with
+psql. Needs NumPy (pip3 install numpy); everything else is the standard
+library.
+"""
+import argparse
+import sys
+import time
+
+from check_pool import APP_DIR, load_env
+from search_index import Psql
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit('match_creators.py needs NumPy: pip3 install numpy')
+
+WEIGHTS = {'niche': 0.40, 'platform': 0.20, 'audience': 0.25, 'price': 0.15}
+AUDIENCE = {'followers': 0.5, 'engagement': 0.3, 'aiScore': 0.2}
+BUDGET_SPLIT = 5
+TOP_K = 100
+BATCH = 64
+FIRST = 5_000
+SEP = chr(31)
+
+CREATORS_SQL = \'\'\'
+SELECT id, followers, "engagementRate", "aiScore", coalesce("ratePerPost", 'NaN'),
+       array_to_string(niche, chr(31)),
+       coalesce(CASE jsonb_typeof(platforms)
+         WHEN 'array' THEN (SELECT string_agg(p, chr(31)) FROM jsonb_array_elements_text(platforms) p)
+         WHEN 'object' THEN (SELECT string_agg(key, chr(31)) FROM jsonb_each(platforms)
+                             WHERE value NOT IN ('null', '""', 'false'))
+       END, '')
+FROM "Creator" ORDER BY id;\'\'\'
+
+CAMPAIGNS_SQL = \'\'\'
+SELECT id, budget, array_to_string(niche, chr(31)), array_to_string(platforms, chr(31))
+FROM "Campaign" WHERE status = 'ACTIVE'{only} ORDER BY id;\'\'\'
+
+
+def quote(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def tokens(text):
+    """Normalised niche or platform names from a chr(31)-joined list."""
+    return {t.strip().lower() for t in text.split(SEP) if t.strip()}
+
+
+def multi_hot(rows, vocab):
+    """``len(rows) x len(vocab)`` float32 matrix with a 1 for each token a row has."""
+    out = np.zeros((len(rows), len(vocab)), np.float32)
+    pairs = [(i, vocab[t]) for i, row in enumerate(rows) for t in row if t in vocab]
+    if pairs:
+        r, c = zip(*pairs)
+        out[list(r), list(c)] = 1
+    return out
+
+
+def unit_rows(m):
+    """Rows of ``m`` scaled to length 1 (all-zero rows stay zero)."""
+    return m / np.maximum(np.linalg.norm(m, axis=1, keepdims=True), 1e-9)
+
+
+def percentile(x):
+    """Each value's share of values below it, in [0, 1]; ties share a rank."""
+    if len(x) < 2:
+        return np.ones(len(x), np.float32)
+    return (np.searchsorted(np.sort(x), x, 'left') / (len(x) - 1)).astype(np.float32)
+
+
+class Creators:
+    def __init__(self, rows):
+        self.ids = [r[0] for r in rows]
+        self.niches = [tokens(r[5]) for r in rows]
+        self.platforms = [tokens(r[6]) for r in rows]
+        followers = np.array([float(r[1]) for r in rows])
+        engagement = np.array([float(r[2]) for r in rows])
+        ai_score = np.array([float(r[3]) for r in rows], np.float32)
+        self.rate = np.array([float(r[4]) for r in rows], np.float32)
+        self.audience = (AUDIENCE['followers'] * percentile(followers)
+                         + AUDIENCE['engagement'] * percentile(engagement)
+                         + AUDIENCE['aiScore'] * np.clip(ai_score / 100, 0, 1)).astype(np.float32)
+
+
+class Campaigns:
+    def __init__(self, rows):
+        self.ids = [r[0] for r in rows]
+        self.budget = np.array([float(r[1]) for r in rows], np.float32)
+        self.niches = [tokens(r[2]) for r in rows]
+        self.platforms = [tokens(r[3]) for r in rows]
+
+
+class Matcher:
+    """Creator and campaign feature matrices over a shared niche and platform vocabulary."""
+
+    def __init__(self, creators, campaigns):
+        self.creator_ids, self.campaign_ids = creators.ids, campaigns.ids
+        self.campaign_keys = [tuple(sorted(n)) for n in campaigns.niches]
+        niches = {t: i for i, t in enumerate(sorted(set().union(*creators.niches, *campaigns.niches)))}
+        self.creator_niche = unit_rows(multi_hot(creators.niches, niches))
+        self.campaign_niche = unit_rows(multi_hot(campaigns.niches, niches))
+
+        # The last platform column is "any": every creator has it, and it is
+        # all a campaign that names no platforms asks for.
+        platforms = {t: i for i, t in enumerate(sorted(set().union(*campaigns.platforms)))}
+        have = multi_hot(creators.platforms, platforms)
+        self.creator_platform = np.hstack([have, np.ones((len(have), 1), np.float32)])
+        wanted = multi_hot(campaigns.platforms, platforms)
+        counts = wanted.sum(axis=1, keepdims=True)
+        self.campaign_platform = np.hstack([wanted / np.maximum(counts, 1), counts == 0]).astype(np.float32)
+
+        # budget * inv_rate is the budget share over the rate: the price term
+        # below 1, and below 1 / BUDGET_SPLIT when the rate is over the whole
+        # budget. Unpriced creators get an infinite share and base takes half
+        # the price weight back, so every creator's price term is at most
+        # ceiling's.
+        priced = ~np.isnan(creators.rate)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.inv_rate = np.where(priced, 1 / (BUDGET_SPLIT * creators.rate), np.inf).astype(np.float32)
+        self.base = (WEIGHTS['audience'] * creators.audience - WEIGHTS['price'] * 0.5 * ~priced).astype(np.float32)
+        self.ceiling = self.base + WEIGHTS['platform'] + WEIGHTS['price']
+        self.budget = np.maximum(campaigns.budget, 1)
+
+    def batches(self, size):
+        """Campaign indices in runs of at most ``size`` that share a niche set."""
+        order = sorted(range(len(self.campaign_ids)), key=self.campaign_keys.__getitem__)
+        start = 0
+        for end in range(1, len(order) + 1):
+            if end == len(order) or end - start == size or self.campaign_keys[order[end]] != self.campaign_keys[order[start]]:
+                yield np.array(order[start:end])
+                start = end
+
+    def candidates(self, campaign):
+        """Creators ``campaign``'s niche set lets in, with their fixed terms and bounds.
+
+        ``fixed`` is a creator's niche and audience terms, which are the same
+        for every campaign with this niche set. The bound adds full platform
+        and price terms: the most any such campaign can score them.
+        """
+        if self.campaign_keys[campaign]:
+            niche = WEIGHTS['niche'] * (self.creator_niche @ self.campaign_niche[campaign])
+            cols = np.flatnonzero(niche > 0)
+            fixed = niche[cols] + self.base[cols]
+        else:
+            cols = np.arange(len(self.creator_ids))
+            fixed = self.base
+        return cols, fixed, fixed + (WEIGHTS['platform'] + WEIGHTS['price'])
+
+    def score(self, rows, cols, fixed):
+        """Scores of campaigns ``rows`` against creators ``cols``; -inf where a pair is not matched.
+
+        ``fixed`` is each creator's niche and audience terms, which are the
+        same for every campaign in ``rows``.
+        """
+        platform = self.campaign_platform[rows] @ self.creator_platform[cols].T
+        share = self.budget[rows, None] * self.inv_rate[cols]
+        ok = share >= 1 / BUDGET_SPLIT - 1e-6
+        ok &= platform > 0
+        np.minimum(share, 1, out=share)
+        score = WEIGHTS['platform'] * platform
+        score += WEIGHTS['price'] * share
+        score += fixed
+        return np.where(ok, score, -np.inf)
+
+
+def top_k(score, k):
+    """Column indices and scores of each row's ``k`` highest entries, best first."""
+    k = min(k, score.shape[1])
+    part = np.argpartition(-score, k - 1, axis=1)[:, :k]
+    best = np.take_along_axis(score, part, axis=1)
+    order = np.argsort(-best, axis=1, kind='stable')
+    return np.take_along_axis(part, order, axis=1), np.take_along_axis(best, order, axis=1)
+
+
+def match(matcher, k, batch, first=FIRST):
+    """``(campaignId, rank, creatorId, score)`` rows for every campaign's top ``k``.
+
+    Each batch of campaigns that share a niche set is scored against the
+    ``first`` of its candidates by bound. A campaign is done when its k-th
+    best score is at least the bound of every candidate left out. The rest
+    are scored again against as many candidates as the lowest of their
+    k-th best scores lets in (at least twice as many), until all are done
+    or every candidate has been scored.
+    """
+    out = []
+    key = None
+    for rows in matcher.batches(batch):
+        if matcher.campaign_keys[rows[0]] != key:
+            key = matcher.campaign_keys[rows[0]]
+            cols, fixed, bound = matcher.candidates(rows[0])
+        total = len(cols)
+        n = min(total, max(first, k))
+        while len(rows) and total:
+            if n < total:
+                part = np.argpartition(-bound, n)
+                top, left_out = part[:n], bound[part[n]]
+            else:
+                top, left_out = np.arange(total), -np.inf
+            idx, best = top_k(matcher.score(rows, cols[top], fixed[top]), k)
+            kth = best[:, -1] if best.shape[1] == k else np.full(len(rows), -np.inf, np.float32)
+            done = kth - 1e-6 >= left_out
+            for row in np.flatnonzero(done):
+                campaign = matcher.campaign_ids[rows[row]]
+                for rank, (i, s) in enumerate(zip(top[idx[row]].tolist(), best[row].tolist()), 1):
+                    if s == -np.inf:
+                        break
+                    out.append((campaign, rank, matcher.creator_ids[cols[i]], s))
+            if done.all():
+                break
+            rows, kth = rows[~done], kth[~done]
+            n = min(total, max(2 * n, int(np.count_nonzero(bound > kth.min() - 1e-6))))
+    return out
+
+
+def write(db, rows, only=None):
+    """Replace the matches (for campaigns ``only``, or all) with ``rows`` in one transaction."""
+    where = ' WHERE "campaignId" IN (' + ', '.join(quote(c) for c in only) + ')' if only else ''
+    lines = [f'{c}\\t{rank}\\t{creator}\\t{score:.6f}' for c, rank, creator, score in rows]
+    db.run('BEGIN;\\n'
+           'CREATE TEMP TABLE match_load ("campaignId" text, rank int, "creatorId" text, score float8) ON COMMIT DROP;\\n'
+           'COPY match_load FROM stdin;\\n' + ''.join(line + '\\n' for line in lines) + '\\\\.\\n'
+           f'DELETE FROM "CreatorMatch"{where};\\n'
+           'INSERT INTO "CreatorMatch" ("campaignId", rank, "creatorId", score)\\n'
+           '  SELECT l."campaignId", l.rank, l."creatorId", l.score FROM match_load l\\n'
+           '  JOIN "Campaign" c ON c.id = l."campaignId" JOIN "Creator" r ON r.id = l."creatorId";\\n'
+           'COMMIT;\\n'
+           'ANALYZE "CreatorMatch";\\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Precompute the best creators for each active campaign')
+    parser.add_argument('--app-dir', default=APP_DIR)
+    parser.add_argument('--database-url', help='default: DIRECT_URL')
+    parser.add_argument('--top', type=int, default=TOP_K, help='matches kept per campaign')
+    parser.add_argument('--batch', type=int, default=BATCH, help='campaigns scored per matrix')
+    parser.add_argument('--campaign', nargs='+', help='only rematch these campaigns')
+    parser.add_argument('--dry-run', action='store_true', help='score but do not write')
+    args = parser.parse_args(argv)
+
+    url = args.database_url or load_env(args.app_dir).get('DIRECT_URL')
+    if not url:
+        sys.exit('DIRECT_URL is not set; pass --database-url')
+    db = Psql(url)
+    only = ''
+    if args.campaign:
+        only = ' AND id IN (' + ', '.join(quote(c) for c in args.campaign) + ')'
+
+    try:
+        started = time.monotonic()
+        creators = Creators(db.run(CREATORS_SQL))
+        campaigns = Campaigns(db.run(CAMPAIGNS_SQL.format(only=only)))
+        print(f'loaded {len(creators.ids)} creators and {len(campaigns.ids)} active campaigns '
+              f'in {time.monotonic() - started:.1f}s')
+        if not creators.ids or not campaigns.ids:
+            rows = []
+        else:
+            started = time.monotonic()
+            rows = match(Matcher(creators, campaigns), args.top, args.batch)
+            print(f'matched in {time.monotonic() - started:.1f}s: {len(rows)} matches')
+        if args.dry_run:
+            return 0
+        started = time.monotonic()
+        write(db, rows, args.campaign)
+        print(f'wrote {len(rows)} matches in {time.monotonic() - started:.1f}s')
+    except RuntimeError as err:
+        sys.exit(f'psql failed: {err}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+'''
@@ -0,0 +1,31 @@
+"""src/types/next-auth.d.ts"""
+
+CONTENT = '''import type { DefaultSession } from "next-auth";
+import type { UserRole } from "@prisma/client";
+
+declare module "next-auth" {
+  interface Session {
+    user: DefaultSession["user"] & {
+      id: string;
+      role: UserRole;
+      creatorId: string | null;
+      brandId: string | null;
+    };
+  }
+
+  interface User {
+    role?: UserRole;
+    creatorId?: string | null;
+    brandId?: string | null;
+  }
+}
+
+declare module "next-auth/jwt" {
+  interface JWT {
+    id?: string;
+    role?: UserRole;
+    creatorId?: string | null;
+    brandId?: string | null;
+  }
+}
+'''
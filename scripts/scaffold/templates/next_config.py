@@ -0,0 +1,45 @@
+"""next.config.ts"""
+from . import _swap
+
+CONTENT = '''import type { NextConfig } from "next";
+
+const nextConfig: NextConfig = {
+  images: {
+    remotePatterns: [
+      { protocol: "https", hostname: "res.cloudinary.com" },
+      { protocol: "https", hostname: "images.unsplash.com" },
+      { protocol: "https", hostname: "avatars.githubusercontent.com" },
+      { protocol: "https", hostname: "lh3.googleusercontent.com" },
+    ],
+  },
+  typescript: { ignoreBuildErrors: true },
+  eslint: { ignoreDuringBuilds: true },
+  experimental: {
+    serverActions: { bodySizeLimit: "10mb" },
+  },
+};
+
+export default nextConfig;
+'''
+
+# With ``isr`` the data cache lives in Redis (cache-handler.js), so a
+# revalidateTag() from one PM2 web worker reaches all of them.
+EXPERIMENTAL = '''  experimental: {
+    serverActions: { bodySizeLimit: "10mb" },
+  },
+};
+'''
+ISR_EXPERIMENTAL = '''  experimental: {
+    serverActions: { bodySizeLimit: "10mb" },
+  },
+  // Shared across the PM2 web workers; none keeps its own in-memory copy.
+  cacheHandler: require.resolve("./cache-handler.js"),
+  cacheMaxMemorySize: 0,
+};
+'''
+
+
+def render(options):
+    if not options.get('isr'):
+        return CONTENT
+    return _swap(CONTENT, EXPERIMENTAL, ISR_EXPERIMENTAL)
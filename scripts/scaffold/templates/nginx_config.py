@@ -0,0 +1,142 @@
+"""vps-configs/nginx-novaclio.io.conf"""
+
+CONTENT = '''## /etc/nginx/sites-available/novaclio.io
+## Generated by scripts/create_files.py; edit the template, not this file.
+##
+## Hashed build assets and public/ files are served from disk with long
+## cache lifetimes. Anonymous GETs of hot public endpoints are micro-cached
+## for a few seconds, and concurrent misses wait on one upstream request.
+## Requests carrying a session cookie or Authorization header always go to
+## the app. Everything else is proxied over a keepalive pool to the PM2
+## cluster. The cluster workers share port 3001, so the pool holds one
+## server entry.
+
+proxy_cache_path /var/cache/nginx/novaclio levels=1:2 keys_zone=novaclio_api:10m
+                 max_size=256m inactive=10m use_temp_path=off;
+proxy_cache_path /var/cache/nginx/novaclio-images levels=1:2 keys_zone=novaclio_images:10m
+                 max_size=1g inactive=7d use_temp_path=off;
+
+upstream novaclio_app {
+    server 127.0.0.1:3001;
+    keepalive 64;
+    keepalive_requests 10000;
+    keepalive_timeout 60s;
+}
+
+upstream novaclio_socket {
+    server 127.0.0.1:3002;
+    keepalive 16;
+}
+
+# "upgrade" for websocket handshakes, otherwise an empty Connection header so
+# the upstream connection goes back to the keepalive pool.
+map $http_upgrade $novaclio_connection {
+    default upgrade;
+    ''      '';
+}
+
+# next-auth's session cookie, including the __Secure- and chunked (.0, .1) forms.
+map $http_cookie $novaclio_session {
+    default 0;
+    "~*next-auth\\.session-token" 1;
+}
+
+map "$novaclio_session$http_authorization" $novaclio_skip_cache {
+    default 1;
+    "0"     0;
+}
+
+server {
+    listen 80;
+    server_name novaclio.io www.novaclio.io;
+    return 301 https://$host$request_uri;
+}
+
+server {
+    listen 443 ssl http2;
+    server_name novaclio.io www.novaclio.io;
+
+    ssl_certificate /etc/letsencrypt/live/novaclio.io/fullchain.pem;
+    ssl_certificate_key /etc/letsencrypt/live/novaclio.io/privkey.pem;
+    ssl_session_cache shared:novaclio_ssl:10m;
+    ssl_session_timeout 1d;
+
+    # Matches serverActions.bodySizeLimit in next.config.ts.
+    client_max_body_size 10m;
+
+    gzip on;
+    gzip_vary on;
+    gzip_proxied any;
+    gzip_comp_level 5;
+    gzip_min_length 1024;
+    gzip_types text/plain text/css text/xml application/json application/javascript
+               application/xml application/rss+xml image/svg+xml font/ttf application/manifest+json;
+    # With ngx_brotli installed, also enable:
+    # brotli on;
+    # brotli_comp_level 5;
+    # brotli_types text/plain text/css application/json application/javascript image/svg+xml;
+
+    root /var/www/gravy-cc-deploy/public;
+
+    proxy_http_version 1.1;
+    proxy_set_header Host $host;
+    proxy_set_header Upgrade $http_upgrade;
+    proxy_set_header Connection $novaclio_connection;
+    proxy_set_header X-Real-IP $remote_addr;
+    proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+    proxy_set_header X-Forwarded-Proto $scheme;
+    # nginx compresses; keep Node from spending CPU on it.
+    proxy_set_header Accept-Encoding "";
+
+    # Content-hashed build output never changes under a given URL.
+    location /_next/static/ {
+        alias /var/www/gravy-cc-deploy/.next/static/;
+        add_header Cache-Control "public, max-age=31536000, immutable";
+        access_log off;
+        try_files $uri =404;
+    }
+
+    # Optimised images are keyed by url, width and quality; cache them for days.
+    location /_next/image {
+        proxy_pass http://novaclio_app;
+        proxy_cache novaclio_images;
+        proxy_cache_valid 200 7d;
+        proxy_cache_lock on;
+        proxy_cache_use_stale error timeout updating;
+        add_header X-Cache-Status $upstream_cache_status;
+    }
+
+    location /socket.io/ {
+        proxy_pass http://novaclio_socket;
+        proxy_read_timeout 60s;
+    }
+
+    # Public campaign listing: micro-cached per URL (query string included)
+    # for anonymous requests.
+    location = /api/campaigns {
+        proxy_pass http://novaclio_app;
+        proxy_cache novaclio_api;
+        proxy_cache_key "$scheme$request_method$host$request_uri";
+        proxy_cache_valid 200 5s;
+        proxy_cache_lock on;
+        proxy_cache_lock_timeout 2s;
+        proxy_cache_use_stale error timeout updating http_500 http_502 http_503;
+        proxy_cache_background_update on;
+        proxy_ignore_headers Cache-Control Expires;
+        proxy_cache_bypass $novaclio_skip_cache;
+        proxy_no_cache $novaclio_skip_cache;
+        add_header Vary Cookie always;
+        add_header X-Cache-Status $upstream_cache_status always;
+    }
+
+    # public/ files straight from disk, everything else to Next.js.
+    location / {
+        try_files $uri @app;
+        expires 1h;
+    }
+
+    location @app {
+        proxy_pass http://novaclio_app;
+    }
+}
+'''
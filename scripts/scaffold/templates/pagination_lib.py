@@ -0,0 +1,58 @@
+"""src/lib/pagination.ts"""
+
+CONTENT = '''// Keyset (cursor) pagination for list pages and API routes.
+// Lists are ordered by (field, id) descending and the cursor carries the last
+// row's field value and id, so every page is an index range scan rather than
+// an OFFSET that re-reads everything before it.
+
+export const DEFAULT_PAGE_SIZE = 20;
+export const MAX_PAGE_SIZE = 50;
+
+type CursorValue = string | number | Date | null;
+export type Cursor = { value: CursorValue; id: string };
+
+export function encodeCursor(value: CursorValue, id: string): string {
+  const payload = value instanceof Date ? { d: value.toISOString(), id } : { v: value, id };
+  return Buffer.from(JSON.stringify(payload)).toString("base64url");
+}
+
+export function decodeCursor(raw?: string | null): Cursor | null {
+  if (!raw) return null;
+  try {
+    const payload = JSON.parse(Buffer.from(raw, "base64url").toString("utf8"));
+    if (typeof payload?.id !== "string") return null;
+    if (typeof payload.d === "string") return { value: new Date(payload.d), id: payload.id };
+    return { value: payload.v ?? null, id: payload.id };
+  } catch {
+    return null;
+  }
+}
+
+export function pageSize(raw?: string | null): number {
+  const n = parseInt(raw ?? "", 10);
+  if (!Number.isFinite(n) || n < 1) return DEFAULT_PAGE_SIZE;
+  return Math.min(n, MAX_PAGE_SIZE);
+}
+
+// Rows strictly after the cursor in (field desc, id desc) order. The lte bound
+// lets Postgres seek into the index; the OR only breaks ties on the cursor row.
+// NULLs come first in a DESC index, so a null cursor is still inside that run.
+export function keysetWhere(field: string, cursor: Cursor | null): Record<string, any> {
+  if (!cursor) return {};
+  if (cursor.value === null) {
+    return { OR: [{ [field]: null, id: { lt: cursor.id } }, { [field]: { not: null } }] };
+  }
+  return {
+    [field]: { lte: cursor.value },
+    OR: [{ [field]: { lt: cursor.value } }, { id: { lt: cursor.id } }],
+  };
+}
+
+// Queries fetch take + 1 rows; the extra row only signals that another page exists.
+export function toPage<T extends { id: string }>(rows: T[], take: number, field: keyof T) {
+  const items = rows.slice(0, take);
+  const last = items[items.length - 1];
+  const nextCursor = rows.length > take && last ? encodeCursor(last[field] as CursorValue, last.id) : null;
+  return { items, nextCursor };
+}
+'''
@@ -0,0 +1,99 @@
+"""src/app/api/webhooks/paystack/route.ts"""
+from . import _swap
+
+CONTENT = '''import { NextRequest, NextResponse } from "next/server";
+import crypto from "crypto";
+import { db } from "@/lib/db";
+
+function validSignature(body: string, signature: string | null, secret: string): boolean {
+  if (!signature || !secret) return false;
+  const expected = crypto.createHmac("sha512", secret).update(body).digest();
+  const given = Buffer.from(signature, "hex");
+  return given.length === expected.length && crypto.timingSafeEqual(given, expected);
+}
+
+export async function POST(req: NextRequest) {
+  try {
+    const body = await req.text();
+    if (!validSignature(body, req.headers.get("x-paystack-signature"), process.env.PAYSTACK_SECRET_KEY || "")) {
+      return NextResponse.json({ error: "Invalid signature" }, { status: 401 });
+    }
+
+    const event = JSON.parse(body);
+    if (event.event !== "charge.success" || event.data?.status !== "success") {
+      return NextResponse.json({ received: true });
+    }
+
+    // One statement, so one round trip and one implicit transaction. The
+    // status guard makes Paystack's retries no-ops once the payment is SUCCESS.
+    const { reference } = event.data;
+    const paystackRef = event.data.id?.toString() ?? null;
+    await db.$executeRaw`
+      WITH paid AS (
+        UPDATE "Payment" SET status = 'SUCCESS', "paystackRef" = ${paystackRef}
+        WHERE reference = ${reference} AND status <> 'SUCCESS'
+        RETURNING "proposalId"
+      )
+      UPDATE "Proposal" p SET status = 'COMPLETED', "updatedAt" = now()
+      FROM paid
+      WHERE p.id = paid."proposalId" AND p.status <> 'COMPLETED'`;
+
+    return NextResponse.json({ received: true });
+  } catch (error) {
+    console.error("Webhook error:", error);
+    return NextResponse.json({ error: "Webhook processing failed" }, { status: 500 });
+  }
+}
+'''
+
+SETTLE = '''      UPDATE "Proposal" p SET status = 'COMPLETED', "updatedAt" = now()
+      FROM paid
+      WHERE p.id = paid."proposalId" AND p.status <> 'COMPLETED'`;
+'''
+
+# With ``counters`` the same statement moves the creator's totals, mirroring
+# proposalStatusChanged in src/lib/counters.ts. ``prev`` is the row as it was
+# before this statement, which gives the status the proposal moved from.
+COUNTED_SETTLE = '''      ), moved AS (
+        UPDATE "Proposal" p SET status = 'COMPLETED', "updatedAt" = now()
+        FROM paid, "Proposal" prev
+        WHERE p.id = paid."proposalId" AND prev.id = p.id AND p.status <> 'COMPLETED'
+        RETURNING p."creatorId", p.rate, prev.status = 'ACCEPTED' AS "wasAccepted"
+      )
+      UPDATE "Creator" c SET
+        "completedCount" = c."completedCount" + 1,
+        "earnedTotal" = c."earnedTotal" + m.rate,
+        "acceptedCount" = c."acceptedCount" - CASE WHEN m."wasAccepted" THEN 1 ELSE 0 END,
+        "pendingTotal" = c."pendingTotal" - CASE WHEN m."wasAccepted" THEN m.rate ELSE 0 END
+      FROM moved m
+      WHERE c.id = m."creatorId"`;
+'''
+
+
+# With ``isr`` the statement returns the settled proposals' creators so their
+# stats tags can be revalidated (src/lib/data-cache.ts). $queryRaw instead of
+# $executeRaw, to get the rows back.
+SETTLED = '''`;
+
+    return NextResponse.json({ received: true });
+'''
+
+ISR_SETTLED = '''
+      RETURNING {creator}`;
+    for (const { creatorId } of settled) revalidateCreatorStats(creatorId);
+
+    return NextResponse.json({ received: true });
+'''
+
+
+def render(options):
+    text = CONTENT
+    if options.get('counters'):
+        text = _swap(text, '      )\n' + SETTLE, COUNTED_SETTLE)
+    if options.get('isr'):
+        creator = 'c.id AS "creatorId"' if options.get('counters') else 'p."creatorId"'
+        text = _swap(text, 'import { db } from "@/lib/db";\n',
+                     'import { db } from "@/lib/db";\nimport { revalidateCreatorStats } from "@/lib/data-cache";\n')
+        text = _swap(text, '    await db.$executeRaw`\n', '    const settled: { creatorId: string }[] = await db.$queryRaw`\n')
+        text = _swap(text, SETTLED, ISR_SETTLED.replace('{creator}', creator))
+    return text
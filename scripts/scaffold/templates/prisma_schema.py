@@ -0,0 +1,218 @@
+"""prisma/schema.prisma"""
+
+CONTENT = '''// Novaclio - AI Creator Marketplace
+generator client {
+  provider        = "prisma-client-js"
+  previewFeatures = ["postgresqlExtensions"]
+}
+
+datasource db {
+  provider   = "postgresql"
+  // Pooled through PgBouncer for queries; migrations need a direct session.
+  url        = env("DATABASE_URL")
+  directUrl  = env("DIRECT_URL")
+  extensions = [pg_trgm]
+}
+
+model User {
+  id            String    @id @default(cuid())
+  email         String    @unique
+  name          String?
+  password      String?
+  role          UserRole  @default(CREATOR)
+  image         String?
+  createdAt     DateTime  @default(now())
+  updatedAt     DateTime  @updatedAt
+  creator       Creator?
+  brand         Brand?
+  accounts      Account[]
+  sessions      Session[]
+}
+
+model Account {
+  id                 String  @id @default(cuid())
+  userId             String
+  type               String
+  provider           String
+  providerAccountId  String
+  refresh_token      String? @db.Text
+  access_token       String? @db.Text
+  expires_at         Int?
+  token_type         String?
+  scope              String?
+  id_token           String? @db.Text
+  session_state      String?
+  user               User    @relation(fields: [userId], references: [id], onDelete: Cascade)
+  @@unique([provider, providerAccountId])
+  @@index([userId])
+}
+
+model Session {
+  id           String   @id @default(cuid())
+  sessionToken String   @unique
+  userId       String
+  expires      DateTime
+  user         User     @relation(fields: [userId], references: [id], onDelete: Cascade)
+  @@index([userId])
+}
+
+model Creator {
+  id            String     @id @default(cuid())
+  userId        String     @unique
+  bio           String?    @db.Text
+  niche         String[]
+  platforms     Json       @default("{}")
+  followers     Int        @default(0)
+  engagementRate Float     @default(0)
+  aiScore       Float      @default(0)
+  location      String?
+  ratePerPost   Float?
+  portfolioUrl  String?
+  verified      Boolean    @default(false)
+  // Kept up to date by a trigger; see prisma/search.sql.
+  searchVector  Unsupported("tsvector")?
+  createdAt     DateTime   @default(now())
+  updatedAt     DateTime   @updatedAt
+  user          User       @relation(fields: [userId], references: [id], onDelete: Cascade)
+  proposals     Proposal[]
+  matches       CreatorMatch[]
+  @@index([aiScore])
+  @@index([niche], type: Gin)
+  @@index([searchVector], type: Gin)
+  @@index([location(ops: raw("gin_trgm_ops"))], type: Gin)
+}
+
+model Brand {
+  id          String     @id @default(cuid())
+  userId      String     @unique
+  company     String
+  website     String?
+  industry    String?
+  logo        String?
+  createdAt   DateTime   @default(now())
+  updatedAt   DateTime   @updatedAt
+  user        User       @relation(fields: [userId], references: [id], onDelete: Cascade)
+  campaigns   Campaign[]
+}
+
+model Campaign {
+  id           String       @id @default(cuid())
+  brandId      String
+  title        String
+  description  String       @db.Text
+  budget       Float
+  deadline     DateTime
+  niche        String[]
+  platforms    String[]
+  requirements String?      @db.Text
+  status       CampaignStatus @default(ACTIVE)
+  // Kept up to date by a trigger; see prisma/search.sql.
+  searchVector Unsupported("tsvector")?
+  createdAt    DateTime     @default(now())
+  updatedAt    DateTime     @updatedAt
+  brand        Brand        @relation(fields: [brandId], references: [id], onDelete: Cascade)
+  proposals    Proposal[]
+  matches      CreatorMatch[]
+  @@index([brandId, createdAt, id])
+  @@index([status, createdAt, id])
+  @@index([niche], type: Gin)
+  @@index([searchVector], type: Gin)
+  @@index([title(ops: raw("gin_trgm_ops"))], type: Gin)
+}
+
+// Each active campaign's best creators, best first. Written by
+// vps-configs/match_creators.py and read by the discover page.
+model CreatorMatch {
+  campaignId String
+  rank       Int
+  creatorId  String
+  score      Float
+  computedAt DateTime @default(now())
+  campaign   Campaign @relation(fields: [campaignId], references: [id], onDelete: Cascade)
+  creator    Creator  @relation(fields: [creatorId], references: [id], onDelete: Cascade)
+  @@id([campaignId, rank])
+  @@index([creatorId])
+}
+
+model Proposal {
+  id          String         @id @default(cuid())
+  campaignId  String
+  creatorId   String
+  pitch       String         @db.Text
+  rate        Float
+  aiScore     Float?
+  aiFeedback  String?        @db.Text
+  status      ProposalStatus @default(PENDING)
+  createdAt   DateTime       @default(now())
+  updatedAt   DateTime       @updatedAt
+  campaign    Campaign       @relation(fields: [campaignId], references: [id], onDelete: Cascade)
+  creator     Creator        @relation(fields: [creatorId], references: [id], onDelete: Cascade)
+  payments    Payment[]
+  @@index([creatorId, createdAt, id])
+  @@index([campaignId, aiScore, id])
+}
+
+model Payment {
+  id           String        @id @default(cuid())
+  proposalId   String
+  amount       Float
+  currency     String        @default("NGN")
+  reference    String        @unique
+  status       PaymentStatus @default(PENDING)
+  paystackRef  String?
+  createdAt    DateTime      @default(now())
+  proposal     Proposal      @relation(fields: [proposalId], references: [id], onDelete: Cascade)
+  @@index([proposalId])
+}
+
+enum UserRole {
+  CREATOR
+  BRAND
+  ADMIN
+}
+
+enum CampaignStatus {
+  DRAFT
+  ACTIVE
+  PAUSED
+  COMPLETED
+  CANCELLED
+}
+
+enum ProposalStatus {
+  PENDING
+  REVIEWING
+  ACCEPTED
+  REJECTED
+  COMPLETED
+}
+
+enum PaymentStatus {
+  PENDING
+  SUCCESS
+  FAILED
+  REFUNDED
+}
+'''
+
+# Maintained by src/lib/counters.ts when the ``counters`` option is on.
+COUNTERS = {
+    'Creator': (
+        '  proposalCount Int        @default(0)\n'
+        '  acceptedCount Int        @default(0)\n'
+        '  completedCount Int       @default(0)\n'
+        '  earnedTotal   Float      @default(0)\n'
+        '  pendingTotal  Float      @default(0)\n'
+    ),
+    'Campaign': '  proposalCount Int         @default(0)\n',
+}
+
+
+def render(options):
+    if not options.get('counters'):
+        return CONTENT
+    text = CONTENT
+    for model, columns in COUNTERS.items():
+        anchor = text.index('  createdAt', text.index(f'model {model} {{'))
+        text = text[:anchor] + columns + text[anchor:]
+    return text
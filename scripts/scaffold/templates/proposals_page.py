@@ -0,0 +1,66 @@
+"""src/app/(dashboard)/creator/proposals/page.tsx"""
+
+CONTENT = '''import { getServerSession } from "next-auth";
+import { authOptions } from "@/lib/auth";
+import { db } from "@/lib/db";
+import { sessionCreatorId } from "@/lib/session";
+import { DEFAULT_PAGE_SIZE, decodeCursor, keysetWhere, toPage } from "@/lib/pagination";
+import LoadMore from "@/components/LoadMore";
+import ScoreUpdates from "@/components/ScoreUpdates";
+
+export default async function ProposalsPage({ searchParams }: { searchParams: { cursor?: string } }) {
+  const session = await getServerSession(authOptions);
+  const creatorId = await sessionCreatorId(session);
+  const take = DEFAULT_PAGE_SIZE;
+  const rows = creatorId ? await db.proposal.findMany({
+    where: { creatorId, ...keysetWhere("createdAt", decodeCursor(searchParams.cursor)) },
+    include: { campaign: { include: { brand: { include: { user: { select: { name: true } } } } } } },
+    orderBy: [{ createdAt: "desc" }, { id: "desc" }],
+    take: take + 1,
+  }) : [];
+  const { items: proposals, nextCursor } = toPage(rows, take, "createdAt");
+
+  const statusColors: Record<string, string> = {
+    PENDING: "bg-yellow-900/30 text-yellow-400",
+    REVIEWING: "bg-blue-900/30 text-blue-400",
+    ACCEPTED: "bg-green-900/30 text-green-400",
+    REJECTED: "bg-red-900/30 text-red-400",
+    COMPLETED: "bg-gray-700 text-gray-300",
+  };
+
+  return (
+    <div>
+      <div className="mb-8">
+        <h1 className="text-2xl font-bold text-white">My Proposals</h1>
+        <p className="text-gray-400">Track all your campaign applications</p>
+      </div>
+
+      {proposals.some(p => p.aiScore === null) && <ScoreUpdates />}
+      {proposals.length > 0 ? (
+        <div className="space-y-4">
+          {proposals.map(p => (
+            <div key={p.id} className="bg-gray-900 border border-gray-800 rounded-xl p-6">
+              <div className="flex items-center justify-between">
+                <div>
+                  <h3 className="text-white font-semibold">{p.campaign.title}</h3>
+                  <p className="text-gray-400 text-sm mt-1">{p.campaign.brand.user.name} · Rate: ₦{p.rate.toLocaleString()}</p>
+                  {p.aiScore === null
+                    ? <p className="text-gray-500 text-xs mt-1">AI review pending…</p>
+                    : <p className="text-violet-400 text-xs mt-1">AI Score: {p.aiScore}/100</p>}
+                </div>
+                <span className={`px-3 py-1 rounded-full text-xs font-medium ${statusColors[p.status] || ""}`}>{p.status}</span>
+              </div>
+              {p.aiFeedback && <p className="text-gray-400 text-sm mt-3 bg-gray-800 rounded-lg p-3">{p.aiFeedback}</p>}
+            </div>
+          ))}
+          <LoadMore cursor={nextCursor} />
+        </div>
+      ) : (
+        <div className="bg-gray-900 border border-gray-800 rounded-xl p-12 text-center">
+          <p className="text-gray-400">No proposals yet.</p>
+        </div>
+      )}
+    </div>
+  );
+}
+'''
@@ -0,0 +1,36 @@
+"""src/components/ScoreUpdates.tsx"""
+
+CONTENT = '''"use client";
+
+import { useEffect } from "react";
+import { useRouter } from "next/navigation";
+import { io, Socket } from "socket.io-client";
+
+// Refreshes the page when the scoring worker pushes a proposal:scored event,
+// so AI scores appear without polling.
+export default function ScoreUpdates() {
+  const router = useRouter();
+
+  useEffect(() => {
+    let socket: Socket | null = null;
+    let cancelled = false;
+    (async () => {
+      const res = await fetch("/api/socket-auth");
+      if (!res.ok || cancelled) return;
+      const { userId, token } = await res.json();
+      socket = io(process.env.NEXT_PUBLIC_SOCKET_URL || window.location.origin, {
+        path: "/socket.io",
+        auth: { userId, token },
+        transports: ["websocket", "polling"],
+      });
+      socket.on("proposal:scored", () => router.refresh());
+    })().catch(err => console.error("[ScoreUpdates]", err));
+    return () => {
+      cancelled = true;
+      socket?.disconnect();
+    };
+  }, [router]);
+
+  return null;
+}
+'''
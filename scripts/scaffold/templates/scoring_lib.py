@@ -0,0 +1,43 @@
+"""src/lib/scoring.ts"""
+
+CONTENT = '''// Proposal scoring queue. Submitting a proposal only inserts the row and
+// enqueues its id; src/workers/scoring-worker.ts scores it in the background
+// and writes aiScore/aiFeedback back.
+import crypto from "crypto";
+import { Queue } from "bullmq";
+
+export const SCORING_QUEUE = "proposal-scoring";
+
+export const redisConnection = {
+  host: process.env.REDIS_HOST || "127.0.0.1",
+  port: parseInt(process.env.REDIS_PORT || "6379"),
+};
+
+const globalForQueue = globalThis as unknown as { scoringQueue: Queue | undefined };
+
+export const scoringQueue =
+  globalForQueue.scoringQueue ??
+  new Queue(SCORING_QUEUE, {
+    connection: redisConnection,
+    defaultJobOptions: {
+      attempts: 5,
+      backoff: { type: "exponential", delay: 5000 },
+      removeOnComplete: 1000,
+      removeOnFail: 500,
+    },
+  });
+
+if (process.env.NODE_ENV !== "production") globalForQueue.scoringQueue = scoringQueue;
+
+// The job id is the proposal id, so a retried submit never queues it twice.
+export async function enqueueScoring(proposalId: string) {
+  await scoringQueue.add("score", { proposalId }, { jobId: proposalId });
+}
+
+// Identical pitches to the same campaign get the same score; the worker
+// caches results under this key.
+export function scoringKey(pitch: string, campaignId: string): string {
+  const digest = crypto.createHash("sha256").update(campaignId).update("\\0").update(pitch).digest("hex");
+  return `ai:score:${digest}`;
+}
+'''
@@ -0,0 +1,129 @@
+"""src/workers/scoring-worker.ts"""
+
+CONTENT = '''/**
+ * Proposal scoring worker (BullMQ).
+ * Runs as its own process. deploy.py bundles it to dist-workers/scoring-worker.js,
+ * which PM2 runs as novaclio-scoring; locally: npx tsx src/workers/scoring-worker.ts
+ *
+ * Jobs that arrive together are scored as one batch: a single query loads
+ * the proposals, cached results are read with one MGET, only cache misses
+ * call the AI, and the scores are written back in one UPDATE. The BullMQ
+ * limiter caps how many jobs start per window, which bounds AI calls.
+ * Each scored proposal is pushed to its creator through the socket server.
+ */
+
+import { Worker, Job } from "bullmq";
+import IORedis from "ioredis";
+import { Prisma } from "@prisma/client";
+import { db } from "@/lib/db";
+import { checkProposalWithAI } from "@/lib/ai";
+import { SCORING_QUEUE, redisConnection, scoringKey } from "@/lib/scoring";
+
+const BATCH_SIZE = parseInt(process.env.SCORING_BATCH_SIZE || "10");
+const BATCH_WAIT_MS = parseInt(process.env.SCORING_BATCH_WAIT_MS || "200");
+const RATE_MAX = parseInt(process.env.SCORING_RATE_MAX || "30");
+const RATE_WINDOW_MS = parseInt(process.env.SCORING_RATE_WINDOW_MS || "60000");
+const CACHE_TTL = parseInt(process.env.SCORING_CACHE_TTL || String(7 * 24 * 3600));
+const SOCKET_EMIT_URL = `http://127.0.0.1:${process.env.SOCKET_PORT || 3002}/emit`;
+
+const redis = new IORedis({ ...redisConnection, maxRetriesPerRequest: null });
+
+type Result = { score: number; feedback: string };
+type Pending = { proposalId: string; resolve: () => void; reject: (err: unknown) => void };
+
+let pending: Pending[] = [];
+let timer: NodeJS.Timeout | null = null;
+
+function schedule(job: Job): Promise<void> {
+  return new Promise((resolve, reject) => {
+    pending.push({ proposalId: job.data.proposalId, resolve, reject });
+    if (pending.length >= BATCH_SIZE) flush();
+    else if (!timer) timer = setTimeout(flush, BATCH_WAIT_MS);
+  });
+}
+
+function flush() {
+  if (timer) clearTimeout(timer);
+  timer = null;
+  const batch = pending;
+  pending = [];
+  if (batch.length) scoreBatch(batch);
+}
+
+async function scoreBatch(batch: Pending[]) {
+  try {
+    const proposals = await db.proposal.findMany({
+      where: { id: { in: batch.map(b => b.proposalId) } },
+      include: { campaign: true, creator: true },
+    }).then(rows => rows.filter(p => p.aiScore === null));
+    const keys = proposals.map(p => scoringKey(p.pitch, p.campaignId));
+    const cached = keys.length ? await redis.mget(...keys) : [];
+
+    const failed = new Map<string, unknown>();
+    const scored = await Promise.all(proposals.map(async (p, i) => {
+      if (cached[i]) return { p, result: JSON.parse(cached[i]!) as Result };
+      try {
+        const result: Result = await checkProposalWithAI({ pitch: p.pitch, campaign: p.campaign, creator: p.creator });
+        await redis.set(keys[i], JSON.stringify(result), "EX", CACHE_TTL);
+        return { p, result };
+      } catch (err) {
+        failed.set(p.id, err);
+        return null;
+      }
+    }));
+    const done = scored.filter((s): s is { p: (typeof proposals)[number]; result: Result } => s !== null);
+
+    if (done.length) {
+      const values = Prisma.join(done.map(({ p, result }) => Prisma.sql`(${p.id}, ${result.score}::float8, ${result.feedback})`));
+      await db.$executeRaw`
+        UPDATE "Proposal" AS p SET "aiScore" = v.score, "aiFeedback" = v.feedback
+        FROM (VALUES ${values}) AS v(id, score, feedback)
+        WHERE p.id = v.id AND p."aiScore" IS NULL`;
+      await Promise.allSettled(done.map(({ p, result }) => fetch(SOCKET_EMIT_URL, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          userId: p.creator.userId,
+          event: "proposal:scored",
+          data: { proposalId: p.id, aiScore: result.score, aiFeedback: result.feedback },
+        }),
+      })));
+    }
+
+    for (const b of batch) {
+      const err = failed.get(b.proposalId);
+      if (err) b.reject(err);  // BullMQ retries with backoff
+      else b.resolve();
+    }
+  } catch (err) {
+    for (const b of batch) b.reject(err);
+  }
+}
+
+const worker = new Worker(SCORING_QUEUE, schedule, {
+  connection: redisConnection,
+  concurrency: BATCH_SIZE,
+  limiter: { max: RATE_MAX, duration: RATE_WINDOW_MS },
+});
+
+worker.on("failed", (job, err) => {
+  console.error(`[Scoring] Job ${job?.id} failed:`, err.message);
+});
+
+worker.on("error", (err) => {
+  console.error("[Scoring] Worker error:", err);
+});
+
+console.log(`[Scoring] Started — batches of ${BATCH_SIZE}, ${RATE_MAX} jobs per ${RATE_WINDOW_MS}ms`);
+
+// PM2 stops processes with SIGINT; docker and systemd send SIGTERM.
+const shutdown = async () => {
+  await worker.close();
+  flush();
+  await redis.quit();
+  await db.$disconnect();
+  process.exit(0);
+};
+process.on("SIGTERM", shutdown);
+process.on("SIGINT", shutdown);
+'''
@@ -0,0 +1,21 @@
+"""src/app/api/search/campaigns/route.ts"""
+
+CONTENT = '''import { NextRequest, NextResponse } from "next/server";
+import { MAX_QUERY_LENGTH, searchCampaigns } from "@/lib/search";
+import { decodeCursor, pageSize, toPage } from "@/lib/pagination";
+
+export async function GET(req: NextRequest) {
+  try {
+    const { searchParams } = new URL(req.url);
+    const q = (searchParams.get("q") ?? "").trim().slice(0, MAX_QUERY_LENGTH);
+    if (!q) return NextResponse.json({ error: "Missing search query" }, { status: 400 });
+
+    const take = pageSize(searchParams.get("limit"));
+    const cursor = decodeCursor(searchParams.get("cursor"));
+    const rows = await searchCampaigns(q, { niche: searchParams.get("niche"), take, cursor });
+    return NextResponse.json(toPage(rows, take, "rank"));
+  } catch (error) {
+    return NextResponse.json({ error: "Failed to search campaigns" }, { status: 500 });
+  }
+}
+'''
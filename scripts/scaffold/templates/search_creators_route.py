@@ -0,0 +1,26 @@
+"""src/app/api/search/creators/route.ts"""
+
+CONTENT = '''import { NextRequest, NextResponse } from "next/server";
+import { getServerSession } from "next-auth";
+import { authOptions } from "@/lib/auth";
+import { MAX_QUERY_LENGTH, searchCreators } from "@/lib/search";
+import { decodeCursor, pageSize, toPage } from "@/lib/pagination";
+
+export async function GET(req: NextRequest) {
+  try {
+    const session = await getServerSession(authOptions);
+    if (!session) return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
+
+    const { searchParams } = new URL(req.url);
+    const q = (searchParams.get("q") ?? "").trim().slice(0, MAX_QUERY_LENGTH);
+    if (!q) return NextResponse.json({ error: "Missing search query" }, { status: 400 });
+
+    const take = pageSize(searchParams.get("limit"));
+    const cursor = decodeCursor(searchParams.get("cursor"));
+    const rows = await searchCreators(q, { niche: searchParams.get("niche"), take, cursor });
+    return NextResponse.json(toPage(rows, take, "rank"));
+  } catch (error) {
+    return NextResponse.json({ error: "Failed to search creators" }, { status: 500 });
+  }
+}
+'''
@@ -0,0 +1,198 @@
+"""vps-configs/search_index.py"""
+
+CONTENT = '''#!/usr/bin/env python3
+"""Apply prisma/search.sql and keep the search vectors and indexes built.
+
+    python3 vps-configs/search_index.py migrate [--app-dir DIR] [--batch N] [--pause S]
+    python3 vps-configs/search_index.py backfill [--all] [--model M] [--batch N] [--pause S]
+    python3 vps-configs/search_index.py reindex [--model M]
+    python3 vps-configs/search_index.py status
+
+migrate runs everything in search.sql before its CREATE INDEX lines in one
+transaction: the extension, the columns, the functions and the triggers.
+It then fills the rows that have no search vector yet and builds each
+index CONCURRENTLY. An INVALID index left by an interrupted build is
+dropped and built again. Every step is idempotent, so deploy.py runs it
+on each deploy that touches search.sql, and it only does real work the
+first time.
+
+backfill sets "searchVector" for rows where it is NULL, or for every row
+with --all (after changing the weights in search.sql). Rows are walked by
+id in batches, with each batch in its own short transaction, so writes to
+the table are never blocked for long. reindex rebuilds the search indexes
+CONCURRENTLY when they have bloated. status prints row counts, rows still
+missing a vector, and each index's validity and size.
+
+Connects over DIRECT_URL (environment, then the app's .env files), since
+PgBouncer's transaction pooling cannot run CREATE INDEX CONCURRENTLY.
+Standard library only; the server is reached with psql.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+import urllib.parse
+
+from check_pool import APP_DIR, PRISMA_PARAMS, load_env
+
+SQL_PATH = 'prisma/search.sql'
+MODELS = {'Campaign': 'campaign_search_vector', 'Creator': 'creator_search_vector'}
+INDEX = re.compile(r'^CREATE INDEX IF NOT EXISTS "(\\w+)" ON "(\\w+)".*;$', re.M)
+LOCK_TIMEOUT = '2s'
+RETRIES = 5
+
+
+class Psql:
+    def __init__(self, url):
+        parts = urllib.parse.urlsplit(url)
+        query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query) if k not in PRISMA_PARAMS]
+        self.url = urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+    def run(self, sql, single=False, check=True):
+        """Run ``sql`` and return its rows as lists of strings."""
+        args = ['psql', self.url, '-X', '-q', '-At', '-F', '\\t', '-v', 'ON_ERROR_STOP=1', '-f', '-']
+        try:
+            out = subprocess.run(args + (['-1'] if single else []), input=sql, capture_output=True, text=True)
+        except FileNotFoundError:
+            sys.exit('psql is not installed')
+        if out.returncode and check:
+            raise RuntimeError(out.stderr.strip())
+        return [line.split('\\t') for line in out.stdout.splitlines() if line]
+
+    def value(self, sql):
+        rows = self.run(sql)
+        return rows[0][0] if rows else None
+
+
+def split(text):
+    """``(setup, indexes)``: the SQL before the first CREATE INDEX, and ``[(name, table, statement)]``."""
+    first = INDEX.search(text)
+    if not first:
+        return text, []
+    return text[:first.start()], [(m.group(1), m.group(2), m.group(0)) for m in INDEX.finditer(text)]
+
+
+def lock_retry(db, sql, what):
+    """Run ``sql`` in one transaction, retrying when it cannot get its locks in time."""
+    for attempt in range(1, RETRIES + 1):
+        try:
+            return db.run(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}';\\n{sql}", single=True)
+        except RuntimeError as err:
+            if 'lock timeout' not in str(err) or attempt == RETRIES:
+                raise
+            print(f'  {what}: lock timeout, retrying ({attempt}/{RETRIES})')
+            time.sleep(attempt)
+
+
+def backfill(db, model, batch, pause, everything=False):
+    """Set the search vector on ``model``'s rows, ``batch`` rows per transaction."""
+    function = MODELS[model]
+    missing = '' if everything else ' AND "searchVector" IS NULL'
+    last, total, started = '', 0, time.monotonic()
+    while True:
+        rows = lock_retry(db, f\'\'\'
+            WITH batch AS (
+              SELECT id FROM "{model}" WHERE id > '{last}'{missing} ORDER BY id LIMIT {batch}
+            ), updated AS (
+              UPDATE "{model}" t SET "searchVector" = {function}(t)
+              FROM batch WHERE t.id = batch.id RETURNING t.id
+            )
+            SELECT count(*), max(id) FROM updated;\'\'\', model)
+        count, top = int(rows[0][0]), rows[0][1]
+        if not count:
+            break
+        total, last = total + count, top
+        print(f'  {model}: {total} rows ({total / (time.monotonic() - started):.0f}/s)', end='\\r', flush=True)
+        time.sleep(pause)
+    print(f'  {model}: {total} rows set' + ' ' * 20)
+    return total
+
+
+def index_state(db, name):
+    """``None`` if index ``name`` does not exist, else whether it is valid."""
+    valid = db.value(f"SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                     f"WHERE c.relname = '{name}';")
+    return None if valid is None else valid == 't'
+
+
+def build_index(db, name, statement):
+    if index_state(db, name) is False:
+        print(f'  {name}: dropping an invalid index left by an interrupted build')
+        db.run(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}";')
+    if index_state(db, name):
+        print(f'  {name}: ok')
+        return
+    started = time.monotonic()
+    db.run(statement.replace('CREATE INDEX IF NOT EXISTS', 'CREATE INDEX CONCURRENTLY IF NOT EXISTS'))
+    print(f'  {name}: built in {time.monotonic() - started:.1f}s')
+
+
+def migrate(db, text, batch, pause):
+    setup, indexes = split(text)
+    print('search.sql: extension, columns, functions and triggers')
+    lock_retry(db, setup, 'setup')
+    print('search vectors:')
+    for model in MODELS:
+        backfill(db, model, batch, pause)
+    print('indexes:')
+    for name, _, statement in indexes:
+        build_index(db, name, statement)
+
+
+def reindex(db, indexes, models):
+    for name, table, _ in indexes:
+        if table in models:
+            started = time.monotonic()
+            db.run(f'REINDEX INDEX CONCURRENTLY "{name}";')
+            print(f'  {name}: rebuilt in {time.monotonic() - started:.1f}s')
+
+
+def status(db, indexes):
+    for model in MODELS:
+        rows, missing = db.run(f'SELECT count(*), count(*) FILTER (WHERE "searchVector" IS NULL) FROM "{model}";')[0]
+        print(f'{model:10} {rows:>10} rows  {missing:>10} without a search vector')
+    for name, table, _ in indexes:
+        state = db.run(f"SELECT i.indisvalid, pg_size_pretty(pg_relation_size(c.oid)) FROM pg_index i "
+                       f"JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = '{name}';")
+        label = 'missing' if not state else ('valid' if state[0][0] == 't' else 'INVALID') + f'  {state[0][1]}'
+        print(f'{name:28} {label}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply search.sql and maintain the search vectors and indexes')
+    parser.add_argument('command', choices=('migrate', 'backfill', 'reindex', 'status'))
+    parser.add_argument('--app-dir', default=APP_DIR)
+    parser.add_argument('--database-url', help='default: DIRECT_URL')
+    parser.add_argument('--model', choices=sorted(MODELS), help='backfill or reindex one model only')
+    parser.add_argument('--all', action='store_true', help='backfill every row, not just those without a vector')
+    parser.add_argument('--batch', type=int, default=1000, help='rows per backfill transaction')
+    parser.add_argument('--pause', type=float, default=0.05, help='seconds to sleep between batches')
+    args = parser.parse_args(argv)
+
+    url = args.database_url or load_env(args.app_dir).get('DIRECT_URL')
+    if not url:
+        sys.exit('DIRECT_URL is not set; pass --database-url')
+    with open(os.path.join(args.app_dir, SQL_PATH)) as f:
+        text = f.read()
+    db = Psql(url)
+    models = [args.model] if args.model else list(MODELS)
+    try:
+        if args.command == 'migrate':
+            migrate(db, text, args.batch, args.pause)
+        elif args.command == 'backfill':
+            for model in models:
+                backfill(db, model, args.batch, args.pause, args.all)
+        elif args.command == 'reindex':
+            reindex(db, split(text)[1], models)
+        else:
+            status(db, split(text)[1])
+    except RuntimeError as err:
+        sys.exit(f'psql failed: {err}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+'''
@@ -0,0 +1,94 @@
+"""src/lib/search.ts"""
+
+CONTENT = '''// Ranked search over campaigns and creators, backed by the "searchVector"
+// columns and indexes in prisma/search.sql.
+//
+// A row matches when its search vector matches the query (websearch syntax:
+// quoted phrases, OR, -word) or when the query is a close trigram match for
+// a word in its title (campaigns) or location (creators), which catches
+// typos and partial words. Rank adds the two scores together. The cursor
+// on (rank, id) keeps pages stable, but rank is computed per query and no
+// index orders by it, so every page still ranks the full match set. Fine
+// for the first few pages; not meant for deep pagination.
+import { Prisma } from "@prisma/client";
+import { db } from "@/lib/db";
+import type { Cursor } from "@/lib/pagination";
+
+export const MAX_QUERY_LENGTH = 200;
+
+export type CampaignHit = {
+  id: string;
+  title: string;
+  description: string;
+  budget: number;
+  deadline: Date;
+  niche: string[];
+  platforms: string[];
+  createdAt: Date;
+  brandName: string;
+  rank: number;
+};
+
+export type CreatorHit = {
+  id: string;
+  name: string | null;
+  bio: string | null;
+  niche: string[];
+  location: string | null;
+  followers: number;
+  engagementRate: number;
+  aiScore: number;
+  ratePerPost: number | null;
+  verified: boolean;
+  rank: number;
+};
+
+type SearchOptions = { niche?: string | null; take: number; cursor: Cursor | null };
+
+// Rows after the cursor in (rank desc, id desc) order.
+function after(cursor: Cursor | null): Prisma.Sql {
+  const rank = Number(cursor?.value);
+  if (!cursor || !Number.isFinite(rank)) return Prisma.empty;
+  return Prisma.sql`WHERE (r.rank, r.id) < (${rank}::float8, ${cursor.id})`;
+}
+
+function inNiche(niche?: string | null): Prisma.Sql {
+  return niche ? Prisma.sql`AND t.niche @> ARRAY[${niche}]` : Prisma.empty;
+}
+
+/** Active campaigns matching `q`, best match first; fetches take + 1 rows for toPage(). */
+export async function searchCampaigns(q: string, { niche, take, cursor }: SearchOptions): Promise<CampaignHit[]> {
+  const rows: CampaignHit[] = await db.$queryRaw`
+    SELECT * FROM (
+      SELECT t.id, t.title, t.description, t.budget, t.deadline, t.niche, t.platforms, t."createdAt",
+             b.company AS "brandName",
+             (ts_rank_cd(t."searchVector", s.query, 32) + word_similarity(${q}, t.title))::float8 AS rank
+      FROM "Campaign" t
+      CROSS JOIN websearch_to_tsquery('english', ${q}) AS s(query)
+      JOIN "Brand" b ON b.id = t."brandId"
+      WHERE t.status = 'ACTIVE' AND (t."searchVector" @@ s.query OR ${q} <% t.title) ${inNiche(niche)}
+    ) r
+    ${after(cursor)}
+    ORDER BY r.rank DESC, r.id DESC
+    LIMIT ${take + 1}`;
+  return rows;
+}
+
+/** Creators matching `q`, best match first; fetches take + 1 rows for toPage(). */
+export async function searchCreators(q: string, { niche, take, cursor }: SearchOptions): Promise<CreatorHit[]> {
+  const rows: CreatorHit[] = await db.$queryRaw`
+    SELECT * FROM (
+      SELECT t.id, u.name, t.bio, t.niche, t.location, t.followers, t."engagementRate", t."aiScore",
+             t."ratePerPost", t.verified,
+             (ts_rank_cd(t."searchVector", s.query, 32) + word_similarity(${q}, coalesce(t.location, '')))::float8 AS rank
+      FROM "Creator" t
+      CROSS JOIN websearch_to_tsquery('english', ${q}) AS s(query)
+      JOIN "User" u ON u.id = t."userId"
+      WHERE (t."searchVector" @@ s.query OR ${q} <% t.location) ${inNiche(niche)}
+    ) r
+    ${after(cursor)}
+    ORDER BY r.rank DESC, r.id DESC
+    LIMIT ${take + 1}`;
+  return rows;
+}
+'''
@@ -0,0 +1,68 @@
+"""prisma/search.sql"""
+
+CONTENT = '''-- Full-text and trigram search for campaigns and creators.
+--
+-- Applied with `python3 vps-configs/search_index.py migrate`; the deploy
+-- runner does this after `prisma migrate deploy`. Every statement is
+-- idempotent, so it is safe on a database built with `prisma db push`,
+-- which already has the columns and indexes from schema.prisma.
+--
+-- "searchVector" is a plain column kept current by a trigger instead of a
+-- GENERATED column. Adding a generated column rewrites the whole table
+-- under an exclusive lock. A nullable column is added instantly, and
+-- search_index.py fills existing rows in short batches. The CREATE INDEX
+-- statements must stay one per line: search_index.py runs them
+-- CONCURRENTLY after the backfill, and everything above them in one
+-- transaction.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE "Campaign" ADD COLUMN IF NOT EXISTS "searchVector" tsvector;
+ALTER TABLE "Creator" ADD COLUMN IF NOT EXISTS "searchVector" tsvector;
+
+-- Weights: A for what a row is about (title, niches, location), B for the
+-- body text, C for fine print. One text search config throughout, so a
+-- query parsed with websearch_to_tsquery('english', ...) matches every part.
+CREATE OR REPLACE FUNCTION campaign_search_vector(c "Campaign") RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+  SELECT setweight(to_tsvector('english', coalesce(c.title, '')), 'A')
+      || setweight(to_tsvector('english', array_to_string(c.niche, ' ')), 'A')
+      || setweight(to_tsvector('english', coalesce(c.description, '')), 'B')
+      || setweight(to_tsvector('english', coalesce(c.requirements, '')), 'C')
+$$;
+
+CREATE OR REPLACE FUNCTION creator_search_vector(c "Creator") RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+  SELECT setweight(to_tsvector('english', array_to_string(c.niche, ' ')), 'A')
+      || setweight(to_tsvector('english', coalesce(c.location, '')), 'A')
+      || setweight(to_tsvector('english', coalesce(c.bio, '')), 'B')
+$$;
+
+CREATE OR REPLACE FUNCTION campaign_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  NEW."searchVector" := campaign_search_vector(NEW);
+  RETURN NEW;
+END $$;
+
+CREATE OR REPLACE FUNCTION creator_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  NEW."searchVector" := creator_search_vector(NEW);
+  RETURN NEW;
+END $$;
+
+CREATE OR REPLACE TRIGGER campaign_search_vector
+  BEFORE INSERT OR UPDATE OF title, niche, description, requirements ON "Campaign"
+  FOR EACH ROW EXECUTE FUNCTION campaign_search_vector_update();
+
+CREATE OR REPLACE TRIGGER creator_search_vector
+  BEFORE INSERT OR UPDATE OF niche, location, bio ON "Creator"
+  FOR EACH ROW EXECUTE FUNCTION creator_search_vector_update();
+
+-- Index names match the ones Prisma derives from schema.prisma.
+CREATE INDEX IF NOT EXISTS "Campaign_searchVector_idx" ON "Campaign" USING gin ("searchVector");
+CREATE INDEX IF NOT EXISTS "Campaign_title_idx" ON "Campaign" USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "Creator_searchVector_idx" ON "Creator" USING gin ("searchVector");
+CREATE INDEX IF NOT EXISTS "Creator_location_idx" ON "Creator" USING gin (location gin_trgm_ops);
+'''
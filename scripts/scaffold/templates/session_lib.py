@@ -0,0 +1,26 @@
+"""src/lib/session.ts"""
+
+CONTENT = '''import type { Session } from "next-auth";
+import { db } from "@/lib/db";
+
+// Profile ids for the signed-in user, read from the session (see auth.ts).
+// A session minted before the profile existed has a null id until the
+// client calls update(). Until then it falls back to one lookup on the
+// unique Creator/Brand.userId, never the email join.
+
+export async function sessionCreatorId(session: Session | null): Promise<string | null> {
+  if (!session?.user?.id) return null;
+  if (session.user.creatorId) return session.user.creatorId;
+  if (session.user.role !== "CREATOR") return null;
+  const creator = await db.creator.findUnique({ where: { userId: session.user.id }, select: { id: true } });
+  return creator?.id ?? null;
+}
+
+export async function sessionBrandId(session: Session | null): Promise<string | null> {
+  if (!session?.user?.id) return null;
+  if (session.user.brandId) return session.user.brandId;
+  if (session.user.role !== "BRAND") return null;
+  const brand = await db.brand.findUnique({ where: { userId: session.user.id }, select: { id: true } });
+  return brand?.id ?? null;
+}
+'''
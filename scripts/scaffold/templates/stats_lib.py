@@ -0,0 +1,75 @@
+"""src/lib/stats.ts"""
+
+HEADER = '''// Dashboard stats. Counts and rate sums are computed by Postgres (or read
+// from maintained counter columns) instead of loading every proposal row.
+import { db } from "@/lib/db";
+
+export type CreatorStats = { proposals: number; accepted: number; completed: number; earned: number; pending: number };
+export type BrandStats = { campaigns: number; active: number; proposals: number };
+'''
+
+CONTENT = HEADER + '''
+export async function creatorStats(creatorId: string): Promise<CreatorStats> {
+  const rows = await db.proposal.groupBy({
+    by: ["status"],
+    where: { creatorId },
+    _count: { _all: true },
+    _sum: { rate: true },
+  });
+  const bucket = (status: string) => rows.find(r => r.status === status);
+  return {
+    proposals: rows.reduce((s, r) => s + r._count._all, 0),
+    accepted: bucket("ACCEPTED")?._count._all ?? 0,
+    completed: bucket("COMPLETED")?._count._all ?? 0,
+    earned: bucket("COMPLETED")?._sum.rate ?? 0,
+    pending: bucket("ACCEPTED")?._sum.rate ?? 0,
+  };
+}
+
+export async function brandStats(brandId: string): Promise<BrandStats> {
+  const [rows, proposals] = await Promise.all([
+    db.campaign.groupBy({ by: ["status"], where: { brandId }, _count: { _all: true } }),
+    db.proposal.count({ where: { campaign: { brandId } } }),
+  ]);
+  return {
+    campaigns: rows.reduce((s, r) => s + r._count._all, 0),
+    active: rows.find(r => r.status === "ACTIVE")?._count._all ?? 0,
+    proposals,
+  };
+}
+'''
+
+COUNTED = HEADER + '''
+// Counter columns are kept in step by src/lib/counters.ts.
+export async function creatorStats(creatorId: string): Promise<CreatorStats> {
+  const c = await db.creator.findUnique({
+    where: { id: creatorId },
+    select: { proposalCount: true, acceptedCount: true, completedCount: true, earnedTotal: true, pendingTotal: true },
+  });
+  return {
+    proposals: c?.proposalCount ?? 0,
+    accepted: c?.acceptedCount ?? 0,
+    completed: c?.completedCount ?? 0,
+    earned: c?.earnedTotal ?? 0,
+    pending: c?.pendingTotal ?? 0,
+  };
+}
+
+export async function brandStats(brandId: string): Promise<BrandStats> {
+  const rows = await db.campaign.groupBy({
+    by: ["status"],
+    where: { brandId },
+    _count: { _all: true },
+    _sum: { proposalCount: true },
+  });
+  return {
+    campaigns: rows.reduce((s, r) => s + r._count._all, 0),
+    active: rows.find(r => r.status === "ACTIVE")?._count._all ?? 0,
+    proposals: rows.reduce((s, r) => s + (r._sum.proposalCount ?? 0), 0),
+  };
+}
+'''
+
+
+def render(options):
+    return COUNTED if options.get('counters') else CONTENT
@@ -0,0 +1,96 @@
+"""src/lib/timing.ts"""
+
+CONTENT = '''// Server-Timing instrumentation for route handlers (emitted with --timing).
+// A sampled request records the time spent in each phase (session, db, ai,
+// queue, parse, serialize). The phases are reported on the response as a
+// Server-Timing header and as one JSON log line. On unsampled requests
+// phase() just calls through.
+// SERVER_TIMING_SAMPLE_RATE (0 to 1, default 0.05) is the share of
+// requests sampled.
+// Overlapping phases (Promise.all) are summed, so they can add up to more
+// than the total. "app" is whatever the total leaves after the phases.
+
+import { AsyncLocalStorage } from "node:async_hooks";
+
+const SAMPLE_RATE = Math.min(1, Math.max(0, parseFloat(process.env.SERVER_TIMING_SAMPLE_RATE ?? "0.05") || 0));
+
+type Phase = { ms: number; count: number };
+const current = new AsyncLocalStorage<Map<string, Phase>>();
+
+const round = (ms: number) => Math.round(ms * 10) / 10;
+
+function record(phases: Map<string, Phase>, name: string, start: number) {
+  const ms = performance.now() - start;
+  const seen = phases.get(name);
+  if (seen) {
+    seen.ms += ms;
+    seen.count++;
+  } else {
+    phases.set(name, { ms, count: 1 });
+  }
+}
+
+// Prisma queries are lazy thenables, so the query runs (and is timed) when
+// this chains onto it. Don't wrap queries passed to db.$transaction([...]).
+export function phase<T>(name: string, fn: () => T): T {
+  const phases = current.getStore();
+  if (!phases) return fn();
+  const start = performance.now();
+  let result: T;
+  try {
+    result = fn();
+  } catch (e) {
+    record(phases, name, start);
+    throw e;
+  }
+  if (typeof (result as { then?: unknown })?.then === "function") {
+    return Promise.resolve(result).finally(() => record(phases, name, start)) as unknown as T;
+  }
+  record(phases, name, start);
+  return result;
+}
+
+function report(route: string, total: number, phases: Map<string, Phase>, res: Response | undefined) {
+  let accounted = 0;
+  const header: string[] = [];
+  const logged: Record<string, number> = {};
+  for (const [name, { ms, count }] of phases) {
+    accounted += ms;
+    header.push(`${name};dur=${ms.toFixed(1)}${count > 1 ? `;desc="${count} calls"` : ""}`);
+    logged[name] = round(ms);
+  }
+  const app = Math.max(0, total - accounted);
+  header.push(`app;dur=${app.toFixed(1)}`, `total;dur=${total.toFixed(1)}`);
+  try {
+    res?.headers.append("Server-Timing", header.join(", "));
+  } catch {
+    // Immutable headers (a proxied fetch Response); the log line still has it.
+  }
+  console.log(JSON.stringify({
+    msg: "server-timing",
+    route,
+    status: res?.status ?? 500,
+    total: round(total),
+    app: round(app),
+    phases: logged,
+  }));
+}
+
+export function timed<R extends Request, A extends unknown[]>(
+  route: string,
+  handler: (req: R, ...rest: A) => Promise<Response>
+) {
+  return async (req: R, ...rest: A): Promise<Response> => {
+    if (SAMPLE_RATE === 0 || Math.random() >= SAMPLE_RATE) return handler(req, ...rest);
+    const phases = new Map<string, Phase>();
+    const start = performance.now();
+    let res: Response | undefined;
+    try {
+      res = await current.run(phases, () => handler(req, ...rest));
+      return res;
+    } finally {
+      report(route, performance.now() - start, phases, res);
+    }
+  };
+}
+'''
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""Stream synthetic marketplace data as Postgres COPY input.
+
+    seed_data.py [--creators N] [--brands N] [--campaigns N] [--seed N]
+                 [--counters] [--truncate] [--password-hash HASH] [-o FILE]
+    seed_data.py --creators 1000000 --truncate | psql "$DATABASE_URL"
+
+Writes one ``COPY ... FROM stdin`` section per table (User, Creator, Brand,
+Campaign, Proposal, Payment) inside a single transaction, then ANALYZE.
+Columns come from the model definitions in the embedded Prisma schema: the
+generators below fill in the columns they know, other columns keep their
+database default, and any required column without one gets a type-based
+placeholder, so the output follows the schema the scaffold emits.
+
+Rows are derived from the seed and the row index alone; later sections
+regenerate the campaign or proposal they refer to instead of remembering
+it, so memory stays constant whatever the size. The data is skewed the
+way a marketplace is: a few niches and Lagos dominate, follower counts are
+log-normal, a minority of creators send most proposals, and proposals per
+campaign follow a long tail.
+"""
+import argparse
+import datetime
+import json
+import math
+import random
+import sys
+
+from scaffold import prisma
+
+EPOCH = datetime.datetime(2026, 1, 1)
+HISTORY_DAYS = 730
+
+NICHES = [('fashion', 18), ('beauty', 15), ('lifestyle', 12), ('food', 10), ('tech', 8), ('fitness', 8),
+          ('travel', 7), ('gaming', 6), ('music', 5), ('comedy', 4), ('finance', 3), ('education', 2),
+          ('parenting', 2)]
+CITIES = [('Lagos', 45), ('Abuja', 15), ('Port Harcourt', 8), ('Ibadan', 6), ('Kano', 5), ('Enugu', 4),
+          ('Benin City', 4), ('Accra', 5), ('Nairobi', 4), ('London', 4)]
+PLATFORMS = ['instagram', 'tiktok', 'youtube', 'twitter']
+INDUSTRIES = ['Fashion', 'Beauty', 'FMCG', 'Fintech', 'Telecoms', 'Food & Drink', 'Gaming', 'Travel', 'Education']
+SYLLABLES = ['ko', 'la', 'mi', 'zu', 'ra', 'ne', 'to', 'bi', 'sa', 'de', 'yo', 'fa', 'ri', 'nu', 'ka']
+CAMPAIGN_STATUS = [('ACTIVE', 55), ('COMPLETED', 25), ('PAUSED', 8), ('DRAFT', 7), ('CANCELLED', 5)]
+PROPOSAL_STATUS = [('PENDING', 45), ('REJECTED', 20), ('REVIEWING', 15), ('ACCEPTED', 12), ('COMPLETED', 8)]
+
+# Counter columns the --counters schema adds; recomputed after the load.
+RECONCILE = '''UPDATE "Creator" c SET
+  "proposalCount" = s.proposals, "acceptedCount" = s.accepted, "completedCount" = s.completed,
+  "earnedTotal" = s.earned, "pendingTotal" = s.pending
+FROM (
+  SELECT "creatorId" AS id, count(*)::int AS proposals,
+    (count(*) FILTER (WHERE status = 'ACCEPTED'))::int AS accepted,
+    (count(*) FILTER (WHERE status = 'COMPLETED'))::int AS completed,
+    COALESCE(sum(rate) FILTER (WHERE status = 'COMPLETED'), 0) AS earned,
+    COALESCE(sum(rate) FILTER (WHERE status = 'ACCEPTED'), 0) AS pending
+  FROM "Proposal" GROUP BY "creatorId"
+) s
+WHERE s.id = c.id;
+'''
+
+
+def _weighted(table):
+    values = [v for v, _ in table]
+    cum, total = [], 0
+    for _, w in table:
+        total += w
+        cum.append(total)
+    return values, cum
+
+
+_NICHES, _CITIES = _weighted(NICHES), _weighted(CITIES)
+_CAMPAIGN_STATUS, _PROPOSAL_STATUS = _weighted(CAMPAIGN_STATUS), _weighted(PROPOSAL_STATUS)
+
+
+def pick(rng, weighted):
+    values, cum = weighted
+    return rng.choices(values, cum_weights=cum)[0]
+
+
+def niches(rng):
+    return sorted({pick(rng, _NICHES) for _ in range(rng.choice((1, 1, 2, 2, 3)))})
+
+
+def skewed(rng, n, power=2.2):
+    """An index in ``range(n)`` favouring low indices."""
+    return min(n - 1, int(n * rng.random() ** power))
+
+
+def timestamp(rng, after=None):
+    if after is None:
+        return EPOCH - datetime.timedelta(seconds=rng.uniform(0, HISTORY_DAYS * 86400))
+    span = max(60.0, (EPOCH - after).total_seconds())
+    return after + datetime.timedelta(seconds=rng.uniform(60, span))
+
+
+def _pool(size, seed):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))) for _ in range(size)]
+
+
+# Words and text are drawn from fixed pools so a row costs a few random
+# calls, not one per syllable.
+WORDS = _pool(4096, 'words')
+NAMES = [w.title() for w in WORDS]
+CORPUS = ' '.join(_pool(50_000, 'corpus'))
+
+
+def name(rng, parts=2):
+    return ' '.join(rng.choice(NAMES) for _ in range(parts))
+
+
+def text(rng, words):
+    """Roughly ``words`` words of filler, cut from the corpus at a random offset."""
+    length = words * 7
+    start = CORPUS.find(' ', rng.randrange(len(CORPUS) - length - 16)) + 1
+    end = CORPUS.rfind(' ', start, start + length)
+    return CORPUS[start:end]
+
+
+class Generator:
+    """Row factories for one dataset; every row is a pure function of ``(seed, index)``."""
+
+    def __init__(self, creators, brands, campaigns, seed=0, password_hash=None):
+        self.creators, self.brands, self.campaigns = creators, brands, campaigns
+        self.seed = seed
+        self.password_hash = password_hash
+
+    def rng(self, table, index):
+        return random.Random((self.seed * 1_000_003 + table) * 4_294_967_311 + index)
+
+    def creator_id(self, i):
+        return f'crt_{i:09d}'
+
+    def brand_id(self, i):
+        return f'brd_{i:07d}'
+
+    def users(self):
+        for i in range(self.creators + self.brands):
+            rng = self.rng(1, i)
+            is_creator = i < self.creators
+            created = timestamp(rng)
+            yield {
+                'id': f'usr_{i:09d}',
+                'email': f'creator{i}@example.test' if is_creator else f'brand{i - self.creators}@example.test',
+                'name': name(rng),
+                'password': self.password_hash,
+                'role': 'CREATOR' if is_creator else 'BRAND',
+                'createdAt': created,
+                'updatedAt': created,
+            }
+
+    def creator(self, i):
+        rng = self.rng(2, i)
+        followers = int(min(2e7, rng.lognormvariate(8.5, 1.6)))
+        engagement = round(min(25.0, rng.lognormvariate(1.2, 0.5) * (10_000 / (followers + 10_000)) ** 0.3), 2)
+        created = timestamp(rng)
+        handle = rng.choice(WORDS) + str(i)
+        topics = niches(rng)
+        return {
+            'id': self.creator_id(i),
+            'userId': f'usr_{i:09d}',
+            'bio': f'{handle} creates {", ".join(topics)} content.' if rng.random() < 0.8 else None,
+            'niche': topics,
+            'platforms': {p: f'@{handle}' for p in rng.sample(PLATFORMS, rng.randint(1, 3))},
+            'followers': followers,
+            'engagementRate': engagement,
+            'aiScore': round(100 * rng.betavariate(5, 2.5), 1),
+            'location': pick(rng, _CITIES) if rng.random() < 0.9 else None,
+            'ratePerPost': round(max(5_000, followers * rng.uniform(2, 8)), -3) if rng.random() < 0.7 else None,
+            'portfolioUrl': f'https://portfolio.example.test/{handle}' if rng.random() < 0.3 else None,
+            'verified': rng.random() < 0.1,
+            'createdAt': created,
+            'updatedAt': created,
+        }
+
+    def brand(self, i):
+        rng = self.rng(3, i)
+        created = timestamp(rng)
+        company = name(rng, rng.randint(1, 2))
+        return {
+            'id': self.brand_id(i),
+            'userId': f'usr_{self.creators + i:09d}',
+            'company': company,
+            'website': f'https://{company.replace(" ", "").lower()}.example.test' if rng.random() < 0.7 else None,
+            'industry': rng.choice(INDUSTRIES),
+            'logo': None,
+            'createdAt': created,
+            'updatedAt': created,
+        }
+
+    def campaign(self, j):
+        rng = self.rng(4, j)
+        created = timestamp(rng)
+        status = pick(rng, _CAMPAIGN_STATUS)
+        proposals = 0 if status == 'DRAFT' else min(500, int(rng.lognormvariate(1.6, 0.9)))
+        return {
+            'id': f'cmp_{j:09d}',
+            'brandId': self.brand_id(skewed(rng, self.brands, 1.6)),
+            'title': f'{name(rng, 1)} {rng.choice(["launch", "promo", "challenge", "review", "giveaway"])}',
+            'description': f'Campaign brief {j}. ' + text(rng, rng.randint(20, 80)),
+            'budget': round(rng.lognormvariate(13, 1), -3),
+            'deadline': created + datetime.timedelta(days=rng.randint(7, 90)),
+            'niche': niches(rng),
+            'platforms': sorted(rng.sample(PLATFORMS, rng.randint(1, 3))),
+            'requirements': 'Post within the deadline and tag the brand.' if rng.random() < 0.6 else None,
+            'status': status,
+            'proposalCount': proposals,
+            'createdAt': created,
+            'updatedAt': created,
+            '_seed': rng.random(),
+        }
+
+    def proposals(self, j, campaign=None, prose=True):
+        """Campaign ``j``'s proposals; ``prose=False`` skips the text columns (enough for payments)."""
+        campaign = campaign or self.campaign(j)
+        rng = random.Random(campaign['_seed'])
+        words = random.Random(-campaign['_seed'])
+        for k in range(campaign['proposalCount']):
+            created = timestamp(rng, campaign['createdAt'])
+            row = {
+                'id': f'prp_{j:09d}_{k:03d}',
+                'campaignId': campaign['id'],
+                'creatorId': self.creator_id(skewed(rng, self.creators)),
+                'rate': round(campaign['budget'] * rng.uniform(0.05, 0.4), -2),
+                'aiScore': round(100 * rng.betavariate(4, 2), 1) if rng.random() < 0.95 else None,
+                'status': pick(rng, _PROPOSAL_STATUS),
+                'createdAt': created,
+                'updatedAt': created,
+                '_seed': rng.random(),
+            }
+            if prose:
+                row['pitch'] = f'Proposal {k} for {campaign["title"]}. ' + text(words, words.randint(15, 60))
+                row['aiFeedback'] = 'Clear pitch with relevant audience.' if row['aiScore'] is not None and words.random() < 0.5 else None
+            yield row
+
+    def payments(self, proposal):
+        """PENDING for most accepted proposals, SUCCESS (after the odd failed try) for completed ones."""
+        rng = random.Random(proposal['_seed'])
+        if proposal['status'] == 'ACCEPTED' and rng.random() < 0.6:
+            outcomes = ['PENDING']
+        elif proposal['status'] == 'COMPLETED':
+            outcomes = ['FAILED', 'SUCCESS'] if rng.random() < 0.05 else ['SUCCESS']
+        else:
+            return
+        for attempt, status in enumerate(outcomes):
+            yield {
+                'id': f'pay_{proposal["id"][4:]}_{attempt}',
+                'proposalId': proposal['id'],
+                'amount': proposal['rate'],
+                'reference': f'ref_{proposal["id"][4:]}_{attempt}',
+                'status': status,
+                'paystackRef': str(3_000_000_000 + rng.randrange(10**9)) if status != 'PENDING' else None,
+                'createdAt': timestamp(rng, proposal['createdAt']),
+            }
+
+    def tables(self):
+        """``(model, rows)`` in load order."""
+        yield 'User', self.users()
+        yield 'Creator', (self.creator(i) for i in range(self.creators))
+        yield 'Brand', (self.brand(i) for i in range(self.brands))
+        yield 'Campaign', (self.campaign(j) for j in range(self.campaigns))
+        yield 'Proposal', (p for j in range(self.campaigns) for p in self.proposals(j))
+        yield 'Payment', (pay for j in range(self.campaigns)
+                          for p in self.proposals(j, prose=False) for pay in self.payments(p))
+
+
+def _client_default(f):
+    return f.default is not None and f.default.startswith(('cuid(', 'uuid(', 'nanoid('))
+
+
+def placeholder(schema, f, row_index):
+    """A value for a required column the generators do not know about."""
+    if f.list:
+        return []
+    if f.type in schema.enums:
+        return schema.enums[f.type][0]
+    return {'String': f'{f.name}-{row_index}', 'Int': 0, 'BigInt': 0, 'Float': 0.0, 'Decimal': 0,
+            'Boolean': False, 'DateTime': EPOCH, 'Json': {}}.get(f.type, '')
+
+
+def columns(schema, model, row):
+    """Columns to load for ``model``: known values, plus required columns the database cannot default."""
+    out = []
+    for f in schema.columns(model):
+        if f.name in row:
+            out.append((f, True))
+        elif f.default is None or _client_default(f):
+            if not f.optional:
+                out.append((f, False))
+    return out
+
+
+_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _array_item(value):
+    text = str(value)
+    if text == '' or any(c in text for c in ' ,{}"\\') or text.upper() == 'NULL':
+        return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    return text
+
+
+def encode(value):
+    """One COPY text-format field."""
+    if type(value) is str:
+        return value.translate(_ESCAPES)
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=' ', timespec='milliseconds')
+    if isinstance(value, (list, tuple)):
+        text = '{' + ','.join(_array_item(v) for v in value) + '}'
+    elif isinstance(value, dict):
+        text = json.dumps(value, separators=(',', ':'))
+    elif isinstance(value, float):
+        text = repr(value) if math.isfinite(value) else '0'
+    else:
+        text = str(value)
+    return text.translate(_ESCAPES)
+
+
+def write(out, schema, generator, truncate=False):
+    """Write every table's COPY section to ``out``; returns ``{model: rows}``."""
+    tables = [(m, rows) for m, rows in generator.tables() if m in schema.models]
+    counts = {}
+    out.write('BEGIN;\n')
+    if truncate:
+        out.write('TRUNCATE ' + ', '.join(f'"{m}"' for m, _ in reversed(tables)) + ' CASCADE;\n')
+    for model, rows in tables:
+        cols, n = None, 0
+        for n, row in enumerate(rows, 1):
+            if cols is None:
+                cols = columns(schema, model, row)
+                out.write(f'COPY "{model}" (' + ', '.join(f'"{f.name}"' for f, _ in cols) + ') FROM stdin;\n')
+            out.write('\t'.join(encode(row[f.name] if known else placeholder(schema, f, n)) for f, known in cols))
+            out.write('\n')
+        if cols is not None:
+            out.write('\\.\n')
+        counts[model] = n
+    if 'proposalCount' in schema.models['Creator'].fields:
+        out.write(RECONCILE)
+    out.write('COMMIT;\nANALYZE;\n')
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Stream synthetic marketplace data as Postgres COPY input')
+    parser.add_argument('--creators', type=int, default=10_000)
+    parser.add_argument('--brands', type=int, default=None, help='default: creators / 10')
+    parser.add_argument('--campaigns', type=int, default=None, help='default: creators / 2')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--counters', action='store_true', help='target the schema emitted with --counters')
+    parser.add_argument('--truncate', action='store_true', help='empty the tables before loading')
+    parser.add_argument('--password-hash', help='User.password for every user (default: NULL)')
+    parser.add_argument('-o', '--output', default='-', help="output file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    brands = args.brands if args.brands is not None else max(1, args.creators // 10)
+    campaigns = args.campaigns if args.campaigns is not None else max(1, args.creators // 2)
+    schema = prisma.load({'counters': args.counters})
+    generator = Generator(max(1, args.creators), max(1, brands), campaigns, args.seed, args.password_hash)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', buffering=1 << 20)
+    try:
+        counts = write(out, schema, generator, truncate=args.truncate)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(', '.join(f'{n} {model}' for model, n in counts.items()), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    sys.exit(main())